@@ -0,0 +1,174 @@
+# app/audio_cache.py
+
+import hashlib
+import io
+import os
+import sys
+import threading
+from collections import OrderedDict
+from app.config import AUDIO_CACHE_DIR, AUDIO_CACHE_MAX_MB, GTTS_TLD, GTTS_SLOW
+
+# Bump when the synthesis pipeline changes in a way that should invalidate stored audio
+CACHE_VERSION = 1
+
+
+def voice_settings(language):
+    """Everything besides the text that changes the synthesized audio."""
+    return {"engine": "gtts", "lang": language.split('-')[0], "tld": GTTS_TLD, "slow": GTTS_SLOW}
+
+
+def make_key(text, language) -> str:
+    settings = voice_settings(language)
+    raw = "\x1f".join([str(CACHE_VERSION), text.strip()] + [f"{k}={settings[k]}" for k in sorted(settings)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class AudioCache:
+    """
+    Synthesized speech on disk, one MP3 per (text, language, voice settings) hash.
+    Total size is capped; the least recently played files are evicted first
+    (recency is kept in file modification times so it survives restarts).
+    """
+
+    def __init__(self, directory=AUDIO_CACHE_DIR, max_bytes=int(AUDIO_CACHE_MAX_MB * 1024 * 1024)):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._size = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+        if os.path.isdir(directory):
+            files = []
+            for name in os.listdir(directory):
+                if name.endswith(".mp3"):
+                    st = os.stat(os.path.join(directory, name))
+                    files.append((st.st_mtime_ns, name[:-4], st.st_size))
+            for _, key, size in sorted(files):
+                self._entries[key] = size
+                self._size += size
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.mp3")
+
+    def get_path(self, text, language):
+        """Path of the cached audio for text, or None. Marks the entry as recently used."""
+        key = make_key(text, language)
+        with self._lock:
+            if key not in self._entries:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+        path = self._path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            # Removed behind our back
+            with self._lock:
+                self._size -= self._entries.pop(key, 0)
+            return None
+        return path
+
+    def get(self, text, language):
+        """Cached audio bytes for text, or None."""
+        path = self.get_path(text, language)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, text, language, data: bytes) -> str:
+        key = make_key(text, language)
+        path = self._path(key)
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._size += len(data) - self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            while self._size > self.max_bytes and len(self._entries) > 1:
+                old_key, old_size = self._entries.popitem(last=False)
+                self._size -= old_size
+                self.stats["evictions"] += 1
+                try:
+                    os.remove(self._path(old_key))
+                except OSError:
+                    pass
+        return path
+
+    def clear(self):
+        with self._lock:
+            for key in self._entries:
+                try:
+                    os.remove(self._path(key))
+                except OSError:
+                    pass
+            self._entries.clear()
+            self._size = 0
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_audio_cache() -> AudioCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = AudioCache()
+        return _cache
+
+
+def synthesize(text, language) -> bytes:
+    from gtts import gTTS
+    settings = voice_settings(language)
+    buf = io.BytesIO()
+    gTTS(text=text, lang=settings["lang"], tld=settings["tld"], slow=settings["slow"]).write_to_fp(buf)
+    return buf.getvalue()
+
+
+def get_audio(text, language) -> bytes:
+    """MP3 bytes for text, synthesized with gTTS only on a cache miss."""
+    cache = get_audio_cache()
+    data = cache.get(text, language)
+    if data is None:
+        data = synthesize(text, language)
+        cache.put(text, language, data)
+    return data
+
+
+def warm_up(languages=None) -> int:
+    """
+    Pre-render every fixed interviewer phrase from the translation catalogs.
+    English is spoken by the local pyttsx3 engine, so only the gTTS languages are rendered.
+    """
+    from app.translation_catalog import load_catalog
+    from app.utils import LANGUAGE_CODES
+    cache = get_audio_cache()
+    rendered = 0
+    for language in languages or [l for l in LANGUAGE_CODES if l != "english"]:
+        tts_lang = LANGUAGE_CODES.get(language.lower(), ('en', 'en-US'))[0]
+        phrases = load_catalog(language)["phrases"].values()
+        if not phrases:
+            print(f"No translation catalog for {language}; run python -m app.translation_catalog build {language}")
+            continue
+        for phrase in phrases:
+            if phrase.strip() and not cache.get_path(phrase, tts_lang):
+                try:
+                    cache.put(phrase, tts_lang, synthesize(phrase, tts_lang))
+                    rendered += 1
+                except Exception as e:
+                    print(f"⚠️ Could not render {phrase!r} ({language}): {e}")
+    return rendered
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "warm":
+        print("Usage: python -m app.audio_cache warm [language ...]")
+        sys.exit(1)
+    print(f"Rendered {warm_up(sys.argv[2:])} phrases into {AUDIO_CACHE_DIR}")
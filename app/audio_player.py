@@ -0,0 +1,72 @@
+# app/audio_player.py
+
+import io
+import threading
+import time
+from app.config import PLAYBACK_CHECK_INTERVAL
+
+
+class AudioPlayer:
+    """
+    Plays encoded audio (MP3 from gTTS) from memory through one long-lived pygame mixer.
+    The mixer is opened on first use and kept open between phrases. play() sleeps on a
+    condition variable for the length of the clip and is woken early by stop(), instead of
+    spinning on get_busy(). (SDL's end-of-playback event is only delivered through the
+    display event queue, which this console app never opens.)
+    """
+
+    def __init__(self, check_interval=PLAYBACK_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._mixer = None
+        self._channel = None
+        self._lock = threading.Lock()
+        self._state = threading.Condition()
+        self._stopped = False
+
+    def _get_mixer(self):
+        if self._mixer is None:
+            import pygame
+            pygame.mixer.init()
+            self._mixer = pygame.mixer
+        return self._mixer
+
+    def play(self, data: bytes):
+        """Play audio bytes and return once playback has finished (or was stopped)."""
+        with self._lock:
+            sound = self._get_mixer().Sound(file=io.BytesIO(data))
+            with self._state:
+                self._stopped = False
+                self._channel = sound.play()
+                deadline = time.monotonic() + sound.get_length()
+                while not self._stopped and self._channel.get_busy():
+                    remaining = deadline - time.monotonic()
+                    # Past the expected end only the mixer's own buffering is left to drain
+                    self._state.wait(remaining if remaining > 0 else self.check_interval)
+                self._channel = None
+
+    def stop(self):
+        """Interrupt the current phrase; a blocked play() returns immediately."""
+        with self._state:
+            self._stopped = True
+            if self._channel is not None:
+                self._channel.stop()
+            self._state.notify_all()
+
+    def close(self):
+        self.stop()
+        with self._lock:
+            if self._mixer is not None:
+                self._mixer.quit()
+                self._mixer = None
+
+
+_player = None
+_player_lock = threading.Lock()
+
+
+def get_audio_player() -> AudioPlayer:
+    global _player
+    with _player_lock:
+        if _player is None:
+            _player = AudioPlayer()
+        return _player
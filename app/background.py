@@ -0,0 +1,52 @@
+# app/background.py
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from app.config import BACKGROUND_WORKERS
+from app.utils import log_event
+
+# Shared pool for LLM work that a later graph node needs but the current node does not.
+# Futures are tracked here by key rather than in the interview state, which is journaled as JSON.
+_executor = ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix="interview-bg")
+_pending = {}
+_pending_lock = threading.Lock()
+
+
+def submit(key, fn, *args, **kwargs):
+    """Start fn(*args, **kwargs) on the background pool and remember it under key."""
+    future = _executor.submit(fn, *args, **kwargs)
+    with _pending_lock:
+        previous = _pending.pop(key, None)
+        _pending[key] = future
+    if previous is not None:
+        previous.cancel()
+    return future
+
+
+def is_pending(key) -> bool:
+    with _pending_lock:
+        return key in _pending
+
+
+def join(key, default=None):
+    """
+    Wait for the task submitted under key and return its result.
+    Returns default if nothing was submitted under key or the task raised.
+    """
+    with _pending_lock:
+        future = _pending.pop(key, None)
+    if future is None:
+        return default
+    try:
+        return future.result()
+    except Exception as e:
+        log_event(f"Background task {key!r} failed: {e}")
+        return default
+
+
+def discard(key):
+    """Forget a task whose result is no longer needed."""
+    with _pending_lock:
+        future = _pending.pop(key, None)
+    if future is not None:
+        future.cancel()
@@ -0,0 +1,220 @@
+# app/capture_session.py
+
+import audioop
+import collections
+import math
+import threading
+import speech_recognition as sr
+from app.config import (
+    MIC_DEVICE_INDEX, MIC_CALIBRATION_SECONDS, RECOGNITION_TIMEOUT, LISTEN_ENDPOINTING, VAD_AGGRESSIVENESS, VAD_MAX_UTTERANCE_SECONDS,
+    CHUNK_MIN_SECONDS, CHUNK_MAX_SECONDS, CHUNK_OVERLAP_SECONDS
+)
+from app.vad import VADEndpointer
+from app.recognition import PartialTranscript
+from app.utils import log_event
+
+
+class CaptureSession:
+    """
+    One microphone stream kept open for the whole interview.
+    The energy threshold is calibrated once when the session opens. Between captures a
+    monitor thread keeps reading the stream, which discards stale audio (the interviewer's
+    own voice, earlier noise) and keeps the threshold tracking the room's ambient level
+    exactly as Recognizer.listen does during its non-speech frames. Adaptation is paused
+    while the interviewer is speaking so the speakers do not raise the threshold.
+    """
+
+    def __init__(self, device_index=MIC_DEVICE_INDEX, calibration_seconds=MIC_CALIBRATION_SECONDS):
+        self.recognizer = sr.Recognizer()
+        self.recognizer.energy_threshold = 300  # Default is 300, lower is more sensitive
+        self.recognizer.dynamic_energy_threshold = True
+        self.recognizer.operation_timeout = RECOGNITION_TIMEOUT
+        self.device_index = device_index
+        self.calibration_seconds = calibration_seconds
+        self.source = None
+        self._listen_lock = threading.Lock()
+        self._state = threading.Condition()
+        self._capturing = False
+        self._reading = False
+        self._closed = False
+        self._monitor = None
+
+    def open(self):
+        if self.source is not None:
+            return self
+        source = sr.Microphone(device_index=self.device_index)
+        source.__enter__()
+        self.source = source
+        self.recognizer.adjust_for_ambient_noise(source, duration=self.calibration_seconds)
+        log_event(f"Microphone calibrated: energy threshold {self.recognizer.energy_threshold:.0f}")
+        self._closed = False
+        self._monitor = threading.Thread(target=self._monitor_loop, name="mic-monitor", daemon=True)
+        self._monitor.start()
+        return self
+
+    def _speaking(self):
+        from app.tts_worker import get_tts_worker
+        return get_tts_worker().is_busy()
+
+    def _monitor_loop(self):
+        source = self.source
+        seconds_per_buffer = source.CHUNK / source.SAMPLE_RATE
+        r = self.recognizer
+        while True:
+            with self._state:
+                while self._capturing and not self._closed:
+                    self._state.wait()
+                if self._closed:
+                    return
+                self._reading = True
+            try:
+                buffer = source.stream.read(source.CHUNK)
+            except Exception as e:
+                log_event(f"Microphone monitor stopped: {e}")
+                return
+            finally:
+                with self._state:
+                    self._reading = False
+                    self._state.notify_all()
+            if not r.dynamic_energy_threshold or self._speaking():
+                continue
+            energy = audioop.rms(buffer, source.SAMPLE_WIDTH)
+            if energy > r.energy_threshold:
+                continue
+            damping = r.dynamic_energy_adjustment_damping ** seconds_per_buffer
+            r.energy_threshold = r.energy_threshold * damping + energy * r.dynamic_energy_ratio * (1 - damping)
+
+    def _speech_buffers(self, timeout, phrase_time_limit, endpointer):
+        """
+        Yield buffers from just before speech starts (300 ms pre-roll) until the endpointer
+        ends the utterance or phrase_time_limit is reached.
+        """
+        source = self.source
+        seconds_per_buffer = source.CHUNK / source.SAMPLE_RATE
+        pre_roll = collections.deque(maxlen=max(1, int(math.ceil(0.3 / seconds_per_buffer))))
+        waited, phrase_time = 0.0, 0.0
+        while not endpointer.started:
+            buffer = source.stream.read(source.CHUNK)
+            if not buffer:
+                return
+            endpointer.feed(buffer)
+            pre_roll.append(buffer)
+            waited += seconds_per_buffer
+            if not endpointer.started and timeout and waited > timeout:
+                raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+        yield from pre_roll
+        while not endpointer.ended and not (phrase_time_limit and phrase_time > phrase_time_limit):
+            buffer = source.stream.read(source.CHUNK)
+            if not buffer:
+                return
+            endpointer.feed(buffer)
+            phrase_time += seconds_per_buffer
+            yield buffer
+
+    def _endpointer(self, aggressiveness=VAD_AGGRESSIVENESS):
+        # Start the VAD's noise floor from the calibrated ambient level
+        return VADEndpointer(self.source.SAMPLE_RATE, self.source.SAMPLE_WIDTH, aggressiveness,
+                             noise_rms=self.recognizer.energy_threshold / self.recognizer.dynamic_energy_ratio)
+
+    def _listen_vad(self, timeout, phrase_time_limit):
+        frames = list(self._speech_buffers(timeout, phrase_time_limit, self._endpointer()))
+        return sr.AudioData(b"".join(frames), self.source.SAMPLE_RATE, self.source.SAMPLE_WIDTH)
+
+    def _listen_chunked(self, timeout, phrase_time_limit, language, on_partial):
+        """
+        Capture with VAD endpointing while transcribing the answer in windows as it is spoken.
+        A window is cut at the first pause after CHUNK_MIN_SECONDS, or with CHUNK_OVERLAP_SECONDS
+        of overlap at CHUNK_MAX_SECONDS; only the last window is left to transcribe after the
+        candidate stops. Returns (audio, transcript).
+        """
+        source = self.source
+        seconds_per_buffer = source.CHUNK / source.SAMPLE_RATE
+        overlap = int(round(CHUNK_OVERLAP_SECONDS / seconds_per_buffer))
+        endpointer = self._endpointer()
+        transcript = PartialTranscript(self.recognizer, language, on_partial)
+        frames, window_start = [], 0
+        for buffer in self._speech_buffers(timeout, phrase_time_limit, endpointer):
+            frames.append(buffer)
+            window = (len(frames) - window_start) * seconds_per_buffer
+            at_pause = endpointer.silence_ms >= 200
+            if not endpointer.ended and (window >= CHUNK_MAX_SECONDS or (window >= CHUNK_MIN_SECONDS and at_pause)):
+                start = window_start if at_pause else max(0, window_start - overlap)
+                transcript.submit(self._audio(frames[start:]))
+                window_start = len(frames)
+            if transcript.stop_requested:
+                break
+        # Trailing silence only slows the last recognition down
+        trailing = int(max(0, endpointer.silence_ms - 200) / 1000 / seconds_per_buffer) if endpointer.ended else 0
+        last = frames[window_start:len(frames) - trailing]
+        if last:
+            transcript.submit(self._audio(last))
+        return self._audio(frames), transcript.finish()
+
+    def _audio(self, frames):
+        return sr.AudioData(b"".join(frames), self.source.SAMPLE_RATE, self.source.SAMPLE_WIDTH)
+
+    def listen(self, timeout=None, phrase_time_limit=None, endpointing=None, language="en-US", on_partial=None):
+        """
+        Capture one phrase from the open stream. endpointing "energy" behaves like Recognizer.listen;
+        "vad" ends the phrase adaptively after the speaker stops (app/vad.py), with phrase_time_limit
+        raised to at least VAD_MAX_UTTERANCE_SECONDS so long answers are not cut off.
+        "chunked" is "vad" plus incremental transcription and returns (audio, transcript);
+        on_partial(text) sees the growing transcript and can return True to stop listening.
+        """
+        endpointing = (endpointing or LISTEN_ENDPOINTING).lower()
+        with self._listen_lock:
+            self.open()
+            with self._state:
+                self._capturing = True
+                while self._reading:
+                    self._state.wait()
+            try:
+                if endpointing in ("vad", "chunked"):
+                    limit = max(phrase_time_limit or 0, VAD_MAX_UTTERANCE_SECONDS)
+                    if endpointing == "chunked":
+                        return self._listen_chunked(timeout, limit, language, on_partial)
+                    return self._listen_vad(timeout, limit)
+                return self.recognizer.listen(self.source, timeout=timeout, phrase_time_limit=phrase_time_limit)
+            except OSError:
+                # The device went away; reopen (and recalibrate) on the next capture
+                self.close()
+                raise
+            finally:
+                with self._state:
+                    self._capturing = False
+                    self._state.notify_all()
+
+    def close(self):
+        with self._state:
+            self._closed = True
+            self._state.notify_all()
+            while self._reading:
+                self._state.wait()
+        if self._monitor is not None and self._monitor is not threading.current_thread():
+            self._monitor.join(timeout=1)
+        self._monitor = None
+        if self.source is not None:
+            try:
+                self.source.__exit__(None, None, None)
+            finally:
+                self.source = None
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_capture_session() -> CaptureSession:
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = CaptureSession()
+        return _session
+
+
+def close_capture_session():
+    global _session
+    with _session_lock:
+        session, _session = _session, None
+    if session is not None:
+        session.close()
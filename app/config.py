@@ -6,15 +6,95 @@ from dotenv import load_dotenv
 # Load environment variables from .env (for local development)
 load_dotenv()
 
-# Required: OpenAI API Key
+# Optional: OpenAI-compatible endpoint, e.g. the local stand-in from app/mock_llm_server.py
+OPENAI_BASE_URL = os.environ.get("OPENAI_BASE_URL") or None
+
+# Required: OpenAI API Key (a placeholder is used when pointing at a local base URL)
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 if not OPENAI_API_KEY:
-    raise ValueError("OPENAI_API_KEY is not set in environment variables or .env file.")
+    if OPENAI_BASE_URL and OPENAI_BASE_URL.startswith(("http://127.0.0.1", "http://localhost")):
+        OPENAI_API_KEY = "local-stand-in"
+    else:
+        raise ValueError("OPENAI_API_KEY is not set in environment variables or .env file.")
 
 # Optional: Model and interview settings
 MODEL_NAME = os.environ.get("MODEL_NAME", "gpt-4o-mini")
 INTERVIEW_QUESTIONS_COUNT = int(os.environ.get("INTERVIEW_QUESTIONS_COUNT", 4))
 
+# LLM connection pool (shared by every call site, see app/llm_client.py)
+LLM_POOL_SIZE = int(os.environ.get("LLM_POOL_SIZE", 10))
+LLM_KEEPALIVE_EXPIRY = float(os.environ.get("LLM_KEEPALIVE_EXPIRY", 120))
+LLM_TIMEOUT = float(os.environ.get("LLM_TIMEOUT", 30))
+LLM_CONNECT_TIMEOUT = float(os.environ.get("LLM_CONNECT_TIMEOUT", 5))
+
+# Resilience around LLM calls (see app/llm_resilience.py)
+LLM_MAX_RETRIES = int(os.environ.get("LLM_MAX_RETRIES", 2))
+LLM_BACKOFF_BASE = float(os.environ.get("LLM_BACKOFF_BASE", 0.5))
+LLM_BACKOFF_CAP = float(os.environ.get("LLM_BACKOFF_CAP", 8))
+LLM_DEADLINE = float(os.environ.get("LLM_DEADLINE", 45))
+LLM_HEDGE_ENABLED = os.environ.get("LLM_HEDGE_ENABLED", "True").lower() == "true"
+LLM_HEDGE_QUANTILE = float(os.environ.get("LLM_HEDGE_QUANTILE", 0.95))
+LLM_HEDGE_MIN_SAMPLES = int(os.environ.get("LLM_HEDGE_MIN_SAMPLES", 20))
+LLM_HEDGE_MIN_DELAY = float(os.environ.get("LLM_HEDGE_MIN_DELAY", 0.5))
+LLM_BREAKER_FAILURES = int(os.environ.get("LLM_BREAKER_FAILURES", 5))
+LLM_BREAKER_RESET = float(os.environ.get("LLM_BREAKER_RESET", 30))
+
+# Local name extraction confidence below which the LLM is asked instead (see app/name_extractor.py)
+NAME_CONFIDENCE_THRESHOLD = float(os.environ.get("NAME_CONFIDENCE_THRESHOLD", 0.7))
+
+# "combined": one structured LLM call per answer (score, feedback, summary, encouragement, follow-up)
+# "separate": one LLM call per task, as before
+TURN_ANALYSIS_MODE = os.environ.get("TURN_ANALYSIS_MODE", "combined").lower()
+
+# Answers to question-bank questions are scored against app/rubrics.py without an LLM call
+# when the rubric's confidence reaches this threshold (set above 1 to always use the LLM)
+RUBRIC_CONFIDENCE_THRESHOLD = float(os.environ.get("RUBRIC_CONFIDENCE_THRESHOLD", 0.75))
+
+# Reference-answer vectors (app/reference_vectors.py). An answer at or above REFERENCE_MATCH_THRESHOLD
+# similarity is evaluated without an LLM call; REFERENCE_FULL_SIMILARITY maps to a 10/10 score, and an
+# LLM score that differs from the similarity's score by REFERENCE_SCORE_TOLERANCE or more is flagged.
+REFERENCE_VECTORS_DIR = os.environ.get("REFERENCE_VECTORS_DIR", "data/reference")
+REFERENCE_MATCH_THRESHOLD = float(os.environ.get("REFERENCE_MATCH_THRESHOLD", 0.6))
+REFERENCE_FULL_SIMILARITY = float(os.environ.get("REFERENCE_FULL_SIMILARITY", 0.5))
+REFERENCE_SCORE_TOLERANCE = int(os.environ.get("REFERENCE_SCORE_TOLERANCE", 5))
+ANSWER_ARCHIVE_PATH = os.environ.get("ANSWER_ARCHIVE_PATH", "data/answers_archive.jsonl")
+
+# Worker threads for LLM work run ahead of the graph node that needs it (see app/background.py)
+BACKGROUND_WORKERS = int(os.environ.get("BACKGROUND_WORKERS", 4))
+
+# LLM call instrumentation (see app/llm_metrics.py); port 0 disables the /metrics endpoint
+LLM_METRICS_PATH = os.environ.get("LLM_METRICS_PATH", "data/metrics/llm_calls.jsonl")
+LLM_METRICS_PORT = int(os.environ.get("LLM_METRICS_PORT", 0))
+# USD per 1M (prompt, completion) tokens, used for cost estimates
+LLM_PRICES = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-3.5-turbo": (0.50, 1.50),
+}
+
+# LLM response cache (in-process LRU in front of SQLite, see app/llm_cache.py)
+LLM_CACHE_ENABLED = os.environ.get("LLM_CACHE_ENABLED", "True").lower() == "true"
+LLM_CACHE_PATH = os.environ.get("LLM_CACHE_PATH", "data/cache/llm_cache.sqlite")
+LLM_CACHE_MEMORY_ENTRIES = int(os.environ.get("LLM_CACHE_MEMORY_ENTRIES", 512))
+LLM_CACHE_DISK_ENTRIES = int(os.environ.get("LLM_CACHE_DISK_ENTRIES", 20000))
+LLM_CACHE_TTL = float(os.environ.get("LLM_CACHE_TTL", 7 * 24 * 3600))
+
+# Pre-generated question pool (see app/question_pool.py)
+QUESTION_POOL_PATH = os.environ.get("QUESTION_POOL_PATH", "data/question_pool.json")
+QUESTION_POOL_TARGET = int(os.environ.get("QUESTION_POOL_TARGET", 12))
+QUESTION_POOL_BATCH = int(os.environ.get("QUESTION_POOL_BATCH", 5))
+QUESTION_POOL_INTERVAL = float(os.environ.get("QUESTION_POOL_INTERVAL", 300))
+
+# Near-duplicate question detection (see app/question_index.py)
+QUESTION_INDEX_PATH = os.environ.get("QUESTION_INDEX_PATH", "data/question_index.json")
+QUESTION_DEDUP_THRESHOLD = float(os.environ.get("QUESTION_DEDUP_THRESHOLD", 0.6))
+QUESTION_RECENT_WINDOW = float(os.environ.get("QUESTION_RECENT_WINDOW", 7 * 24 * 3600))
+
+# Interview session journal for crash recovery (see app/session_journal.py)
+SESSION_DIR = os.environ.get("SESSION_DIR", "data/session")
+SESSION_FSYNC_INTERVAL = float(os.environ.get("SESSION_FSYNC_INTERVAL", 1.0))
+SESSION_COMPACT_EVERY = int(os.environ.get("SESSION_COMPACT_EVERY", 20))
+
 # Branding and UI customization
 LOGO_TEXT = "Coding Ninjas AI Interview"
 PRIMARY_COLOR = "CYAN"  # Options: CYAN, GREEN, YELLOW, etc.
@@ -24,6 +104,37 @@ INTRO_TEXT = "Welcome to Coding Ninjas AI Interview System!"
 VOICE_RATE = 145
 VOICE_VOLUME = 1.0
 VOICE_PITCH = 1.0
+# Queue speech and carry on (LLM calls, printing) while it plays; listening waits for it to finish
+SPEECH_ASYNC = os.environ.get("SPEECH_ASYNC", "True").lower() == "true"
+# gTTS voice options and the on-disk cache of synthesized phrases (app/audio_cache.py)
+GTTS_TLD = os.environ.get("GTTS_TLD", "com")
+GTTS_SLOW = os.environ.get("GTTS_SLOW", "False").lower() == "true"
+AUDIO_CACHE_DIR = os.environ.get("AUDIO_CACHE_DIR", "data/cache/audio")
+AUDIO_CACHE_MAX_MB = float(os.environ.get("AUDIO_CACHE_MAX_MB", 200))
+# Microphone kept open for the whole interview (app/capture_session.py); None = system default
+MIC_DEVICE_INDEX = int(os.environ["MIC_DEVICE_INDEX"]) if os.environ.get("MIC_DEVICE_INDEX") else None
+MIC_CALIBRATION_SECONDS = float(os.environ.get("MIC_CALIBRATION_SECONDS", 1.0))
+# Speech recognition engines raced on every answer (app/recognition.py); the local "sphinx" is always added.
+# The first result at RECOGNITION_MIN_CONFIDENCE wins, otherwise the best one after RECOGNITION_DEADLINE seconds.
+RECOGNITION_ENGINES = [e.strip() for e in os.environ.get("RECOGNITION_ENGINES", "google,sphinx").split(",") if e.strip()]
+RECOGNITION_MIN_CONFIDENCE = float(os.environ.get("RECOGNITION_MIN_CONFIDENCE", 0.6))
+RECOGNITION_DEADLINE = float(os.environ.get("RECOGNITION_DEADLINE", 6.0))
+# Hard limit: with no result after RECOGNITION_TIMEOUT seconds the answer counts as not understood.
+# It is also the HTTP timeout of the network engines, so a stalled connection cannot hang listen().
+RECOGNITION_TIMEOUT = float(os.environ.get("RECOGNITION_TIMEOUT", 15.0))
+# "energy": SpeechRecognition's fixed pause detection; "vad": adaptive endpointing (app/vad.py);
+# "chunked": "vad" plus transcription while the candidate is still speaking.
+# VAD_AGGRESSIVENESS 0-3: higher ignores more noise and ends answers sooner after the candidate stops.
+LISTEN_ENDPOINTING = os.environ.get("LISTEN_ENDPOINTING", "energy").lower()
+VAD_AGGRESSIVENESS = int(os.environ.get("VAD_AGGRESSIVENESS", 1))
+VAD_MAX_UTTERANCE_SECONDS = float(os.environ.get("VAD_MAX_UTTERANCE_SECONDS", 120))
+# "chunked" endpointing also transcribes while the candidate speaks: windows are cut at a pause after
+# CHUNK_MIN_SECONDS, or every CHUNK_MAX_SECONDS with CHUNK_OVERLAP_SECONDS of overlap
+CHUNK_MIN_SECONDS = float(os.environ.get("CHUNK_MIN_SECONDS", 3))
+CHUNK_MAX_SECONDS = float(os.environ.get("CHUNK_MAX_SECONDS", 8))
+CHUNK_OVERLAP_SECONDS = float(os.environ.get("CHUNK_OVERLAP_SECONDS", 0.5))
+# How often a finished-but-still-draining clip is re-checked (app/audio_player.py)
+PLAYBACK_CHECK_INTERVAL = float(os.environ.get("PLAYBACK_CHECK_INTERVAL", 0.02))
 
 # Optional: Local fallback model settings
 USE_LOCAL_MODEL = os.environ.get("USE_LOCAL_MODEL", "False").lower() == "true"
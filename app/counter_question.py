@@ -1,8 +1,5 @@
 # app/counter_question.py
-from openai import OpenAI
-from app.config import OPENAI_API_KEY, MODEL_NAME
-
-client = OpenAI(api_key=OPENAI_API_KEY)
+from app.llm_client import complete
 
 def get_counter_question(question: str, answer: str) -> str:
     """
@@ -20,13 +17,13 @@ Candidate's answer:
 Follow-up question:
 """
     try:
-        response = client.chat.completions.create(
-            model=MODEL_NAME,
+        return complete(
             messages=[{"role": "user", "content": prompt}],
             temperature=0.7,
-            max_tokens=60
+            max_tokens=60,
+            cache="get_counter_question",
+            name="get_counter_question"
         )
-        return response.choices[0].message.content.strip()
     except Exception as e:
         print(f"\u26a0\ufe0f LLM API call failed: {e}")
         return "Could not generate a follow-up question due to a technical issue."
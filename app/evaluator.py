@@ -1,15 +1,35 @@
 # app/evaluator.py
 
-from openai import OpenAI
-from app.config import OPENAI_API_KEY, MODEL_NAME
+from app.llm_client import complete
+from app.turn_analysis import feedback_from_analysis
+import re
+from app.rubrics import score_answer
+from app.reference_vectors import reference_similarity, similarity_score
+from app.config import RUBRIC_CONFIDENCE_THRESHOLD, REFERENCE_MATCH_THRESHOLD
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+def parse_score(feedback: str):
+    """Extract N from a "Score: N/10" line, or None."""
+    match = re.search(r"score\s*[:=]\s*(\d+)", (feedback or "").lower())
+    return int(match.group(1)) if match else None
 
-def evaluate_answer(question: str, answer: str) -> str:
+def evaluate_answer(question: str, answer: str, analysis: dict = None) -> str:
     """
     Sends question + user answer to GPT and gets feedback.
     Returns a concise evaluation string.
+    If a combined turn analysis is given, the question's rubric scores the answer confidently, or the
+    answer closely matches a reference answer, the feedback is returned without another LLM call.
     """
+    if analysis:
+        return feedback_from_analysis(analysis)
+    rubric = score_answer(question, answer)
+    if rubric and rubric["confidence"] >= RUBRIC_CONFIDENCE_THRESHOLD:
+        return feedback_from_analysis(rubric)
+    similarity = reference_similarity(question, answer)
+    if similarity is not None and similarity >= REFERENCE_MATCH_THRESHOLD:
+        return feedback_from_analysis({
+            "feedback": "Accurate and complete: the answer covers the expected explanation closely.",
+            "score": similarity_score(similarity),
+        })
     prompt = f"""
 You are a technical Excel interviewer.
 
@@ -27,15 +47,15 @@ Give a short feedback (2-3 lines), and a score out of 10 at the end like "Score:
 Respond in plain text only.
 """
     try:
-        response = client.chat.completions.create(
-            model=MODEL_NAME,
+        feedback = complete(
             messages=[
                 {"role": "user", "content": prompt}
             ],
             temperature=0.4,
-            max_tokens=200
+            max_tokens=200,
+            cache="evaluate_answer",
+            name="evaluate_answer"
         )
-        feedback = response.choices[0].message.content.strip()
     except Exception as e:
         print(f"\u26a0\ufe0f LLM API call failed: {e}")
         feedback = "Could not evaluate answer due to a technical issue."
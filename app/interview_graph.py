@@ -5,29 +5,57 @@ from langchain_core.runnables import RunnableLambda
 from app.nodes import intro_node, ask_question_node, followup_node, evaluate_node, summarize_node, InterviewState
 from app.config import INTERVIEW_QUESTIONS_COUNT
 
-def build_interview_graph() -> RunnableLambda:
+NODES = {
+    "intro": intro_node,
+    "ask_question": ask_question_node,
+    "followup": followup_node,
+    "evaluate_response": evaluate_node,
+    "summarize": summarize_node,
+}
+
+
+def route_after_evaluate(state) -> str:
+    return "ask_question" if state["current_question"] < len(state.get("records", ())) else "summarize"
+
+
+# Node -> next node, or a function of the state choosing it
+EDGES = {
+    "intro": "ask_question",
+    "ask_question": "followup",
+    "followup": "evaluate_response",
+    "evaluate_response": route_after_evaluate,
+    "summarize": END,
+}
+
+
+def next_node(node, state) -> str:
+    edge = EDGES[node]
+    return edge(state) if callable(edge) else edge
+
+
+def _journaled(name, fn, journal):
+    def run(state):
+        state = fn(state)
+        journal.record(name, state, next_node(name, state))
+        return state
+    return run
+
+
+def build_interview_graph(entry_point="intro", journal=None) -> RunnableLambda:
+    """
+    entry_point lets a resumed interview continue at the node its journal stopped before.
+    With a SessionJournal, every node's changes to the state are recorded as it finishes.
+    """
     sg = StateGraph(InterviewState)
 
-    sg.add_node("intro", RunnableLambda(intro_node))
-    sg.add_node("ask_question", RunnableLambda(ask_question_node))
-    sg.add_node("followup", RunnableLambda(followup_node))
-    sg.add_node("evaluate_response", RunnableLambda(evaluate_node))
-    sg.add_node("summarize", RunnableLambda(summarize_node))
-
-    sg.set_entry_point("intro")
-    sg.add_edge("intro", "ask_question")
-    sg.add_edge("ask_question", "followup")
-    sg.add_edge("followup", "evaluate_response")
-
-    sg.add_conditional_edges(
-        "evaluate_response",
-        lambda state: (
-            "ask_question"
-            if state["current_question"] < len(state.get("questions", []))
-            else "summarize"
-        ),
-    )
-
-    sg.add_edge("summarize", END)
+    for name, fn in NODES.items():
+        sg.add_node(name, RunnableLambda(_journaled(name, fn, journal) if journal else fn))
+
+    sg.set_entry_point(entry_point)
+    for name, edge in EDGES.items():
+        if callable(edge):
+            sg.add_conditional_edges(name, edge)
+        else:
+            sg.add_edge(name, edge)
 
     return sg.compile()
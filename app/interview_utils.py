@@ -2,22 +2,18 @@
 
 from datetime import datetime
 from app.utils import print_with_typing
-from openai import OpenAI
-from app.config import MODEL_NAME, OPENAI_API_KEY
+from app.llm_client import complete
 
-# Set up OpenAI client
-client = OpenAI(api_key=OPENAI_API_KEY)
-
-def conversation_invoke(prompt):
-    """Invoke the OpenAI API with a prompt and return the response."""
+def conversation_invoke(prompt, cache=None, name="conversation_invoke"):
+    """Invoke the OpenAI API with a prompt and return the response. Pass cache=<name> to use the response cache."""
     try:
-        response = client.chat.completions.create(
-            model=MODEL_NAME,
+        return complete(
             messages=[{"role": "user", "content": prompt}],
             temperature=0.7,
-            max_tokens=150
+            max_tokens=150,
+            cache=cache,
+            name=name
         )
-        return response.choices[0].message.content.strip()
     except Exception as e:
         print(f"[LLM error: {e}]")
         return ""
@@ -52,7 +48,7 @@ def get_smart_hint(question, previous_answers, difficulty_level):
     
     Respond with just the hint, no additional text.
     """
-    return conversation_invoke(hint_prompt)
+    return conversation_invoke(hint_prompt, cache="get_smart_hint", name="get_smart_hint")
 
 def evaluate_confidence(question, answer):
     """Evaluate the candidate's confidence in their answer."""
@@ -71,7 +67,7 @@ def evaluate_confidence(question, answer):
     Only return the number.
     """
     try:
-        confidence = int(conversation_invoke(confidence_prompt))
+        confidence = int(conversation_invoke(confidence_prompt, name="evaluate_confidence"))
         return confidence
     except:
         return 3  # Default to moderate confidence if evaluation fails
@@ -104,7 +100,7 @@ def get_encouragement(confidence_score, previous_encouragements=None):
     
     Respond with just the encouragement, no additional text.
     """
-    return conversation_invoke(encouragement_prompt)
+    return conversation_invoke(encouragement_prompt, name="get_encouragement")
 
 def auto_save_state(state):
     """Mark the state for auto-saving."""
@@ -0,0 +1,155 @@
+# app/llm_cache.py
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from app.config import (
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_PATH,
+    LLM_CACHE_MEMORY_ENTRIES,
+    LLM_CACHE_DISK_ENTRIES,
+    LLM_CACHE_TTL,
+)
+
+
+def normalize_messages(messages):
+    """Collapse whitespace in every message so formatting-only prompt differences share a key."""
+    return [
+        {"role": m.get("role", "user"), "content": " ".join(str(m.get("content", "")).split())}
+        for m in messages
+    ]
+
+
+def make_key(messages, model, temperature, **params) -> str:
+    """Content address of a request: hash of the normalized prompt, model, temperature and other params."""
+    payload = {
+        "messages": normalize_messages(messages),
+        "model": model,
+        "temperature": temperature,
+        "params": params,
+    }
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    Two-level response cache: an in-process LRU in front of a SQLite table on disk.
+    Both levels honour the TTL; the disk level is trimmed to max_disk_entries by last access.
+    """
+
+    def __init__(self, path=LLM_CACHE_PATH, max_memory_entries=LLM_CACHE_MEMORY_ENTRIES,
+                 max_disk_entries=LLM_CACHE_DISK_ENTRIES, ttl=LLM_CACHE_TTL):
+        self.path = path
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.ttl = ttl
+        self._memory = OrderedDict()  # key -> (created, value)
+        self._lock = threading.Lock()
+        self._db = None
+        self.stats = {}  # name -> {"memory_hits", "disk_hits", "misses"}
+
+    def _connect(self):
+        if self._db is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+            self._db.commit()
+        return self._db
+
+    def _count(self, name, field):
+        counters = self.stats.setdefault(name, {"memory_hits": 0, "disk_hits": 0, "misses": 0})
+        counters[field] += 1
+
+    def _remember(self, key, created, value):
+        self._memory[key] = (created, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key, name="default"):
+        """Return the cached value for key, or None on a miss or an expired entry."""
+        return self.get_entry(key, name)[0]
+
+    def get_entry(self, key, name="default"):
+        """Like get(), but returns (value, level) where level is "memory", "disk" or None on a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if now - entry[0] <= self.ttl:
+                    self._memory.move_to_end(key)
+                    self._count(name, "memory_hits")
+                    return entry[1], "memory"
+                del self._memory[key]
+            try:
+                db = self._connect()
+                row = db.execute("SELECT value, created FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    value, created = row
+                    if now - created <= self.ttl:
+                        db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+                        db.commit()
+                        self._remember(key, created, value)
+                        self._count(name, "disk_hits")
+                        return value, "disk"
+                    db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    db.commit()
+            except sqlite3.Error:
+                pass
+            self._count(name, "misses")
+            return None, None
+
+    def set(self, key, value):
+        """Store value under key in both levels, evicting the least recently used disk rows over the cap."""
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, value)
+            try:
+                db = self._connect()
+                db.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                    (key, value, now, now),
+                )
+                db.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl,))
+                db.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                    (self.max_disk_entries,),
+                )
+                db.commit()
+            except sqlite3.Error:
+                pass
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            try:
+                db = self._connect()
+                db.execute("DELETE FROM responses")
+                db.commit()
+            except sqlite3.Error:
+                pass
+
+
+_cache = LLMCache() if LLM_CACHE_ENABLED else None
+
+
+def get_cache():
+    """Return the process-wide cache, or None when LLM_CACHE_ENABLED is off."""
+    return _cache
+
+
+def cache_stats() -> dict:
+    """Hit/miss counters per opted-in function name."""
+    return {name: dict(counts) for name, counts in _cache.stats.items()} if _cache else {}
@@ -0,0 +1,147 @@
+# app/llm_client.py
+
+import threading
+import time
+import httpx
+from openai import OpenAI
+from app.config import (
+    OPENAI_API_KEY,
+    OPENAI_BASE_URL,
+    MODEL_NAME,
+    LLM_POOL_SIZE,
+    LLM_KEEPALIVE_EXPIRY,
+    LLM_TIMEOUT,
+    LLM_CONNECT_TIMEOUT,
+)
+from app.llm_cache import get_cache, make_key
+from app.llm_metrics import record_call, estimate_tokens
+from app.llm_resilience import call_with_resilience
+
+# One client (and therefore one httpx connection pool) is shared by every LLM call site,
+# so TLS handshakes are paid once per connection instead of once per request.
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> OpenAI:
+    """Return the shared OpenAI client, creating it and its keep-alive pool on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                http_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=LLM_POOL_SIZE,
+                        max_keepalive_connections=LLM_POOL_SIZE,
+                        keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+                    ),
+                    timeout=httpx.Timeout(LLM_TIMEOUT, connect=LLM_CONNECT_TIMEOUT),
+                )
+                # Retries are owned by app/llm_resilience.py, so the SDK's own retry loop is disabled
+                _client = OpenAI(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL, http_client=http_client,
+                                 max_retries=0)
+    return _client
+
+
+def complete(messages, temperature=0.7, max_tokens=150, model=None, cache=None, name=None, **kwargs) -> str:
+    """
+    Run a chat completion through the shared client and return the stripped message text.
+    Errors are raised to the caller, which keeps its own fallback behaviour.
+    Pass cache="<function name>" to opt the call into the response cache; hits skip the request.
+    name labels the call site in the metrics (defaults to the cache name).
+    """
+    model = model or MODEL_NAME
+    call_site = name or cache or "llm"
+    start = time.perf_counter()
+    response_cache = get_cache() if cache else None
+    cache_status = "off"
+    if response_cache is not None:
+        key = make_key(messages, model, temperature, max_tokens=max_tokens, **kwargs)
+        cached, level = response_cache.get_entry(key, name=cache)
+        if cached is not None:
+            record_call(call_site, model, time.perf_counter() - start, cache=level)
+            return cached
+        cache_status = "miss"
+
+    def attempt(timeout):
+        return get_client().chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout=min(timeout, LLM_TIMEOUT),
+            **kwargs
+        )
+
+    try:
+        response, stats = call_with_resilience(attempt, call_site)
+    except Exception as e:
+        record_call(call_site, model, time.perf_counter() - start, cache=cache_status, error=e)
+        raise
+    content = (response.choices[0].message.content or "").strip()
+    usage = getattr(response, "usage", None)
+    record_call(
+        call_site, model, time.perf_counter() - start,
+        prompt_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+        completion_tokens=getattr(usage, "completion_tokens", 0) or 0,
+        retries=stats["attempts"] - 1,
+        cache=cache_status,
+        hedged=stats["hedged"],
+    )
+    if response_cache is not None and content:
+        response_cache.set(key, content)
+    return content
+
+
+def stream(messages, temperature=0.7, max_tokens=150, model=None, name=None, **kwargs):
+    """
+    Stream a chat completion through the shared client, yielding text deltas as they arrive.
+    Opening the stream is retried like complete(), but never hedged (a duplicate would speak twice).
+    Streaming responses carry no usage block, so the recorded token counts are estimates.
+    """
+    model = model or MODEL_NAME
+    call_site = name or "stream"
+    start = time.perf_counter()
+    parts = []
+    error = None
+    stats = {"attempts": 1}
+
+    def attempt(timeout):
+        return get_client().chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+            timeout=min(timeout, LLM_TIMEOUT),
+            **kwargs
+        )
+
+    try:
+        response, stats = call_with_resilience(attempt, call_site, hedge=False)
+        for chunk in response:
+            if chunk.choices and getattr(chunk.choices[0].delta, 'content', None):
+                parts.append(chunk.choices[0].delta.content)
+                yield chunk.choices[0].delta.content
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        record_call(
+            call_site, model, time.perf_counter() - start,
+            prompt_tokens=estimate_tokens(" ".join(str(m.get("content", "")) for m in messages)),
+            completion_tokens=estimate_tokens("".join(parts)),
+            retries=stats["attempts"] - 1,
+            error=error,
+            stream=True,
+            estimated=True,
+        )
+
+
+def close():
+    """Close the shared client and its connection pool (e.g. at process shutdown)."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
@@ -0,0 +1,200 @@
+# app/llm_metrics.py
+
+import json
+import os
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from app.config import LLM_METRICS_PATH, LLM_METRICS_PORT, LLM_PRICES
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, float("inf"))
+
+_lock = threading.Lock()
+_session_id = uuid.uuid4().hex[:12]
+_sessions = {}   # session id -> {call site -> aggregate}
+_totals = {}     # (call site, model, cache status) -> aggregate, for the Prometheus endpoint
+_server = None
+
+
+def _new_aggregate():
+    return {
+        "calls": 0,
+        "errors": 0,
+        "retries": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "cost_usd": 0.0,
+        "latency_sum": 0.0,
+        "latency_max": 0.0,
+        "buckets": [0] * len(LATENCY_BUCKETS),
+    }
+
+
+def _accumulate(agg, record):
+    agg["calls"] += 1
+    agg["errors"] += 1 if record["error"] else 0
+    agg["retries"] += record["retries"]
+    agg["prompt_tokens"] += record["prompt_tokens"]
+    agg["completion_tokens"] += record["completion_tokens"]
+    agg["cost_usd"] += record["cost_usd"]
+    agg["latency_sum"] += record["latency"]
+    agg["latency_max"] = max(agg["latency_max"], record["latency"])
+    for i, bound in enumerate(LATENCY_BUCKETS):
+        if record["latency"] <= bound:
+            agg["buckets"][i] += 1
+            break
+
+
+def estimate_tokens(text) -> int:
+    """Rough token count (about 4 characters per token) for responses that carry no usage block."""
+    return max(1, len(text) // 4) if text else 0
+
+
+def estimate_cost(model, prompt_tokens, completion_tokens) -> float:
+    prompt_price, completion_price = LLM_PRICES.get(model, (0.0, 0.0))
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+
+
+def start_session(session_id=None) -> str:
+    """Start attributing calls to a new interview session; returns its id."""
+    global _session_id
+    with _lock:
+        _session_id = session_id or uuid.uuid4().hex[:12]
+    return _session_id
+
+
+def record_call(call_site, model, latency, prompt_tokens=0, completion_tokens=0, retries=0,
+                cache="off", error=None, stream=False, estimated=False, hedged=False):
+    """Record one LLM call: aggregates it in memory and appends it to the JSONL log."""
+    record = {
+        "ts": time.time(),
+        "session": _session_id,
+        "call_site": call_site,
+        "model": model,
+        "latency": round(latency, 4),
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "tokens_estimated": estimated,
+        "cost_usd": estimate_cost(model, prompt_tokens, completion_tokens) if cache in ("off", "miss") else 0.0,
+        "retries": retries,
+        "hedged": hedged,
+        "cache": cache,
+        "stream": stream,
+        "error": str(error) if error else None,
+    }
+    with _lock:
+        session = _sessions.setdefault(record["session"], {})
+        _accumulate(session.setdefault(call_site, _new_aggregate()), record)
+        _accumulate(_totals.setdefault((call_site, model, cache), _new_aggregate()), record)
+        if LLM_METRICS_PATH:
+            try:
+                directory = os.path.dirname(LLM_METRICS_PATH)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(LLM_METRICS_PATH, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record) + "\n")
+            except OSError:
+                pass
+    return record
+
+
+def session_summary(session_id=None) -> dict:
+    """Per-call-site aggregates for a session (the current one by default), with mean latency."""
+    with _lock:
+        session = _sessions.get(session_id or _session_id, {})
+        summary = {}
+        for call_site, agg in session.items():
+            summary[call_site] = dict(agg, buckets=list(agg["buckets"]))
+            summary[call_site]["latency_mean"] = agg["latency_sum"] / agg["calls"] if agg["calls"] else 0.0
+    return summary
+
+
+def format_session_summary(session_id=None) -> str:
+    """Human-readable table of where the session's LLM latency went, slowest call site first."""
+    summary = session_summary(session_id)
+    lines = [f"{'call site':<28} {'calls':>5} {'total s':>8} {'mean s':>7} {'max s':>6} {'tokens':>7} {'cost $':>8}"]
+    for call_site, agg in sorted(summary.items(), key=lambda kv: -kv[1]["latency_sum"]):
+        lines.append(
+            f"{call_site:<28} {agg['calls']:>5} {agg['latency_sum']:>8.2f} {agg['latency_mean']:>7.2f} "
+            f"{agg['latency_max']:>6.2f} {agg['prompt_tokens'] + agg['completion_tokens']:>7} {agg['cost_usd']:>8.4f}"
+        )
+    return "\n".join(lines)
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def prometheus_text() -> str:
+    """All calls since process start in Prometheus text exposition format."""
+    out = [
+        "# HELP llm_calls_total LLM calls by call site, model and cache status.",
+        "# TYPE llm_calls_total counter",
+    ]
+    with _lock:
+        totals = {key: dict(agg, buckets=list(agg["buckets"])) for key, agg in _totals.items()}
+    for (site, model, cache), agg in totals.items():
+        labels = f'call_site="{_label(site)}",model="{_label(model)}",cache="{_label(cache)}"'
+        out.append(f"llm_calls_total{{{labels}}} {agg['calls']}")
+    out += ["# HELP llm_errors_total Failed LLM calls.", "# TYPE llm_errors_total counter"]
+    for (site, model, cache), agg in totals.items():
+        labels = f'call_site="{_label(site)}",model="{_label(model)}",cache="{_label(cache)}"'
+        out.append(f"llm_errors_total{{{labels}}} {agg['errors']}")
+    out += ["# HELP llm_retries_total Extra HTTP attempts made by LLM calls.", "# TYPE llm_retries_total counter"]
+    for (site, model, cache), agg in totals.items():
+        labels = f'call_site="{_label(site)}",model="{_label(model)}",cache="{_label(cache)}"'
+        out.append(f"llm_retries_total{{{labels}}} {agg['retries']}")
+    out += ["# HELP llm_tokens_total Prompt and completion tokens.", "# TYPE llm_tokens_total counter"]
+    for (site, model, cache), agg in totals.items():
+        for kind in ("prompt", "completion"):
+            labels = f'call_site="{_label(site)}",model="{_label(model)}",cache="{_label(cache)}",kind="{kind}"'
+            out.append(f"llm_tokens_total{{{labels}}} {agg[kind + '_tokens']}")
+    out += ["# HELP llm_cost_usd_total Estimated spend in US dollars.", "# TYPE llm_cost_usd_total counter"]
+    for (site, model, cache), agg in totals.items():
+        labels = f'call_site="{_label(site)}",model="{_label(model)}",cache="{_label(cache)}"'
+        out.append(f"llm_cost_usd_total{{{labels}}} {agg['cost_usd']:.6f}")
+    out += ["# HELP llm_latency_seconds Wall-clock latency of LLM calls.", "# TYPE llm_latency_seconds histogram"]
+    for (site, model, cache), agg in totals.items():
+        labels = f'call_site="{_label(site)}",model="{_label(model)}",cache="{_label(cache)}"'
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS, agg["buckets"]):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else f"{bound:g}"
+            out.append(f'llm_latency_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+        out.append(f"llm_latency_seconds_sum{{{labels}}} {agg['latency_sum']:.4f}")
+        out.append(f"llm_latency_seconds_count{{{labels}}} {agg['calls']}")
+    return "\n".join(out) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.rstrip("/") in ("/metrics", ""):
+            body = prometheus_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        elif self.path.rstrip("/") == "/session":
+            body = json.dumps(session_summary(), indent=2).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+        else:
+            body = b"Not found\n"
+            self.send_response(404)
+            self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port=LLM_METRICS_PORT):
+    """Serve /metrics (Prometheus) and /session (JSON) on localhost; no-op when port is 0."""
+    global _server
+    if not port or _server is not None:
+        return _server
+    _server = ThreadingHTTPServer(("127.0.0.1", port), _MetricsHandler)
+    threading.Thread(target=_server.serve_forever, name="llm-metrics", daemon=True).start()
+    return _server
@@ -0,0 +1,191 @@
+# app/llm_resilience.py
+
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import openai
+from app.config import (
+    LLM_MAX_RETRIES,
+    LLM_BACKOFF_BASE,
+    LLM_BACKOFF_CAP,
+    LLM_DEADLINE,
+    LLM_HEDGE_ENABLED,
+    LLM_HEDGE_QUANTILE,
+    LLM_HEDGE_MIN_SAMPLES,
+    LLM_HEDGE_MIN_DELAY,
+    LLM_BREAKER_FAILURES,
+    LLM_BREAKER_RESET,
+)
+from app.utils import log_event
+
+# Errors that say something about upstream health and are worth another attempt.
+# Bad requests, auth errors and the like fail immediately and do not trip the breaker.
+RETRYABLE_ERRORS = (
+    openai.APIConnectionError,  # includes APITimeoutError
+    openai.RateLimitError,
+    openai.InternalServerError,
+    TimeoutError,
+)
+
+
+class CircuitOpenError(Exception):
+    """Raised without calling upstream while the circuit breaker is open."""
+
+
+class DeadlineExceededError(TimeoutError):
+    """The call's overall deadline passed before any attempt succeeded."""
+
+
+class CircuitBreaker:
+    """
+    Classic closed/open/half-open breaker: after failure_threshold consecutive upstream failures
+    calls fail fast for reset_timeout seconds, then a single probe decides whether to close again.
+    """
+
+    def __init__(self, failure_threshold=LLM_BREAKER_FAILURES, reset_timeout=LLM_BREAKER_RESET):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = "half_open"
+                self._probe_in_flight = False
+            if self.state == "half_open" and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self.state != "closed":
+                log_event("LLM circuit breaker closed")
+            self.state = "closed"
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def release_probe(self):
+        """The probe ended without saying anything about upstream health; let the next call probe."""
+        with self._lock:
+            if self.state == "half_open":
+                self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self.state == "half_open" or self._failures >= self.failure_threshold:
+                if self.state != "open":
+                    log_event(f"LLM circuit breaker opened after {self._failures} failures")
+                self.state = "open"
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+
+class LatencyTracker:
+    """Recent successful latencies per call site, used to decide when to fire a hedged request."""
+
+    def __init__(self, window=200):
+        self.window = window
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def add(self, call_site, latency):
+        with self._lock:
+            self._samples.setdefault(call_site, deque(maxlen=self.window)).append(latency)
+
+    def quantile(self, call_site, q):
+        with self._lock:
+            samples = sorted(self._samples.get(call_site, ()))
+        if len(samples) < LLM_HEDGE_MIN_SAMPLES:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+breaker = CircuitBreaker()
+latencies = LatencyTracker()
+_hedge_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="llm-attempt")
+
+
+def backoff_delay(attempt) -> float:
+    """Exponential backoff with full jitter: uniform in [0, min(cap, base * 2**attempt)]."""
+    return random.uniform(0, min(LLM_BACKOFF_CAP, LLM_BACKOFF_BASE * (2 ** attempt)))
+
+
+def _attempt(fn, call_site, remaining, hedge):
+    """
+    Run fn(timeout) once, plus one hedged duplicate if the first has not answered within the
+    call site's p95 latency. Returns (result, hedged) from whichever succeeds first.
+    """
+    start = time.monotonic()
+    futures = [_hedge_pool.submit(fn, remaining)]
+    hedged = False
+    threshold = latencies.quantile(call_site, LLM_HEDGE_QUANTILE) if hedge else None
+    if threshold is not None:
+        threshold = max(threshold, LLM_HEDGE_MIN_DELAY)
+        if threshold < remaining:
+            done, _ = wait(futures, timeout=threshold)
+            if not done:
+                hedged = True
+                futures.append(_hedge_pool.submit(fn, remaining - (time.monotonic() - start)))
+    error = None
+    pending = set(futures)
+    while pending:
+        timeout = remaining - (time.monotonic() - start)
+        if timeout <= 0:
+            break
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result(), hedged
+            error = future.exception()
+    if error is not None:
+        raise error
+    raise DeadlineExceededError(f"LLM call to {call_site} exceeded its deadline")
+
+
+def call_with_resilience(fn, call_site="llm", deadline=LLM_DEADLINE, retries=LLM_MAX_RETRIES, hedge=LLM_HEDGE_ENABLED):
+    """
+    Call fn(timeout) with retries (exponential backoff, full jitter), an overall deadline, optional
+    hedging and the shared circuit breaker. fn receives the seconds left before the deadline.
+    Returns (result, stats) where stats has "attempts" and "hedged".
+    """
+    if not breaker.allow():
+        raise CircuitOpenError("LLM upstream marked unhealthy; failing fast")
+    start = time.monotonic()
+    stats = {"attempts": 0, "hedged": False}
+    attempt = 0
+    while True:
+        remaining = deadline - (time.monotonic() - start)
+        if remaining <= 0:
+            breaker.record_failure()
+            raise DeadlineExceededError(f"LLM call to {call_site} exceeded its deadline")
+        stats["attempts"] += 1
+        attempt_start = time.monotonic()
+        try:
+            result, hedged = _attempt(fn, call_site, remaining, hedge)
+        except RETRYABLE_ERRORS as e:
+            delay = backoff_delay(attempt)
+            attempt += 1
+            if attempt > retries or time.monotonic() - start + delay >= deadline:
+                breaker.record_failure()
+                raise
+            log_event(f"LLM call to {call_site} failed ({e.__class__.__name__}); retry {attempt} in {delay:.2f}s")
+            time.sleep(delay)
+            continue
+        except Exception:
+            # Not an upstream health problem (e.g. a bad request): neither closes nor reopens the breaker
+            breaker.release_probe()
+            raise
+        stats["hedged"] = stats["hedged"] or hedged
+        latencies.add(call_site, time.monotonic() - attempt_start)
+        breaker.record_success()
+        return result, stats
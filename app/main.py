@@ -2,10 +2,14 @@
 
 from app.interview_graph import build_interview_graph
 from app.utils import print_with_typing, log_event, translate_text, get_lang_code
-from app.voice_utils import speak
+from app.voice_utils import speak, wait_for_speech
+from app.capture_session import close_capture_session
+from app.recognition import format_recognition_stats
+from app.translation_catalog import load_catalogs
+from app.question_pool import start_question_pool
+from app.session_journal import get_session_journal
+from app import llm_metrics
 import os
-import pickle
-SESSION_FILE = "data/session.pkl"
 from app.config import LOGO_TEXT, PRIMARY_COLOR, INTRO_TEXT
 
 try:
@@ -13,19 +17,12 @@ try:
 except ImportError:
     Fore = Style = None
 
-def save_session(state):
-    with open(SESSION_FILE, "wb") as f:
-        pickle.dump(state, f)
-
 def load_session():
-    if os.path.exists(SESSION_FILE):
-        with open(SESSION_FILE, "rb") as f:
-            return pickle.load(f)
-    return None
+    """(state, next_node, seq) of an unfinished interview, replayed from its journal, or None."""
+    return get_session_journal().replay()
 
 def clear_session():
-    if os.path.exists(SESSION_FILE):
-        os.remove(SESSION_FILE)
+    get_session_journal().clear()
 
 def display_welcome():
     print_with_typing("""
@@ -70,7 +67,7 @@ def offer_data_deletion(final_state):
     from app.voice_utils import listen
     response = listen(timeout=10, phrase_time_limit=5).strip().lower()
     if "yes" in response or "y" in response:
-        # Delete session file
+        # Delete the session journal
         clear_session()
         # Delete report file if exists
         report_path = final_state.get("report")
@@ -82,67 +79,54 @@ def offer_data_deletion(final_state):
         print_with_typing("Your data and report are retained.", color=Fore.GREEN if Fore else None)
         speak("Your data and report are retained.")
 
-def auto_save_worker(state, interval=60):
-    """Background worker for auto-saving the interview state."""
-    import time
-    while True:
-        time.sleep(interval)
-        if state.get('needs_save'):
-            save_session(state)
-            state['needs_save'] = False
-            log_event("Auto-saved interview state")
-
 def run_interview():
-    log_event("Interview session started.")
+    session_id = llm_metrics.start_session()
+    llm_metrics.start_metrics_server()
+    log_event(f"Interview session started. (session {session_id})")
+    load_catalogs()
+    start_question_pool()
     display_welcome()
     language = 'english'
     display_privacy_notice(language)
     
     # Initialize state
-    state = {"language": language, "needs_save": False}
-    
-    # Session recovery
-    if os.path.exists(SESSION_FILE):
-        print_with_typing("A previous interview session was found. Would you like to resume? (yes/no)", color=Fore.YELLOW if Fore else None)
-        speak("A previous interview session was found. Would you like to resume? Please say yes or no.", language='en')
-        from app.voice_utils import listen
-        response = listen(timeout=10, phrase_time_limit=5, language='en-US').strip().lower()
-        if "yes" in response or "y" in response:
-            state = load_session()
-            print_with_typing("Resuming previous session...", color=Fore.GREEN if Fore else None)
-            speak("Resuming previous session.", language='en')
-        else:
-            clear_session()
+    state = {"language": language}
+    entry_point, seq = "intro", 0
     
-    # Start auto-save in background
-    import threading
-    auto_save_thread = threading.Thread(target=auto_save_worker, args=(state,), daemon=True)
-    auto_save_thread.start()
-    if os.path.exists(SESSION_FILE):
+    # Session recovery: replay the journal of an interrupted interview
+    previous = load_session()
+    if previous:
         print_with_typing("A previous interview session was found. Would you like to resume? (yes/no)", color=Fore.YELLOW if Fore else None)
         speak("A previous interview session was found. Would you like to resume? Please say yes or no.", language='en')
         from app.voice_utils import listen
         response = listen(timeout=10, phrase_time_limit=5, language='en-US').strip().lower()
         if "yes" in response or "y" in response:
-            state = load_session()
+            state, entry_point, seq = previous
+            state["language"] = language
             print_with_typing("Resuming previous session...", color=Fore.GREEN if Fore else None)
             speak("Resuming previous session.", language='en')
+            log_event(f"Resuming interview at node '{entry_point}'")
         else:
             clear_session()
-    interview_graph = build_interview_graph()
-    # Start the graph with the loaded or empty state
-    if state is None:
-        state = {"language": language}
     else:
-        state["language"] = language
+        clear_session()
+    
+    # Every node's changes are journaled as it finishes
+    journal = get_session_journal()
+    journal.start(state, entry_point, seq)
+    interview_graph = build_interview_graph(entry_point, journal)
     final_state = interview_graph.invoke(state)
-    save_session(final_state)
     clear_session()
     if final_state.get("complete"):
         print_with_typing("\u2705 Interview complete. Report successfully generated.", color=Fore.GREEN if Fore else None)
         if final_state.get("report"):
             print_with_typing(f"\U0001F4C4 Report saved at: {final_state['report']}", color=Fore.CYAN if Fore else None)
         log_event("Interview session completed successfully.")
+    log_event("LLM latency by call site:\n" + llm_metrics.format_session_summary())
+    log_event("Speech recognition by engine:\n" + format_recognition_stats())
+    # Let queued speech finish before the process exits
+    wait_for_speech()
+    close_capture_session()
 
 if __name__ == "__main__":
     run_interview()
@@ -0,0 +1,305 @@
+# app/mock_llm_server.py
+"""
+Local OpenAI-compatible stand-in for /v1/chat/completions (including stream=True).
+
+Returns deterministic canned responses for the prompt shapes the app sends, after a sampled
+latency, and fails a configurable fraction of requests. Point the app at it with
+    OPENAI_BASE_URL=http://127.0.0.1:8808/v1
+Usage:
+    python -m app.mock_llm_server serve --port 8808 --latency lognormal:-1.2,0.5 --error-rate 0.02
+    python -m app.mock_llm_server bench --requests 200 --concurrency 8 --latency uniform:0.05,0.3
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class LatencyModel:
+    """Samples per-request latency in seconds from "fixed:S", "uniform:LO,HI" or "lognormal:MU,SIGMA"."""
+
+    def __init__(self, spec="fixed:0", seed=None):
+        self.spec = spec
+        kind, _, params = spec.partition(":")
+        self.kind = kind.strip().lower()
+        self.params = [float(p) for p in params.split(",") if p.strip()] if params else []
+        if self.kind not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {spec}")
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self) -> float:
+        with self._lock:
+            if self.kind == "fixed":
+                return self.params[0] if self.params else 0.0
+            if self.kind == "uniform":
+                return self._rng.uniform(self.params[0], self.params[1])
+            return self._rng.lognormvariate(self.params[0], self.params[1])
+
+
+def _seed(text) -> int:
+    return int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16)
+
+
+def _between(text, start, end):
+    match = re.search(re.escape(start) + r"\s*(.*?)\s*" + re.escape(end), text, re.DOTALL)
+    return match.group(1).strip().strip('"') if match else ""
+
+
+SAMPLE_QUESTIONS = [
+    "How would you use SUMIFS to total sales by region and month?",
+    "What is the difference between COUNT, COUNTA and COUNTBLANK?",
+    "How do you remove duplicates from a dataset?",
+    "How would you build a dashboard with slicers?",
+    "When would you use XLOOKUP instead of VLOOKUP?",
+    "How do you protect specific cells in a worksheet?",
+    "Explain how data validation drop-down lists work.",
+    "How would you combine text from several cells?",
+    "What does the IFERROR function do?",
+    "How do you use Goal Seek?",
+]
+
+
+def canned_response(messages, response_format=None) -> str:
+    """Deterministic reply for the prompt shapes used across the app's LLM call sites."""
+    prompt = "\n".join(str(m.get("content", "")) for m in messages)
+    lowered = prompt.lower()
+    rng = random.Random(_seed(prompt))
+    answer = _between(prompt, "candidate's answer:", "\n\n") or _between(prompt, "Answer:", "\n")
+    score = min(10, 2 + len(answer.split()) // 6) if answer else 1
+
+    if (response_format or {}).get("type") == "json_object" or "respond with a json object" in lowered:
+        return json.dumps({
+            "score": score,
+            "feedback": "The answer covers the main idea but could use a concrete example.",
+            "summary": f"The candidate explained: {answer[:80] or 'nothing specific'}.",
+            "encouragement": "Good effort, keep going!",
+            "followup_question": "Can you give an example of when you used this in practice?",
+        })
+    if "translate the following text to" in lowered:
+        language = re.search(r"translate the following text to (\w+)", lowered).group(1)
+        return f"[{language}] " + prompt.split("\n\n", 1)[-1].strip()
+    if "extract only the person's first name" in lowered:
+        sentence = _between(prompt, 'Sentence: "', '"') or _between(prompt, "from: '", "'")
+        words = re.findall(r"[A-Za-z]+", sentence)
+        return words[-1].title() if words else "Candidate"
+    if "classify them as either 'experienced'" in lowered:
+        return "experienced" if re.search(r"work|intern|years|company|job", lowered) else "fresher"
+    if re.search(r"generate \d+ unique", lowered):
+        n = int(re.search(r"generate (\d+) unique", lowered).group(1))
+        picks = rng.sample(SAMPLE_QUESTIONS, min(n, len(SAMPLE_QUESTIONS)))
+        return "\n".join(f"{i}. {q}" for i, q in enumerate(picks, 1))
+    if "summary:" in lowered and "encouragement:" in lowered:
+        return f"SUMMARY: The candidate said {answer[:60] or 'very little'}.\nENCOURAGEMENT: Nice work, thanks for explaining!"
+    if "score out of 10" in lowered or "evaluate this answer" in lowered:
+        return f"The answer is on the right track; adding an example would make it clearer.\nScore: {score}/10"
+    if "strengths" in lowered:
+        return "Strengths:\n- Clear explanations\n- Good grasp of basics\nAreas for improvement:\n- Use more examples\n- Cover edge cases"
+    if "scale of 1-5" in lowered:
+        return str(rng.randint(2, 5))
+    if "hint" in lowered:
+        return "Think about which function searches a range and returns a matching value."
+    if "follow-up" in lowered or "follow up" in lowered:
+        return "Could you walk me through a specific example of that?"
+    if "encouragement" in lowered:
+        return "You're doing great, keep it up!"
+    return "Thanks for your question. This is a canned response from the local stand-in server."
+
+
+def _usage(messages, content):
+    prompt_tokens = max(1, sum(len(str(m.get("content", ""))) for m in messages) // 4)
+    completion_tokens = max(1, len(content) // 4)
+    return {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens}
+
+
+class MockLLMServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency=None, error_rate=0.0, token_delay=0.0, seed=None):
+        super().__init__(address, _Handler)
+        self.latency = latency or LatencyModel()
+        self.error_rate = error_rate
+        self.token_delay = token_delay
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self.requests = 0
+
+    def injected_failure(self):
+        """HTTP status to fail this request with, or None to answer it."""
+        with self._rng_lock:
+            self.requests += 1
+            if self._rng.random() < self.error_rate:
+                return self._rng.choice([429, 500, 503])
+            return None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/models"):
+            self._send_json(200, {"object": "list", "data": [{"id": "mock", "object": "model"}]})
+        else:
+            self._send_json(404, {"error": {"message": "Not found"}})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": {"message": "Invalid JSON"}})
+            return
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "Not found"}})
+            return
+        server = self.server
+        time.sleep(server.latency.sample())
+        status = server.injected_failure()
+        if status:
+            self._send_json(status, {"error": {"message": "Injected failure", "type": "server_error"}})
+            return
+        messages = request.get("messages", [])
+        model = request.get("model", "mock")
+        content = canned_response(messages, request.get("response_format"))
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+        if request.get("stream"):
+            self._stream(completion_id, created, model, content)
+            return
+        self._send_json(200, {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": _usage(messages, content),
+        })
+
+    def _stream(self, completion_id, created, model, content):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        def event(delta, finish_reason=None):
+            chunk = {
+                "id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        event({"role": "assistant", "content": ""})
+        for token in re.findall(r"\S+\s*", content):
+            if self.server.token_delay:
+                time.sleep(self.server.token_delay)
+            event({"content": token})
+        event({}, finish_reason="stop")
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(host="127.0.0.1", port=0, latency="fixed:0", error_rate=0.0, token_delay=0.0, seed=None):
+    """Start the stand-in on a background thread; returns the server (see server.server_address)."""
+    server = MockLLMServer((host, port), LatencyModel(latency, seed), error_rate, token_delay, seed)
+    threading.Thread(target=server.serve_forever, name="mock-llm", daemon=True).start()
+    return server
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    k = max(0, min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1))
+    return ordered[k]
+
+
+def run_bench(requests=200, concurrency=8, **server_options):
+    """Drive the app's LLM gateway against an in-process stand-in and report throughput and tail latency."""
+    server = start_server(**server_options)
+    host, port = server.server_address
+    os.environ["OPENAI_BASE_URL"] = f"http://{host}:{port}/v1"
+    from concurrent.futures import ThreadPoolExecutor
+    from app.evaluator import evaluate_answer
+
+    latencies, failures = [], 0
+
+    def one(i):
+        start = time.perf_counter()
+        feedback = evaluate_answer(f"Bench question {i}?", f"Bench answer number {i} about VLOOKUP.")
+        return time.perf_counter() - start, feedback.startswith("Could not evaluate")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for latency, failed in pool.map(one, range(requests)):
+            latencies.append(latency)
+            failures += failed
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "failures": failures,
+        "throughput_rps": requests / elapsed if elapsed else 0.0,
+        "p50": _percentile(latencies, 0.50),
+        "p95": _percentile(latencies, 0.95),
+        "p99": _percentile(latencies, 0.99),
+        "max": max(latencies) if latencies else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible stand-in server")
+    parser.add_argument("command", choices=["serve", "bench"])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8808)
+    parser.add_argument("--latency", default="fixed:0", help='"fixed:S", "uniform:LO,HI" or "lognormal:MU,SIGMA"')
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--token-delay", type=float, default=0.0, help="seconds between streamed tokens")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args(argv)
+    options = dict(latency=args.latency, error_rate=args.error_rate, token_delay=args.token_delay, seed=args.seed)
+    if args.command == "serve":
+        server = MockLLMServer((args.host, args.port), LatencyModel(args.latency, args.seed),
+                               args.error_rate, args.token_delay, args.seed)
+        print(f"Mock LLM server on http://{args.host}:{args.port}/v1 (latency {args.latency}, error rate {args.error_rate})")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return 0
+    # The bench must not hit the real response cache, or repeat runs would measure cache hits
+    os.environ.setdefault("LLM_CACHE_ENABLED", "False")
+    os.environ.setdefault("LLM_METRICS_PATH", "")
+    result = run_bench(args.requests, args.concurrency, host=args.host, port=0, **options)
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+# app/name_extractor.py
+
+import re
+
+# Phrases candidates use before their name, longest first so "my name is" wins over "name is"
+NAME_PREFIXES = sorted([
+    "my name is", "my name's", "the name is", "name is", "name's", "i am", "i'm", "iam", "im",
+    "this is", "it's", "it is", "myself", "me is", "me", "call me", "they call me", "you can call me",
+    "people call me", "everyone calls me", "hi i'm", "hi i am", "hello i'm", "hello i am",
+    "hello my name is", "hi my name is", "hey i'm", "hey my name is",
+], key=len, reverse=True)
+
+# Prefixes that can only introduce a name; after the others ("i am", "this is", "it's", "me")
+# anything may follow ("i am excited", "it's nice to meet you"), so only a known name is trusted
+EXPLICIT_PREFIXES = {
+    "my name is", "my name's", "the name is", "name is", "name's", "call me", "they call me",
+    "you can call me", "people call me", "everyone calls me", "hello my name is", "hi my name is",
+    "hey my name is",
+}
+
+# Words that end a name or show the "name" is actually part of a phrase
+NON_NAME_WORDS = {
+    "a", "an", "the", "and", "from", "in", "at", "of", "for", "with", "to", "i", "am", "is", "are",
+    "my", "name", "this", "that", "it", "call", "me", "myself", "here", "speaking", "currently",
+    "working", "student", "fresher", "engineer", "analyst", "developer", "good", "fine", "okay", "ok",
+    "yes", "no", "hello", "hi", "hey", "sir", "madam", "mam", "ma'am", "um", "uh", "so", "well",
+    "just", "really", "very", "also", "here's", "excel", "interview", "ready",
+}
+
+# Small bundled lexicon of common given names (lower case)
+GIVEN_NAMES = frozenset("""
+aarav aarti abhishek aditi aditya ajay akash akshay alok aman amit amrita ananya anil anita anjali ankit
+anupam anushka arjun arnav arun aryan ashish ayesha bhavna deepak deepika dev devika dhruv divya farhan
+gaurav geeta harsh harshita isha ishaan jaya karan kavita kiran krishna kunal lakshmi manish meera mohan
+monomoy neha nikhil nisha pallavi pooja pradeep pranav prateek priya priyanka rahul raj rajesh rakesh
+ravi rekha ritika rohan rohit sachin sahil sakshi sameer sandeep sanjay sara shreya shruti simran sneha
+soumya sunil sunita suresh swati tanvi tanya tarun uday varun vijay vikas vikram vinay vishal yash zoya
+aisha ali fatima hassan imran mohammed nadia omar salman sana zain abdul rehan arif faisal
+adam alex alice amanda amy andrew anna anthony ben benjamin beth brian charles chris christopher daniel
+david emily emma eric ethan george grace hannah harry jack jacob james jane jason jennifer jessica john
+joseph joshua julia kate kevin laura lily linda lucas lucy maria mark mary matthew michael mike nancy
+nathan nick noah olivia oliver paul peter rachel robert ryan sam samuel sarah sophia steven thomas tom
+william carlos diego jose juan luis maria sofia lucia pablo miguel pierre marie camille louis chloe
+wei li chen yuki hiro kenji mei lin
+""".split())
+
+_WORD = re.compile(r"[A-Za-z][A-Za-z'\-]*")
+
+
+def _clean(text):
+    return " ".join(re.sub(r"[^\w\s'\-]", " ", text).split())
+
+
+def _name_words(words):
+    """Take up to two name-like words from the start of words."""
+    picked = []
+    for i, word in enumerate(words):
+        if word in NON_NAME_WORDS or not _WORD.fullmatch(word) or len(picked) == 2:
+            break
+        # Transcripts carry no reliable casing, so a second word is only kept as a surname if it is
+        # a known name or ends the name ("priya sharma" / "priya sharma and i ...")
+        if picked and not (word in GIVEN_NAMES or i + 1 == len(words) or words[i + 1] in NON_NAME_WORDS):
+            break
+        picked.append(word)
+    return picked
+
+
+def extract_name(raw_input):
+    """
+    Pull the candidate's name out of a short self-introduction without an LLM.
+    Returns (name, confidence) with confidence in [0, 1]; name is "" when nothing plausible is found.
+    Only known given names or names after an explicit "my name is" / "call me" are confident.
+    """
+    cleaned = _clean(raw_input or "")
+    if not cleaned:
+        return "", 0.0
+    words = cleaned.lower().split()
+    lowered = " ".join(words)
+
+    for prefix in NAME_PREFIXES:
+        if lowered == prefix or lowered.startswith(prefix + " "):
+            skip = len(prefix.split())
+            picked = _name_words(words[skip:])
+            if not picked:
+                return "", 0.2
+            if picked[0] in GIVEN_NAMES:
+                confidence = 0.95
+            else:
+                confidence = 0.8 if prefix in EXPLICIT_PREFIXES else 0.5
+            # Extra words after the name ("my name is priya and i ...") are normal; a long tail is not
+            if len(words) - skip - len(picked) > 8:
+                confidence -= 0.1
+            return " ".join(picked).title(), confidence
+
+    # "Priya here" / "Priya speaking"
+    if len(words) == 2 and words[1] in ("here", "speaking"):
+        picked = _name_words(words[:1])
+        if picked:
+            return picked[0].title(), 0.9 if words[0] in GIVEN_NAMES else 0.6
+
+    # Bare name: "Priya" or "Priya Sharma"
+    if len(words) <= 2:
+        picked = _name_words(words)
+        if len(picked) == len(words):
+            return " ".join(picked).title(), 0.9 if words[0] in GIVEN_NAMES else 0.6
+
+    # Otherwise look for a known given name anywhere in a short utterance
+    if len(words) <= 6:
+        for i, word in enumerate(words):
+            if word in GIVEN_NAMES:
+                return word.title(), 0.55
+    return "", 0.1
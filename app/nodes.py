@@ -1,20 +1,27 @@
 # app/nodes.py
 
-from app.llm_questions import get_interview_questions
-from app.evaluator import evaluate_answer
+from app.question_pool import take_questions
+from app.question_index import get_question_index
+from app.speech_pipeline import SpeechPipeline, speak_stream, split_sentences
+from app.evaluator import evaluate_answer, parse_score
+from app.question_records import QuestionRecords
 from app.report_generator import generate_pdf_report
-from app.config import MODEL_NAME, OPENAI_API_KEY, INTERVIEW_QUESTIONS_COUNT
+from app.config import INTERVIEW_QUESTIONS_COUNT, TURN_ANALYSIS_MODE, NAME_CONFIDENCE_THRESHOLD
+from app.name_extractor import extract_name
+from app.turn_analysis import analyze_turn
+from app.rubrics import local_turn_analysis
+from app.reference_vectors import reference_similarity, similarity_score, score_disagrees, archive_answer
+from app import background
 from app.voice_utils import speak, listen, listen_multi
+from app.phrase_intents import analyze as analyze_phrases, get_matcher
 from app.counter_question import get_counter_question
 from app.utils import print_with_typing, log_event, translate_text
-import pyttsx3
 try:
     from colorama import Fore
 except ImportError:
     Fore = None
-from openai import OpenAI
-client = OpenAI(api_key=OPENAI_API_KEY)
-from typing import TypedDict, List, Optional
+from app.llm_client import complete, stream
+from typing import TypedDict, Optional
 import random
 from app.question_bank import get_random_questions, get_question_by_difficulty, QUESTIONS
 
@@ -29,22 +36,16 @@ def get_friendly_transition():
     return random.choice(friendly_transitions)
 
 class InterviewState(TypedDict, total=False):
-    questions: List[str]
+    records: QuestionRecords  # one QuestionRecord per planned question, filled in as it is asked
     current_question: int
-    answers: List[str]
-    feedback: List[str]
     complete: bool
     report: Optional[str]
     name: str
     intro: str
     language: str
-    summaries: List[str]
-    encouragements: List[str]
-    followups: List[dict]
-    followup_summaries: List[str]
-    followup_encouragements: List[str]
     difficulty: str
     is_experienced: bool
+    turn_analysis: Optional[dict]
 
 def get_lang_code(language):
     return ('en', 'en-US')
@@ -68,20 +69,24 @@ def get_user_response(prompt_text, rec_lang='en-US'):
         return typed
 
 def llm_extract_name(raw_input):
+    # Most candidates say "my name is ..." or just their name; only ask the LLM when unsure
+    local_name, confidence = extract_name(raw_input)
+    if local_name and confidence >= NAME_CONFIDENCE_THRESHOLD:
+        log_event(f"Name extracted locally: {local_name} (confidence {confidence:.2f})")
+        return local_name
     system_msg = "You are a helpful assistant. Extract only the person's first name from the following sentence. If the name is not clear, just return the whole input."
     prompt = f"Sentence: \"{raw_input}\"\nName (one or two words only):"
     try:
         for _ in range(2):  # Try up to 2 times for best accuracy
-            response = client.chat.completions.create(
-                model=MODEL_NAME,
+            name = complete(
                 messages=[
                     {"role": "system", "content": system_msg},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.2,
-                max_tokens=10
-            )
-            name = response.choices[0].message.content.strip().split("\n")[0]
+                max_tokens=10,
+                name="llm_extract_name"
+            ).split("\n")[0]
             # Post-process to remove common prefixes
             lowered = name.lower()
             for prefix in ["my name is", "i am", "this is", "it's", "name is", "the name is", "myself", "me is", "me", "i'm", "iam", "call me", "they call me", "you can call me"]:
@@ -100,23 +105,21 @@ def llm_extract_name(raw_input):
         print_with_typing(f"[LLM error extracting name: {e}]", color=Fore.RED if Fore else None)
         return raw_input.title()
 
-def llm_summarize_and_encourage(answer):
-    from openai import OpenAI
-    from app.config import MODEL_NAME, OPENAI_API_KEY
-    client = OpenAI(api_key=OPENAI_API_KEY)
+def llm_summarize_and_encourage(answer, analysis=None):
+    if analysis:
+        return analysis["summary"], analysis["encouragement"]
     system_msg = "You are a friendly interviewer. Summarize and encourage the candidate."
     prompt = f"Here is the candidate's answer:\n---\n{answer}\n---\n1. Summarize their answer in 1-2 sentences.\n2. Give a short, positive encouragement or comment.\nRespond as: SUMMARY: ...\nENCOURAGEMENT: ..."
     try:
-        response = client.chat.completions.create(
-            model=MODEL_NAME,
+        content = complete(
             messages=[
                 {"role": "system", "content": system_msg},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.5,
-            max_tokens=120
+            max_tokens=120,
+            name="llm_summarize_and_encourage"
         )
-        content = response.choices[0].message.content.strip()
         summary = ""
         encouragement = ""
         for line in content.split("\n"):
@@ -139,31 +142,31 @@ def listen_multi_with_commands(prompt, end_phrases=None, max_segments=10, short_
     Like listen_multi, but recognizes 'repeat', 'skip', 'pause', 'resume' commands and falls back to text input if needed.
     Returns (full_response, segments, command) where command is one of None, 'repeat', 'skip', 'pause'.
     """
-    if end_phrases is None:
-        end_phrases = []
+    matcher = get_matcher(tuple(end_phrases or ()))
     segments = []
     silence_count = 0
     last_prompt = prompt
     while len(segments) < max_segments:
         part = listen(timeout=short_timeout, phrase_time_limit=phrase_time_limit).strip().lower()
         if part:
-            if part in ["repeat", "can you repeat", "say again"]:
+            intents = matcher.analyze(part).intents
+            if "repeat" in intents:
                 return "", [], "repeat"
-            if part in ["skip", "next question"]:
+            if "skip" in intents:
                 return "", [], "skip"
-            if part in ["pause", "hold on"]:
+            if "pause" in intents:
                 print_with_typing("Interview paused. Say 'resume' to continue.", color=Fore.YELLOW if Fore else None)
                 speak("Interview paused. Say resume to continue.")
                 while True:
                     resume = listen(timeout=10, phrase_time_limit=5).strip().lower()
-                    if resume == "resume":
+                    if "resume" in matcher.analyze(resume).intents:
                         print_with_typing("Resuming interview...", color=Fore.YELLOW if Fore else None)
                         speak("Resuming interview.")
                         break
                 continue
             segments.append(part)
             silence_count = 0
-            if any(phrase in part for phrase in end_phrases):
+            if "end" in intents:
                 break
         else:
             silence_count += 1
@@ -173,9 +176,10 @@ def listen_multi_with_commands(prompt, end_phrases=None, max_segments=10, short_
         # Fallback to text input
         print_with_typing("Couldn't capture voice. Please type your answer instead:", color=Fore.YELLOW if Fore else None)
         typed = input("Your Answer: ").strip()
-        if typed.lower() in ["repeat", "can you repeat", "say again"]:
+        intents = matcher.analyze(typed).intents
+        if "repeat" in intents:
             return "", [], "repeat"
-        if typed.lower() in ["skip", "next question"]:
+        if "skip" in intents:
             return "", [], "skip"
         segments = [typed]
     full_response = ' '.join(segments)
@@ -185,47 +189,54 @@ def llm_intro_followup(intro_so_far):
     system_msg = "You are a friendly interviewer."
     prompt = f"The candidate is introducing themselves for an interview. Here is what they have said so far:\n---\n{intro_so_far}\n---\nSuggest a short, conversational follow-up question to encourage them to share more about themselves. If it sounds like they are done, ask if they want to add anything else or if they're finished."
     try:
-        response = client.chat.completions.create(
-            model=MODEL_NAME,
+        followup = complete(
             messages=[
                 {"role": "system", "content": system_msg},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.7,
-            max_tokens=60
+            max_tokens=60,
+            name="llm_intro_followup"
         )
-        followup = response.choices[0].message.content.strip()
         return followup
     except Exception as e:
         print_with_typing(f"[LLM error in intro followup: {e}]", color=Fore.RED if Fore else None)
         return "Would you like to add anything else about yourself, or are you finished?"
 
-def stream_llm_response(prompt, language, tts_lang):
-    from openai import OpenAI
-    from app.config import MODEL_NAME, OPENAI_API_KEY
-    client = OpenAI(api_key=OPENAI_API_KEY)
+def stream_llm_response(prompt, language, tts_lang, system_msg=None, temperature=0.5, max_tokens=120, name="stream_llm_response"):
+    messages = [{"role": "system", "content": system_msg}] if system_msg else []
+    messages.append({"role": "user", "content": prompt})
     try:
-        response = client.chat.completions.create(
-            model=MODEL_NAME,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.5,
-            max_tokens=120,
-            stream=True
+        response = stream(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            name=name
         )
-        full_text = ""
-        for chunk in response:
-            if hasattr(chunk.choices[0].delta, 'content') and chunk.choices[0].delta.content:
-                part = chunk.choices[0].delta.content
-                print(part, end='', flush=True)
-                full_text += part
-        print()
-        # Speak the full response at the end
-        speak(translate_text(full_text, language), language=tts_lang)
-        return full_text
+        # Each sentence is translated and spoken as soon as it is complete, while generation continues
+        return speak_stream(response, language, tts_lang, speak_fn=speak)
     except Exception as e:
         print(f"[Streaming LLM error: {e}]")
         return ""
 
+def llm_generate_followup(question, answer, is_experienced=False, analysis=None):
+    if analysis:
+        return analysis["followup_question"]
+    # Use is_experienced to tailor follow-up
+    if is_experienced:
+        followup_prompt = f"You are a friendly interviewer. The candidate just answered the following question:\n\nQuestion: {question}\nAnswer: {answer}\n\nGenerate a single, natural-sounding follow-up question about their work experience, a project, or a challenge they faced using Excel in a professional context."
+    else:
+        followup_prompt = f"You are a friendly interviewer. The candidate just answered the following question:\n\nQuestion: {question}\nAnswer: {answer}\n\nGenerate a single, natural-sounding follow-up question about Excel formulas, functions, or learning experiences for a fresher."
+    try:
+        return complete(
+            messages=[{"role": "user", "content": followup_prompt}],
+            temperature=0.7,
+            max_tokens=60,
+            name="llm_generate_followup"
+        )
+    except Exception as e:
+        return "Can you tell me a bit more about that?"
+
 # Node 1: Introductory message
 def intro_node(state: InterviewState) -> InterviewState:
     language = 'english'
@@ -245,14 +256,9 @@ def intro_node(state: InterviewState) -> InterviewState:
     speak(intro_message, language=tts_lang)
     import time
     time.sleep(1.0)
-    end_phrases = [
-        "that's all for my introduction", "that's all", "that is all", "i'm done", "i am done", "no more", "nothing else",
-        "that's it from my side", "that is it from my side", "that's it", "that is it"
-    ]
     # Only prompt and listen once
     intro_parts = []
     full_response, segments, _ = listen_multi(
-        end_phrases=end_phrases,
         max_segments=10,
         short_timeout=3,
         phrase_time_limit=60,
@@ -264,7 +270,6 @@ def intro_node(state: InterviewState) -> InterviewState:
         speak("No response detected. Please try again.", language=tts_lang)
         # Retry once only if the first attempt was silent
         full_response, segments, _ = listen_multi(
-            end_phrases=end_phrases,
             max_segments=10,
             short_timeout=3,
             phrase_time_limit=60,
@@ -279,11 +284,8 @@ def intro_node(state: InterviewState) -> InterviewState:
             intro_parts.extend(segments)
     else:
         intro_parts.extend(segments)
-    # Remove any end_phrases from the final intro
-    intro_response = ' '.join(intro_parts)
-    for phrase in end_phrases:
-        intro_response = intro_response.replace(phrase, '')
-    intro_response = intro_response.strip()
+    # Remove any end phrases from the final intro
+    intro_response = analyze_phrases(' '.join(intro_parts)).text
 
     # Remove keyword-based detection, use LLM to classify experience
     def llm_detect_experience(intro_text):
@@ -294,13 +296,12 @@ Introduction: """
         prompt += f"{intro_text}\n"
         prompt += "\nClassification:"
         try:
-            response = client.chat.completions.create(
-                model=MODEL_NAME,
+            result = complete(
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.0,
-                max_tokens=2
-            )
-            result = response.choices[0].message.content.strip().lower()
+                max_tokens=2,
+                name="llm_detect_experience"
+            ).lower()
             if 'experienced' in result:
                 return True
             elif 'fresher' in result:
@@ -347,22 +348,32 @@ Introduction: """
     num_questions = INTERVIEW_QUESTIONS_COUNT
     static_count = num_questions // 2
     llm_count = num_questions - static_count
+    index = get_question_index()
+
+    def fresh(bank):
+        # Prefer bank questions not asked in recent sessions
+        return [q for q in bank if not index.recently_asked(q)] or bank
+
     if is_experienced:
         # Experienced: ask about intermediate and advanced
-        all_exp = QUESTIONS["intermediate"] + QUESTIONS["advanced"]
+        all_exp = fresh(QUESTIONS["intermediate"] + QUESTIONS["advanced"])
         static_questions = random.sample(all_exp, min(static_count, len(all_exp)))
-        llm_questions = get_interview_questions(n=llm_count, topic="Excel advanced projects")
+        llm_questions = take_questions(n=llm_count, topic="Excel advanced projects")
     else:
         # Fresher: ask about basics
-        static_questions = random.sample(QUESTIONS["basic"], min(static_count, len(QUESTIONS["basic"])))
-        llm_questions = get_interview_questions(n=llm_count, topic="Excel formulas basics")
-    all_questions = static_questions + llm_questions
+        basic = fresh(QUESTIONS["basic"])
+        static_questions = random.sample(basic, min(static_count, len(basic)))
+        llm_questions = take_questions(n=llm_count, topic="Excel formulas basics")
+    # Drop near-duplicates (bank vs generated) and questions asked in recent sessions
+    all_questions = index.select_unique(static_questions + llm_questions, limit=num_questions)
+    if len(all_questions) < num_questions:
+        topic = "Excel advanced projects" if is_experienced else "Excel formulas basics"
+        extra = take_questions(n=num_questions - len(all_questions) + 1, topic=topic)
+        all_questions = index.select_unique(all_questions + extra, limit=num_questions)
     random.shuffle(all_questions)
     return {
-        "questions": all_questions,
+        "records": QuestionRecords.from_questions(all_questions),
         "current_question": 0,
-        "answers": [],
-        "feedback": [],
         "complete": False,
         "report": None,
         "name": candidate_name,
@@ -371,33 +382,69 @@ Introduction: """
         "is_experienced": is_experienced
     }
 
+def start_per_task_calls(state):
+    """
+    Start evaluating the current answer and generating its follow-up question in the background,
+    without a turn analysis; neither depends on the other or on the follow-up exchange.
+    """
+    record = state["records"][state["current_question"]]
+    idx = state["current_question"]
+    background.submit(("evaluate", idx), evaluate_answer, record.question, record.answer)
+    background.submit(("followup", idx), llm_generate_followup, record.question, record.answer,
+                      state.get("is_experienced", False))
+
+def join_turn_analysis(state):
+    """
+    The turn analysis of the current answer, waiting for the combined call if ask_question_node
+    started it in the background. If that call failed the per-task calls are started instead.
+    """
+    key = ("analysis", state["current_question"])
+    if background.is_pending(key):
+        state["turn_analysis"] = background.join(key)
+        if not state["turn_analysis"]:
+            start_per_task_calls(state)
+    return state.get("turn_analysis")
+
+def summarize_and_encourage(record, analysis, language, tts_lang):
+    """Store the summary and encouragement of the main answer and say the encouragement."""
+    summary, encouragement = llm_summarize_and_encourage(record.answer, analysis)
+    record.summary = summary
+    record.encouragement = encouragement
+    if encouragement:
+        encouragement_translated = translate_text(encouragement, language)
+        print_with_typing(encouragement_translated, color=Fore.CYAN if Fore else None)
+        speak(encouragement_translated, language=tts_lang)
+
 # Node 2: Ask the next question
 def ask_question_node(state: InterviewState) -> InterviewState:
     language = 'english'
     tts_lang, rec_lang = get_lang_code(language)
+    records = state["records"]
+    record = records[state["current_question"]]
     question_number = state["current_question"] + 1
-    total_questions = len(state["questions"])
+    total_questions = len(records)
     # Friendly transition (except for first question)
     if question_number > 1:
         transition_msg = get_friendly_transition()
         print_with_typing(transition_msg, color=Fore.CYAN if Fore else None)
         speak(transition_msg, language=tts_lang)
     print_progress(question_number, total_questions)
-    question = state["questions"][state["current_question"]]
+    question = record.question
+    index = get_question_index()
+    index.mark_asked(question)
+    # Rewriting the index file is not needed to ask the question
+    background.submit("question_index_save", index.save)
     printed_prompt = translate_text(f"Question {question_number}: {question}", language)
     print_with_typing(printed_prompt, color=Fore.YELLOW if Fore else None)
     speak(printed_prompt, language=tts_lang)
     import time
+    record.asked_at = time.time()
     time.sleep(1.5)
 
+    state["turn_analysis"] = None
+
     # Multi-turn, conversational answer capture (truly conversational)
     answer_parts = []
-    end_phrases = ["that's all for my answer", "that's all", "that is all", "i'm done", "i am done", "no more", "nothing else", "that's it from my side", "that is it from my side", "that's it", "that is it"]
-    uncertainty_phrases = [
-        "i don't know", "dont know", "don't know", "i dont know",
-        "i don't remember", "dont remember", "don't remember", "i dont remember",
-        "i forgot", "forgot", "no idea", "not sure", "sorry"
-    ]
     encouragements = [
         "Thanks for sharing that!",
         "That's helpful! Please continue if you'd like.",
@@ -410,7 +457,6 @@ def ask_question_node(state: InterviewState) -> InterviewState:
     # --- ASK QUESTION NODE ---
     answer_parts = []
     full_response, segments, command = listen_multi(
-        end_phrases=end_phrases,
         max_segments=10,
         short_timeout=3,
         phrase_time_limit=45,
@@ -422,7 +468,6 @@ def ask_question_node(state: InterviewState) -> InterviewState:
         speak("No response detected. Please try again.", language=tts_lang)
         # Retry once only if the first attempt was silent
         full_response, segments, command = listen_multi(
-            end_phrases=end_phrases,
             max_segments=10,
             short_timeout=3,
             phrase_time_limit=45,
@@ -432,34 +477,38 @@ def ask_question_node(state: InterviewState) -> InterviewState:
         if not segments:
             print_with_typing("No response detected. Moving to the next question.", color=Fore.YELLOW if Fore else None)
             speak("No response detected. Moving to the next question.", language=tts_lang)
-            state["answers"].append("")
+            record.answer = ""
+            record.answered_at = time.time()
             return state
         # Only process the first non-empty answer, do not listen again
         answer_parts = segments
     else:
         answer_parts = segments
     # No further listening or retry after a valid answer
-    user_input = ' '.join(answer_parts)
-    for phrase in end_phrases:
-        user_input = user_input.replace(phrase, '')
-    user_input = user_input.strip()
-    state["answers"].append(user_input)
-
-    # LLM summary and encouragement
-    summary, encouragement = llm_summarize_and_encourage(user_input)
-    state.setdefault("summaries", []).append(summary)
-    state.setdefault("encouragements", []).append(encouragement)
-    if encouragement:
-        encouragement_translated = translate_text(encouragement, language)
-        print_with_typing(encouragement_translated, color=Fore.CYAN if Fore else None)
-        speak(encouragement_translated, language=tts_lang)
-
-    # Adaptive difficulty: parse last feedback for score and adjust
-    if state.get("feedback"):
-        import re
-        last_feedback = state["feedback"][-1]
-        match = re.search(r"score\s*[:=]\s*(\d+)[/\-]?(10)?", last_feedback.lower())
-        score = int(match.group(1)) if match else 6
+    user_input = analyze_phrases(' '.join(answer_parts)).text
+    record.answer = user_input
+    record.answered_at = time.time()
+
+    # Bank questions with a rubric are scored locally when the answer is clear-cut. Otherwise one
+    # structured call covers evaluation, summary, encouragement and the follow-up question;
+    # the per-task helpers fall back to their own calls if it is disabled or fails.
+    # Nothing left in this node needs either, so both run in the background and
+    # followup_node / evaluate_node join them where their results are used.
+    state["turn_analysis"] = local_turn_analysis(question, user_input)
+    idx = state["current_question"]
+    if not state["turn_analysis"] and TURN_ANALYSIS_MODE == "combined":
+        background.submit(("analysis", idx), analyze_turn, question, user_input, state.get("is_experienced", False))
+    elif not state["turn_analysis"]:
+        start_per_task_calls(state)
+
+    # LLM summary and encouragement (with the combined analysis, once followup_node has it)
+    if not background.is_pending(("analysis", idx)):
+        summarize_and_encourage(record, state.get("turn_analysis"), language, tts_lang)
+
+    # Adaptive difficulty from the previous question's score
+    if state["current_question"] > 0:
+        previous = records[state["current_question"] - 1]
+        score = previous.score if previous.score is not None else 6
         if score >= 8:
             state["difficulty"] = "advanced"
         elif score <= 5:
@@ -470,42 +519,76 @@ def ask_question_node(state: InterviewState) -> InterviewState:
     if "difficulty" not in state:
         state["difficulty"] = "basic"
     # Remove this block to prevent question repetition:
-    # if state["current_question"] + 1 < len(state["questions"]):
+    # if state["current_question"] + 1 < len(records):
     #     next_q = get_question_by_difficulty(state["difficulty"])
-    #     state["questions"][state["current_question"] + 1] = next_q
+    #     records[state["current_question"] + 1].question = next_q
 
     return state
 
 # Node 3: Evaluate response and store feedback (do not speak yet)
 def evaluate_node(state: InterviewState) -> InterviewState:
-    answer = state["answers"][-1]
-    question = state["questions"][state["current_question"]]
-    feedback = evaluate_answer(question, answer)
+    import time
+    record = state["records"][state["current_question"]]
+    answer = record.answer or ""
+    question = record.question
+    # Usually started in the background by ask_question_node while the follow-up was running
+    feedback = background.join(("evaluate", state["current_question"]))
+    if not feedback:
+        feedback = evaluate_answer(question, answer, join_turn_analysis(state))
+    state.pop("turn_analysis", None)
     log_event(f"Evaluated answer: {answer} | Feedback: {feedback}")
-    state["feedback"].append(feedback)
+    # Cross-check the score against the reference answers (bank questions only)
+    similarity = reference_similarity(question, answer)
+    score = parse_score(feedback)
+    if score_disagrees(score, similarity):
+        log_event(f"Score {score}/10 disagrees with reference similarity {similarity:.2f} "
+                  f"({similarity_score(similarity)}/10) for: {question}")
+    archive_answer(question, answer, score, similarity)
+    record.feedback = feedback
+    record.score = None if score is None else min(10, max(0, score))
+    record.evaluated_at = time.time()
     state["current_question"] += 1
     return state
 
 # Node 4: Summarize all feedback and generate report
 def summarize_node(state: InterviewState) -> InterviewState:
     language = 'english'
+    records = state["records"]
+    # Skipped or silent answers leave fields unset; the report prints "" for them, and
+    # leaves summaries/encouragements out (and skips the strengths call) if none were written.
+    report_inputs = {name: [value or "" for value in records.column(field)] for name, field in (
+        ("questions", "question"), ("answers", "answer"), ("feedbacks", "feedback"),
+        ("summaries", "summary"), ("encouragements", "encouragement"))}
+    for name in ("summaries", "encouragements"):
+        if not any(report_inputs[name]):
+            report_inputs[name] = None
+    # The report (and its strengths/weaknesses LLM call) only needs the finished state,
+    # so build it while the summary below is being spoken and printed.
+    background.submit(
+        "report",
+        generate_pdf_report,
+        candidate_name=state["name"],
+        **report_inputs
+    )
     final_msg = translate_text("Interview complete. Generating your performance summary...", language)
     print_with_typing(final_msg, color=Fore.CYAN if Fore else None)
     log_event("Interview complete. Generating summary and report.")
     speak(final_msg, language=get_lang_code(language)[0])
 
     print_with_typing(translate_text("Interview Summary & Feedback:\n", language), color=Fore.CYAN if Fore else None)
-    for i, fb in enumerate(state["feedback"], 1):
-        print_with_typing(translate_text(f"Q{i} Feedback: {fb}\n", language), color=Fore.GREEN if Fore else None)
-
-    report_path = generate_pdf_report(
-        candidate_name=state["name"],
-        questions=state["questions"],
-        answers=state["answers"],
-        feedbacks=state["feedback"],
-        summaries=state.get("summaries"),
-        encouragements=state.get("encouragements")
-    )
+    # Feedback is read out sentence by sentence; later sentences are translated while earlier ones play
+    with SpeechPipeline(language, get_lang_code(language)[0], speak_fn=speak,
+                        color=Fore.GREEN if Fore else None, echo=True) as pipeline:
+        for i, fb in enumerate(report_inputs["feedbacks"], 1):
+            for sentence in split_sentences([f"Q{i} Feedback: {fb}\n"]):
+                pipeline.feed(sentence)
+
+    report_path = background.join("report")
+    if not report_path:
+        report_path = generate_pdf_report(
+            candidate_name=state["name"],
+            **report_inputs
+        )
 
     state["report"] = report_path
     state["complete"] = True
@@ -519,27 +602,14 @@ def summarize_node(state: InterviewState) -> InterviewState:
     speak(ask_q, language=get_lang_code(language)[0])
     from app.voice_utils import listen
     user_q = listen(timeout=3, phrase_time_limit=30, language=get_lang_code(language)[1], max_retries=0).strip()
-    if user_q and user_q.lower() not in ["no", "nope", "none", "nah"]:
+    if user_q and "negative" not in analyze_phrases(user_q).intents:
         print_with_typing(f"You asked: {user_q}", color=Fore.GREEN if Fore else None)
         # LLM call to answer the candidate's question
-        from openai import OpenAI
-        client = OpenAI(api_key=OPENAI_API_KEY)
         system_msg = "You are a helpful Coding Ninjas interview assistant."
         prompt = f"Answer the candidate's question about the interview or Coding Ninjas.\n\nQuestion: {user_q}\nAnswer:"
-        try:
-            response = client.chat.completions.create(
-                model=MODEL_NAME,
-                messages=[
-                    {"role": "system", "content": system_msg},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.2,
-                max_tokens=120
-            )
-            answer = response.choices[0].message.content.strip()
-            print_with_typing(answer, color=Fore.CYAN if Fore else None)
-            speak(answer, language=get_lang_code(language)[0])
-        except Exception as e:
+        answer = stream_llm_response(prompt, language, get_lang_code(language)[0], system_msg=system_msg, temperature=0.2,
+                                     name="candidate_question")
+        if not answer:
             print_with_typing("Sorry, I couldn't answer your question right now.", color=Fore.RED if Fore else None)
             speak("Sorry, I couldn't answer your question right now.", language=get_lang_code(language)[0])
     else:
@@ -558,45 +628,27 @@ def followup_node(state: InterviewState) -> InterviewState:
     """
     language = 'english'
     tts_lang, rec_lang = get_lang_code(language)
+    records = state["records"]
+    record = records[state["current_question"]]
     question_number = state["current_question"] + 1
-    total_questions = len(state["questions"])
+    total_questions = len(records)
     print_progress(question_number, total_questions)
-    question = state["questions"][state["current_question"]]
-    answer = state["answers"][-1] if state["answers"] else ""
+    question = record.question
+    answer = record.answer or ""
+    analysis = join_turn_analysis(state)
+    if record.summary is None and answer:
+        summarize_and_encourage(record, analysis, language, tts_lang)
     # Use LLM to generate a follow-up prompt
-    # Use is_experienced to tailor follow-up
-    is_experienced = state.get("is_experienced", False)
-    if is_experienced:
-        followup_prompt = f"You are a friendly interviewer. The candidate just answered the following question:\n\nQuestion: {question}\nAnswer: {answer}\n\nGenerate a single, natural-sounding follow-up question about their work experience, a project, or a challenge they faced using Excel in a professional context."
-    else:
-        followup_prompt = f"You are a friendly interviewer. The candidate just answered the following question:\n\nQuestion: {question}\nAnswer: {answer}\n\nGenerate a single, natural-sounding follow-up question about Excel formulas, functions, or learning experiences for a fresher."
-    from openai import OpenAI
-    from app.config import MODEL_NAME, OPENAI_API_KEY
-    client = OpenAI(api_key=OPENAI_API_KEY)
-    try:
-        response = client.chat.completions.create(
-            model=MODEL_NAME,
-            messages=[{"role": "user", "content": followup_prompt}],
-            temperature=0.7,
-            max_tokens=60
-        )
-        followup_q = response.choices[0].message.content.strip()
-    except Exception as e:
-        followup_q = "Can you tell me a bit more about that?"
+    followup_q = background.join(("followup", state["current_question"]))
+    if not followup_q:
+        followup_q = llm_generate_followup(question, answer, state.get("is_experienced", False), analysis)
     followup_q_translated = translate_text(followup_q, language)
     print_with_typing(f"Follow-up: {followup_q_translated}", color=Fore.MAGENTA if Fore else None)
     speak(followup_q_translated, language=tts_lang)
     import time
     time.sleep(1.0)
-    end_phrases = ["that's all for my answer", "that's all", "that is all", "i'm done", "i am done", "no more", "nothing else"]
-    uncertainty_phrases = [
-        "i don't know", "dont know", "don't know", "i dont know",
-        "i don't remember", "dont remember", "don't remember", "i dont remember",
-        "i forgot", "forgot", "no idea", "not sure", "sorry"
-    ]
     # --- FOLLOWUP NODE ---
     full_response, segments, command = listen_multi(
-        end_phrases=end_phrases,
         max_segments=10,
         short_timeout=3,
         phrase_time_limit=45,
@@ -608,7 +660,6 @@ def followup_node(state: InterviewState) -> InterviewState:
         speak("No response detected. Please try again.", language=tts_lang)
         # Retry once only if the first attempt was silent
         full_response, segments, command = listen_multi(
-            end_phrases=end_phrases,
             max_segments=10,
             short_timeout=3,
             phrase_time_limit=45,
@@ -618,56 +669,25 @@ def followup_node(state: InterviewState) -> InterviewState:
         if not segments:
             print_with_typing("No response detected. Moving to the next question.", color=Fore.YELLOW if Fore else None)
             speak("No response detected. Moving to the next question.", language=tts_lang)
-            state.setdefault("followups", []).append({
-                "question": question,
-                "answer": answer,
-                "followup_question": followup_q_translated,
-                "followup_answer": ""
-            })
+            record.followup_question = followup_q_translated
+            record.followup_answer = ""
+            record.followup_answered_at = time.time()
             return state
         # Only process the first non-empty answer, do not listen again
         segments_to_use = segments
     else:
         segments_to_use = segments
     # No further listening or retry after a valid answer
-    state.setdefault("followups", []).append({
-        "question": question,
-        "answer": answer,
-        "followup_question": followup_q_translated,
-        "followup_answer": ' '.join(segments_to_use)
-    })
+    followup_answer = analyze_phrases(' '.join(segments_to_use)).text
+    record.followup_question = followup_q_translated
+    record.followup_answer = followup_answer
+    record.followup_answered_at = time.time()
     # LLM summary and encouragement for follow-up
-    summary, encouragement = llm_summarize_and_encourage(' '.join(segments_to_use))
-    state.setdefault("followup_summaries", []).append(summary)
-    state.setdefault("followup_encouragements", []).append(encouragement)
+    summary, encouragement = llm_summarize_and_encourage(followup_answer)
+    record.followup_summary = summary
+    record.followup_encouragement = encouragement
     if encouragement:
         encouragement_translated = translate_text(encouragement, language)
         print_with_typing(encouragement_translated, color=Fore.CYAN if Fore else None)
         speak(encouragement_translated, language=tts_lang)
     return state
-
-def speak(text: str, language='en-US'):
-    """Speak out the given text using pyttsx3."""
-    print(f"🗣️ AI says: {text}")
-    engine = pyttsx3.init(driverName='sapi5')
-    voices = engine.getProperty('voices')
-    # Prefer Zira (female), then David (male), else first available
-    selected_voice = None
-    for v in voices:
-        if 'zira' in v.name.lower():
-            selected_voice = v.id
-            break
-    if not selected_voice:
-        for v in voices:
-            if 'david' in v.name.lower():
-                selected_voice = v.id
-                break
-    if not selected_voice and voices:
-        selected_voice = voices[0].id
-    if selected_voice:
-        engine.setProperty('voice', selected_voice)
-    engine.setProperty('rate', 145)  # slower, more natural
-    engine.setProperty('volume', 1.0)
-    engine.say(text)
-    engine.runAndWait()
-
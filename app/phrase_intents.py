@@ -0,0 +1,95 @@
+# app/phrase_intents.py
+
+import re
+from functools import lru_cache
+from typing import FrozenSet, NamedTuple
+
+# (intent, scope, phrases). "whole" phrases only count when they are the entire utterance
+# ("no" is a refusal on its own but not inside an answer); "any" phrases count anywhere.
+# Apostrophes are optional when matching, so "that's" also covers "thats".
+INTENTS = [
+    ("pause", "whole", ["pause", "hold on", "p"]),
+    ("resume", "whole", ["resume", "r"]),
+    ("repeat", "whole", ["repeat", "say again", "can you repeat", "r"]),
+    ("skip", "whole", ["skip", "next question", "s"]),
+    ("help", "whole", ["help", "h"]),
+    ("negative", "whole", ["no", "nope", "nah", "none", "no thanks", "no thank you"]),
+    ("negative", "any", ["i don't want to", "don't want to", "i don't want to share", "i don't want to answer"]),
+    ("end", "any", [
+        "that's all for my answer", "that's all for my introduction", "that's all", "that is all",
+        "i'm done", "i am done", "no more", "nothing else", "nothing more", "nothing to add",
+        "that's it from my side", "that is it from my side", "that's it", "that is it",
+    ]),
+    ("uncertain", "any", [
+        "i don't know", "don't know", "i do not know", "do not know", "i don't remember", "don't remember",
+        "do not remember", "i forgot", "forgot", "no idea", "no clue", "not sure", "not certain", "sorry",
+    ]),
+]
+
+# Intents removed from the transcript by analyze()
+STRIP_INTENTS = {"end"}
+
+
+class PhraseMatch(NamedTuple):
+    text: str                   # transcript with end-of-answer phrases removed
+    intents: FrozenSet[str]     # every intent found (whole-utterance ones only if they are the whole utterance)
+    finished: bool              # the transcript ends with an end-of-answer phrase
+
+
+def _normalize(phrase):
+    return " ".join(phrase.lower().replace("’", "'").split())
+
+
+def _pattern(phrase):
+    words = [re.escape(w).replace("'", "['’]?") for w in phrase.split()]
+    return r"\s+".join(words)
+
+
+class PhraseMatcher:
+    """
+    All intent phrases compiled into one word-bounded alternation, longest phrase first,
+    so a transcript is classified and stripped in a single scan.
+    """
+
+    def __init__(self, table):
+        self._intents = {}
+        for intent, scope, phrases in table:
+            for phrase in phrases:
+                key = _normalize(phrase).replace("'", "")
+                self._intents.setdefault(key, set()).add((intent, scope))
+        phrases = sorted({_normalize(p) for _, _, ps in table for p in ps}, key=len, reverse=True)
+        self._regex = re.compile(
+            r"(?<!\w)(?:" + "|".join(_pattern(p) for p in phrases) + r")(?!\w)", re.IGNORECASE
+        )
+
+    def analyze(self, transcript) -> PhraseMatch:
+        text = transcript or ""
+        bounds = re.match(r"^[\W_]*(.*?)[\W_]*$", text, re.DOTALL)
+        core_start, core_end = bounds.start(1), bounds.end(1)
+        intents, kept, last, finished = set(), [], 0, False
+        for m in self._regex.finditer(text):
+            key = re.sub(r"['’]", "", " ".join(m.group(0).lower().split()))
+            whole = m.start() == core_start and m.end() == core_end
+            found = {intent for intent, scope in self._intents.get(key, ()) if scope == "any" or whole}
+            intents |= found
+            finished = m.end() == core_end and "end" in found
+            if found & STRIP_INTENTS:
+                kept.append(text[last:m.start()])
+                last = m.end()
+        kept.append(text[last:])
+        cleaned = " ".join("".join(kept).split())
+        # Tidy the punctuation left around a removed phrase ("values. thats all." -> "values.")
+        cleaned = re.sub(r"\s+([.,!?;:])", r"\1", cleaned)
+        cleaned = re.sub(r"([.,!?;:])[.,!?;:]+", r"\1", cleaned).strip(" ,;:")
+        return PhraseMatch(cleaned, frozenset(intents), finished)
+
+
+@lru_cache(maxsize=16)
+def get_matcher(extra_end_phrases=()) -> PhraseMatcher:
+    """The shared matcher, optionally with extra end-of-answer phrases (pass a tuple)."""
+    table = INTENTS + ([("end", "any", list(extra_end_phrases))] if extra_end_phrases else [])
+    return PhraseMatcher(table)
+
+
+def analyze(transcript, extra_end_phrases=()) -> PhraseMatch:
+    return get_matcher(tuple(extra_end_phrases)).analyze(transcript)
@@ -7,10 +7,9 @@ QUESTIONS = {
     "basic": [
         "How do you use the VLOOKUP function in Excel?",
         "What is the difference between relative and absolute cell references?",
-        "Explain how you would use conditional formatting."
-        "how can we use data formatting in excel?"
-        "what is the difference between a formula and a function in excel?" 
-        
+        "Explain how you would use conditional formatting.",
+        "How can we use data formatting in Excel?",
+        "What is the difference between a formula and a function in Excel?"
     ],
     "intermediate": [
         "How do you create and use pivot tables?",
@@ -0,0 +1,243 @@
+# app/question_index.py
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from app.config import QUESTION_INDEX_PATH, QUESTION_DEDUP_THRESHOLD, QUESTION_RECENT_WINDOW
+from app.question_bank import QUESTIONS
+from app.utils import stem_word
+
+# Words that frame a question rather than say what it is about ("How do you use X" vs "Explain X")
+STOPWORDS = {
+    "a", "an", "the", "and", "or", "of", "in", "on", "to", "for", "with", "by", "at", "from", "into",
+    "is", "are", "was", "be", "been", "it", "its", "this", "that", "these", "those", "as", "if",
+    "how", "what", "why", "when", "where", "which", "who", "whom", "do", "does", "did", "can", "could",
+    "would", "should", "will", "you", "your", "we", "i", "me", "my", "they", "them", "their",
+    "explain", "describe", "tell", "give", "share", "discuss", "walk", "through", "about",
+    "use", "uses", "using", "used", "usage", "example", "examples", "scenario", "some", "any",
+    "excel", "microsoft", "between", "difference", "together", "please", "have", "has", "had",
+    "function", "functions", "feature", "features", "work", "works", "way", "ways",
+}
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+_PRIME = (1 << 61) - 1
+# Fixed permutation parameters so signatures are stable across runs
+_PERMS = [
+    (int.from_bytes(hashlib.blake2b(f"a{i}".encode(), digest_size=8).digest(), "big") % _PRIME | 1,
+     int.from_bytes(hashlib.blake2b(f"b{i}".encode(), digest_size=8).digest(), "big") % _PRIME)
+    for i in range(NUM_PERM)
+]
+
+
+def shingles(text) -> frozenset:
+    """Content-word stems of a question; interview questions are too short for multi-word shingles."""
+    return frozenset(stem_word(w) for w in re.findall(r"[a-z0-9]+", text.lower()) if w not in STOPWORDS)
+
+
+def _token_hash(token):
+    return int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "big")
+
+
+def minhash(tokens):
+    hashes = [_token_hash(t) for t in tokens]
+    if not hashes:
+        return None
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMS)
+
+
+def jaccard(a, b) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class QuestionIndex:
+    """
+    MinHash/LSH index over every question the interviewer knows about: the static bank plus
+    all generated questions. LSH buckets narrow a lookup to a handful of candidates, which are
+    then compared by exact Jaccard similarity on their shingles. Persists to JSON together with
+    the time each question was last asked, for cross-session "recently asked" suppression.
+    Only bank and recently asked questions block new ones (is_duplicate), so the rejection set
+    does not grow with every question ever generated.
+    """
+
+    def __init__(self, path=QUESTION_INDEX_PATH, threshold=QUESTION_DEDUP_THRESHOLD):
+        self.path = path
+        self.threshold = threshold
+        self._entries = {}  # normalized text -> {"text", "source", "asked_at", "shingles"}
+        self._buckets = [dict() for _ in range(BANDS)]
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()
+        self._load()
+        for level, questions in QUESTIONS.items():
+            for q in questions:
+                self.add(q, source=f"bank:{level}")
+
+    @staticmethod
+    def _normalize(text):
+        return " ".join(text.lower().split())
+
+    def _index(self, key, entry):
+        signature = minhash(entry["shingles"])
+        if signature is None:
+            return
+        for band in range(BANDS):
+            chunk = signature[band * ROWS:(band + 1) * ROWS]
+            self._buckets[band].setdefault(chunk, set()).add(key)
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        for item in data.get("questions", []):
+            self.add(item["text"], source=item.get("source", "generated"), asked_at=item.get("asked_at"))
+
+    def save(self):
+        with self._lock:
+            data = {"questions": [
+                {"text": e["text"], "source": e["source"], "asked_at": e["asked_at"]}
+                for e in self._entries.values()
+            ]}
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Saved from the question pool worker and the background pool
+        with self._save_lock:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+
+    def add(self, text, source="generated", asked_at=None):
+        """Index a question (no-op if the exact text is already known)."""
+        key = self._normalize(text)
+        with self._lock:
+            if key in self._entries:
+                if asked_at and not self._entries[key]["asked_at"]:
+                    self._entries[key]["asked_at"] = asked_at
+                return
+            entry = {"text": text.strip(), "source": source, "asked_at": asked_at, "shingles": shingles(text)}
+            self._entries[key] = entry
+            self._index(key, entry)
+
+    def _candidates(self, signature):
+        keys = set()
+        for band in range(BANDS):
+            keys |= self._buckets[band].get(signature[band * ROWS:(band + 1) * ROWS], set())
+        return keys
+
+    def find_similar(self, text, threshold=None, exclude_self=True):
+        """Return (indexed text, similarity) for the closest known question at or above threshold, else None."""
+        threshold = self.threshold if threshold is None else threshold
+        key = self._normalize(text)
+        grams = shingles(text)
+        signature = minhash(grams)
+        if signature is None:
+            return None
+        best = None
+        with self._lock:
+            for candidate in self._candidates(signature):
+                if exclude_self and candidate == key:
+                    continue
+                score = jaccard(grams, self._entries[candidate]["shingles"])
+                if score >= threshold and (best is None or score > best[1]):
+                    best = (self._entries[candidate]["text"], score)
+        return best
+
+    @staticmethod
+    def _blocks(entry, cutoff):
+        return entry["source"].startswith("bank:") or bool(entry["asked_at"] and entry["asked_at"] >= cutoff)
+
+    def is_duplicate(self, text, others=(), threshold=None, window=QUESTION_RECENT_WINDOW) -> bool:
+        """
+        True if text (nearly) repeats a bank question, a question asked within the last window
+        seconds, or one of others (e.g. the pooled questions).
+        """
+        threshold = self.threshold if threshold is None else threshold
+        cutoff = time.time() - window
+        key = self._normalize(text)
+        grams = shingles(text)
+        if any(self._normalize(o) == key or jaccard(grams, shingles(o)) >= threshold for o in others):
+            return True
+        signature = minhash(grams)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and self._blocks(entry, cutoff):
+                return True
+            if signature is None:
+                return False
+            for candidate in self._candidates(signature):
+                other = self._entries[candidate]
+                if candidate != key and self._blocks(other, cutoff) and jaccard(grams, other["shingles"]) >= threshold:
+                    return True
+        return False
+
+    def mark_asked(self, text, when=None):
+        """Record that text was asked now; persisted for cross-session suppression."""
+        when = when or time.time()
+        key = self._normalize(text)
+        with self._lock:
+            if key not in self._entries:
+                self.add(text)
+            self._entries[key]["asked_at"] = when
+
+    def recently_asked(self, text, window=QUESTION_RECENT_WINDOW, threshold=None) -> bool:
+        """True if text, or a near-duplicate of it, was asked within the last window seconds."""
+        threshold = self.threshold if threshold is None else threshold
+        cutoff = time.time() - window
+        key = self._normalize(text)
+        grams = shingles(text)
+        signature = minhash(grams)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry["asked_at"] and entry["asked_at"] >= cutoff:
+                return True
+            if signature is None:
+                return False
+            for candidate in self._candidates(signature):
+                other = self._entries[candidate]
+                if other["asked_at"] and other["asked_at"] >= cutoff and jaccard(grams, other["shingles"]) >= threshold:
+                    return True
+        return False
+
+    def select_unique(self, candidates, limit=None, threshold=None):
+        """
+        Pick up to limit questions from candidates, in order, skipping near-duplicates of
+        questions already picked. Recently asked questions are only used if nothing else fills limit.
+        """
+        threshold = self.threshold if threshold is None else threshold
+        limit = len(candidates) if limit is None else limit
+        chosen = []
+
+        def is_new(q):
+            grams = shingles(q)
+            return all(jaccard(grams, shingles(c)) < threshold for c in chosen)
+
+        for q in candidates:
+            if len(chosen) < limit and is_new(q) and not self.recently_asked(q, threshold=threshold):
+                chosen.append(q)
+        for q in candidates:
+            if len(chosen) < limit and q not in chosen and is_new(q):
+                chosen.append(q)
+        return chosen
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_question_index() -> QuestionIndex:
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = QuestionIndex()
+        return _index
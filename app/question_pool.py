@@ -0,0 +1,196 @@
+# app/question_pool.py
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from app.config import QUESTION_POOL_PATH, QUESTION_POOL_TARGET, QUESTION_POOL_BATCH, QUESTION_POOL_INTERVAL
+from app.llm_questions import get_interview_questions
+from app.utils import log_event
+from app.question_index import get_question_index
+
+# Topics the interview asks LLM-generated questions about
+POOL_TOPICS = ["Excel", "Excel formulas basics", "Excel advanced projects"]
+# A topic whose refill adds nothing (every question rejected as a duplicate, or the call failed)
+# is retried after 2, 4, 8 ... refill intervals, up to this many
+MAX_BACKOFF_INTERVALS = 32
+
+
+def validate_question(question) -> bool:
+    """Reject failure placeholders, fragments and runaway generations."""
+    if not isinstance(question, str):
+        return False
+    text = question.strip()
+    if not 15 <= len(text) <= 300:
+        return False
+    if "technical issue" in text.lower():
+        return False
+    return any(c.isalpha() for c in text)
+
+
+class QuestionPool:
+    """
+    Per-topic pool of pre-generated, validated questions kept filled to a target level by a
+    background worker. take() never waits on the LLM unless the pool cannot cover the request,
+    and leaves writing the pool file to the worker.
+    """
+
+    def __init__(self, path=QUESTION_POOL_PATH, target=QUESTION_POOL_TARGET,
+                 batch=QUESTION_POOL_BATCH, interval=QUESTION_POOL_INTERVAL, topics=None):
+        self.path = path
+        self.target = target
+        self.batch = batch
+        self.interval = interval
+        self.topics = list(topics or POOL_TOPICS)
+        self._pools = {topic: deque() for topic in self.topics}
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._worker = None
+        self._dirty = False
+        self._failures = {}   # topic -> consecutive refills that added nothing
+        self._retry_at = {}   # topic -> time.monotonic() before which the topic is not refilled
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            log_event(f"Could not load question pool: {e}")
+            return
+        for topic, questions in data.items():
+            self._pools.setdefault(topic, deque()).extend(q for q in questions if validate_question(q))
+
+    def _save(self):
+        with self._lock:
+            data = {topic: list(pool) for topic, pool in self._pools.items()}
+            self._dirty = False
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._save_lock:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+
+    def size(self, topic) -> int:
+        with self._lock:
+            return len(self._pools.get(topic, ()))
+
+    def add(self, topic, questions) -> int:
+        """
+        Add validated questions that do not nearly repeat a bank, pooled or recently asked
+        question; returns how many were added.
+        """
+        index = get_question_index()
+        added = 0
+        with self._lock:
+            pool = self._pools.setdefault(topic, deque())
+            pooled = [q for topic_pool in self._pools.values() for q in topic_pool]
+            for q in questions:
+                q = q.strip() if isinstance(q, str) else q
+                if validate_question(q) and not index.is_duplicate(q, others=pooled):
+                    index.add(q, source=f"generated:{topic}")
+                    pool.append(q)
+                    pooled.append(q)
+                    added += 1
+        if added:
+            index.save()
+        return added
+
+    def refill(self, topic):
+        """Top one topic up to the target level with LLM-generated questions."""
+        missing = self.target - self.size(topic)
+        if missing <= 0:
+            return 0
+        questions = get_interview_questions(n=max(missing, self.batch), topic=topic, use_cache=False)
+        added = self.add(topic, questions)
+        if added:
+            self._save()
+            log_event(f"Question pool '{topic}' refilled with {added} questions")
+        return added
+
+    def _refill_due(self, topic):
+        try:
+            added = self.refill(topic)
+        except Exception as e:
+            log_event(f"Question pool refill for '{topic}' failed: {e}")
+            added = 0
+        if added:
+            self._failures.pop(topic, None)
+            self._retry_at.pop(topic, None)
+            return
+        # Nothing new came back; calling again every interval would most likely repeat that
+        failures = self._failures.get(topic, 0) + 1
+        self._failures[topic] = failures
+        delay = self.interval * min(2 ** failures, MAX_BACKOFF_INTERVALS)
+        self._retry_at[topic] = time.monotonic() + delay
+        log_event(f"Question pool '{topic}' refill added nothing; retrying in {delay:.0f}s")
+
+    def _run(self):
+        while True:
+            if self._dirty:
+                self._save()
+            for topic in list(self._pools):
+                if self.size(topic) >= self.target or time.monotonic() < self._retry_at.get(topic, 0):
+                    continue
+                self._refill_due(topic)
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+
+    def start(self):
+        """Start the background refill worker (idempotent)."""
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(target=self._run, name="question-pool", daemon=True)
+            self._worker.start()
+
+    def take(self, n, topic="Excel"):
+        """
+        Return n questions for topic, drawing from the pool first and generating any
+        shortfall live. The pool is refilled in the background without blocking the caller.
+        """
+        with self._lock:
+            pool = self._pools.setdefault(topic, deque())
+            questions = [pool.popleft() for _ in range(min(n, len(pool)))]
+            self._dirty = self._dirty or bool(questions)
+            worker_alive = self._worker is not None and self._worker.is_alive()
+        # The worker writes the pool file and tops the topic up
+        self._wakeup.set()
+        if questions and not worker_alive:
+            threading.Thread(target=self._save, name="question-pool-save", daemon=True).start()
+        if len(questions) < n:
+            # A cached response would hand back the same questions as last time
+            live = get_interview_questions(n=n - len(questions), topic=topic, use_cache=False)
+            questions.extend([q for q in live if q not in questions][:n - len(questions)])
+        return questions
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_question_pool() -> QuestionPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = QuestionPool()
+        return _pool
+
+
+def start_question_pool():
+    """Create the shared pool and start keeping it filled."""
+    pool = get_question_pool()
+    pool.start()
+    return pool
+
+
+def take_questions(n=3, topic="Excel"):
+    """Draw n questions for topic from the shared pool, falling back to live generation."""
+    return get_question_pool().take(n, topic)
@@ -0,0 +1,163 @@
+# app/question_records.py
+
+import math
+import struct
+import sys
+from array import array
+
+TEXT_FIELDS = (
+    "question", "answer", "feedback", "summary", "encouragement",
+    "followup_question", "followup_answer", "followup_summary", "followup_encouragement",
+)
+# Unix timestamps: question spoken, answer captured, follow-up answer captured, answer evaluated
+TIME_FIELDS = ("asked_at", "answered_at", "followup_answered_at", "evaluated_at")
+
+MAGIC = b"IQR1"
+_HEADER = struct.Struct("<4sI")
+_NONE = 0xFFFFFFFF     # text length marking a missing value
+_NO_SCORE = -1
+_LENGTH_SIZE = array("I").itemsize
+
+
+class QuestionRecord:
+    """One interview question and everything recorded about it. Unset fields are None."""
+
+    __slots__ = TEXT_FIELDS + TIME_FIELDS + ("score",)
+
+    def __init__(self, question, **fields):
+        self.question = question
+        for name in self.__slots__[1:]:
+            setattr(self, name, fields.pop(name, None))
+        if fields:
+            raise TypeError(f"Unknown QuestionRecord fields: {', '.join(fields)}")
+
+    def __eq__(self, other):
+        if not isinstance(other, QuestionRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return f"QuestionRecord({self.question!r}, score={self.score!r})"
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+class QuestionRecords:
+    """
+    The questions of one interview in order, as QuestionRecords. Serializes to a compact
+    binary form (to_bytes/from_bytes): scores and timings as packed arrays, then every
+    text field as length-prefixed UTF-8, with no per-record keys.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, records=()):
+        self._items = list(records)
+
+    @classmethod
+    def from_questions(cls, questions):
+        return cls(QuestionRecord(q) for q in questions)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return QuestionRecords(self._items[index])
+        return self._items[index]
+
+    def __setitem__(self, index, value):
+        self._items[index] = list(value) if isinstance(index, slice) else value
+
+    def __delitem__(self, index):
+        del self._items[index]
+
+    def __eq__(self, other):
+        if not isinstance(other, QuestionRecords):
+            return NotImplemented
+        return self._items == other._items
+
+    def __repr__(self):
+        return f"QuestionRecords({len(self._items)} questions)"
+
+    def append(self, record: QuestionRecord):
+        self._items.append(record)
+
+    def extend(self, records):
+        self._items.extend(records)
+
+    def column(self, name) -> list:
+        """One field of every record, e.g. column("answer") for the report."""
+        return [getattr(r, name) for r in self._items]
+
+    def scores(self) -> array:
+        """Numeric scores of the evaluated questions."""
+        return array("b", (r.score for r in self._items if r.score is not None))
+
+    def to_bytes(self) -> bytes:
+        scores = array("b", (_NO_SCORE if r.score is None else r.score for r in self._items))
+        times = array("d", (math.nan if getattr(r, f) is None else getattr(r, f)
+                            for r in self._items for f in TIME_FIELDS))
+        lengths, blobs = array("I"), []
+        for r in self._items:
+            for name in TEXT_FIELDS:
+                value = getattr(r, name)
+                if value is None:
+                    lengths.append(_NONE)
+                else:
+                    encoded = str(value).encode("utf-8")
+                    lengths.append(len(encoded))
+                    blobs.append(encoded)
+        return b"".join([_HEADER.pack(MAGIC, len(self._items)), _little_endian(scores),
+                         _little_endian(times), _little_endian(lengths)] + blobs)
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        magic, count = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a QuestionRecords blob")
+        offset = _HEADER.size
+        sizes = (count, count * len(TIME_FIELDS) * 8, count * len(TEXT_FIELDS) * _LENGTH_SIZE)
+        scores = _from_little_endian("b", data[offset:offset + sizes[0]])
+        offset += sizes[0]
+        times = _from_little_endian("d", data[offset:offset + sizes[1]])
+        offset += sizes[1]
+        lengths = _from_little_endian("I", data[offset:offset + sizes[2]])
+        offset += sizes[2]
+        records = []
+        for i in range(count):
+            texts = []
+            for length in lengths[i * len(TEXT_FIELDS):(i + 1) * len(TEXT_FIELDS)]:
+                if length == _NONE:
+                    texts.append(None)
+                else:
+                    texts.append(data[offset:offset + length].decode("utf-8"))
+                    offset += length
+            record = QuestionRecord(texts[0], **dict(zip(TEXT_FIELDS[1:], texts[1:])))
+            record.score = None if scores[i] == _NO_SCORE else scores[i]
+            for j, name in enumerate(TIME_FIELDS):
+                value = times[i * len(TIME_FIELDS) + j]
+                setattr(record, name, None if math.isnan(value) else value)
+            records.append(record)
+        if offset != len(data):
+            raise ValueError("Trailing data after QuestionRecords blob")
+        return cls(records)
@@ -0,0 +1,194 @@
+# app/recognition.py
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import speech_recognition as sr
+from app.config import RECOGNITION_ENGINES, RECOGNITION_MIN_CONFIDENCE, RECOGNITION_DEADLINE, RECOGNITION_TIMEOUT
+from app.utils import log_event
+
+# Sphinx reports no usable confidence; this keeps it from beating a confident cloud result
+# while still letting it win when the network engines fail or time out.
+SPHINX_CONFIDENCE = 0.4
+
+
+def _google(recognizer, audio, language):
+    return recognizer.recognize_google(audio, language=language, with_confidence=True)
+
+
+def _sphinx(recognizer, audio, language):
+    # The bundled PocketSphinx model is US English only
+    return recognizer.recognize_sphinx(audio), SPHINX_CONFIDENCE
+
+
+ENGINES = {
+    "google": _google,
+    "sphinx": _sphinx,
+}
+LOCAL_ENGINE = "sphinx"
+
+# Room for a few chunks of one answer to be in flight at once (see PartialTranscript)
+_executor = ThreadPoolExecutor(max_workers=4 * len(ENGINES), thread_name_prefix="recognizer")
+_chunk_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="transcribe")
+_stats_lock = threading.Lock()
+_stats = {}
+
+
+def _record(engine, latency, outcome):
+    with _stats_lock:
+        s = _stats.setdefault(engine, {"calls": 0, "ok": 0, "no_speech": 0, "errors": 0, "wins": 0, "latency_sum": 0.0, "latency_max": 0.0})
+        s["calls"] += 1
+        s[outcome] += 1
+        s["latency_sum"] += latency
+        s["latency_max"] = max(s["latency_max"], latency)
+
+
+def _record_win(engine):
+    with _stats_lock:
+        _stats[engine]["wins"] += 1
+
+
+def _run(engine, recognizer, audio, language):
+    started = time.perf_counter()
+    try:
+        text, confidence = ENGINES[engine](recognizer, audio, language)
+    except sr.UnknownValueError:
+        _record(engine, time.perf_counter() - started, "no_speech")
+        raise
+    except Exception:
+        _record(engine, time.perf_counter() - started, "errors")
+        raise
+    _record(engine, time.perf_counter() - started, "ok")
+    return text, confidence
+
+
+def recognize(recognizer, audio, language="en-US", engines=None, min_confidence=RECOGNITION_MIN_CONFIDENCE,
+              deadline=RECOGNITION_DEADLINE, timeout=RECOGNITION_TIMEOUT):
+    """
+    Transcribe audio with several engines at once (the local engine is always included).
+    Returns (text, engine) for the first result at or above min_confidence, or the most
+    confident result available when the deadline passes or every engine has finished. If no
+    engine has produced a result by the deadline, the first one that does is returned, up to
+    timeout seconds after the start.
+    Raises sr.UnknownValueError if no engine understood the audio in time, or sr.RequestError
+    if every engine failed with an error.
+    """
+    engines = list(engines or RECOGNITION_ENGINES)
+    if LOCAL_ENGINE not in engines:
+        engines.append(LOCAL_ENGINE)
+    futures = {_executor.submit(_run, e, recognizer, audio, language): e for e in engines if e in ENGINES}
+    best, errors = None, []
+    pending = set(futures)
+    started = time.monotonic()
+    stop_at, give_up_at = started + deadline, started + max(deadline, timeout)
+    while pending:
+        remaining = stop_at - time.monotonic()
+        if remaining <= 0:
+            if best:
+                # Deadline passed; slower engines keep running and are still recorded in the stats
+                break
+            # Nothing usable yet: wait for whichever engine answers next, but not past the timeout
+            remaining = give_up_at - time.monotonic()
+            if remaining <= 0:
+                log_event(f"Speech recognition timed out after {timeout:.0f}s waiting for {', '.join(futures[f] for f in pending)}")
+                break
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                text, confidence = future.result()
+            except sr.UnknownValueError:
+                continue
+            except Exception as e:
+                errors.append(f"{futures[future]}: {e}")
+                continue
+            if text and (best is None or confidence > best[1]):
+                best = (text, confidence, futures[future])
+        if best and best[1] >= min_confidence:
+            break
+    if best:
+        _record_win(best[2])
+        return best[0], best[2]
+    if errors and len(errors) == len(futures):
+        raise sr.RequestError("; ".join(errors))
+    raise sr.UnknownValueError()
+
+
+def merge_overlap(text, addition, max_words=8) -> str:
+    """Append addition to text, dropping words repeated because the two audio windows overlapped."""
+    if not text:
+        return addition
+    if not addition:
+        return text
+    left, right = text.split(), addition.split()
+    for k in range(min(max_words, len(left), len(right)), 0, -1):
+        if [w.lower() for w in left[-k:]] == [w.lower() for w in right[:k]]:
+            right = right[k:]
+            break
+    return " ".join(left + right)
+
+
+class PartialTranscript:
+    """
+    Transcript of an answer that is recognized window by window while it is still being spoken.
+    Windows are recognized concurrently; text grows as soon as every earlier window is done.
+    on_partial(text) is called with each new partial transcript and may return True to ask
+    the capture to stop (e.g. an end phrase was heard).
+    """
+
+    def __init__(self, recognizer, language="en-US", on_partial=None):
+        self.recognizer = recognizer
+        self.language = language
+        self.on_partial = on_partial
+        self.text = ""
+        self.stop_requested = False
+        self._futures = []
+        self._merged = 0
+        self._lock = threading.Lock()
+
+    def submit(self, audio):
+        future = _chunk_executor.submit(recognize, self.recognizer, audio, self.language)
+        with self._lock:
+            self._futures.append(future)
+        future.add_done_callback(lambda _: self._advance())
+
+    def _advance(self):
+        with self._lock:
+            before = self.text
+            while self._merged < len(self._futures) and self._futures[self._merged].done():
+                try:
+                    chunk, _ = self._futures[self._merged].result()
+                except Exception:
+                    chunk = ""
+                self.text = merge_overlap(self.text, chunk)
+                self._merged += 1
+            text = self.text
+        if text != before and self.on_partial:
+            try:
+                if self.on_partial(text):
+                    self.stop_requested = True
+            except Exception as e:
+                log_event(f"Partial transcript callback failed: {e}")
+
+    def finish(self, timeout=None) -> str:
+        """Wait for every submitted window and return the full transcript."""
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures, timeout=timeout)
+        self._advance()
+        return self.text
+
+
+def recognition_stats() -> dict:
+    with _stats_lock:
+        return {engine: dict(s) for engine, s in _stats.items()}
+
+
+def format_recognition_stats() -> str:
+    """Per-engine latency and win rate since process start."""
+    lines = [f"{'engine':<10} {'calls':>5} {'wins':>5} {'win %':>6} {'mean s':>7} {'max s':>6} {'errors':>6}"]
+    for engine, s in sorted(recognition_stats().items()):
+        lines.append(
+            f"{engine:<10} {s['calls']:>5} {s['wins']:>5} {100 * s['wins'] / s['calls']:>6.1f} "
+            f"{s['latency_sum'] / s['calls']:>7.2f} {s['latency_max']:>6.2f} {s['errors']:>6}"
+        )
+    return "\n".join(lines)
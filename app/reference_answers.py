@@ -0,0 +1,84 @@
+# app/reference_answers.py
+
+# Model answers for each question in the bank, used by app/reference_vectors.py.
+# A few phrasings per question make the similarity robust to how candidates word things.
+REFERENCE_ANSWERS = {
+    "How do you use the VLOOKUP function in Excel?": [
+        "VLOOKUP searches for a lookup value in the first column of a table array and returns the value from the "
+        "same row in the column given by the column index number. The last argument is the range lookup: FALSE "
+        "for an exact match and TRUE for an approximate match, for example =VLOOKUP(A2, Products!A:C, 3, FALSE).",
+        "You give VLOOKUP the value you want to find, the table or range to search, which column to return and "
+        "whether you want an exact match. It only looks to the right of the first column, so for left lookups "
+        "INDEX MATCH or XLOOKUP is better.",
+    ],
+    "What is the difference between relative and absolute cell references?": [
+        "A relative reference like A1 changes when the formula is copied to another cell, because it is relative "
+        "to the formula's position. An absolute reference like $A$1 uses dollar signs to lock the row and column "
+        "so it stays fixed when copied. Mixed references such as $A1 or A$1 lock only the column or only the row.",
+        "Relative references adjust as you fill a formula down or across, absolute references do not change. You "
+        "press F4 to add the dollar signs, for example to keep pointing at a tax rate cell.",
+    ],
+    "Explain how you would use conditional formatting.": [
+        "Conditional formatting applies a format such as a fill colour or font colour to cells automatically when "
+        "they meet a rule or condition. From the Home tab I choose a rule like greater than, duplicate values or "
+        "top 10, or use a formula for custom rules, and manage them in Manage Rules.",
+        "I use it to highlight values that need attention, for example overdue dates in red or sales above target "
+        "in green, and to add data bars, colour scales and icon sets so trends are visible at a glance.",
+    ],
+    "How can we use data formatting in Excel?": [
+        "Data formatting changes how values are displayed without changing the values themselves. Number formats "
+        "show values as currency, percentages, dates or with a fixed number of decimals, and the Format Cells "
+        "dialog (Ctrl+1) also controls alignment, fonts, borders and fill.",
+        "I format data to make reports readable: bold headers, consistent date and currency formats, wrap text and "
+        "borders, cell styles or table styles, the format painter to copy formatting, and custom number formats.",
+    ],
+    "What is the difference between a formula and a function in Excel?": [
+        "A formula is any expression that starts with an equals sign and calculates a value, such as =A1+B1*2. A "
+        "function is a predefined, built-in calculation like SUM, AVERAGE or COUNT that takes arguments. "
+        "Functions are used inside formulas, for example =SUM(A1:A10)/2.",
+        "Formulas are written by the user and can combine cell references, operators and functions, while "
+        "functions are the named built-in operations Excel provides.",
+    ],
+    "How do you create and use pivot tables?": [
+        "Select the source data range or table, go to Insert and choose PivotTable, then drag fields from the field "
+        "list into the rows, columns, values and filters areas. The values are summarised with sum, count or "
+        "average, and you can group dates, add slicers and refresh when the data changes.",
+        "Pivot tables let me summarise large data quickly, for example total sales by region and month, and "
+        "rearrange the layout just by dragging fields.",
+    ],
+    "What are named ranges and how are they useful?": [
+        "A named range gives a meaningful name to a cell or range, created in the Name Box or with Define Name and "
+        "managed in the Name Manager. Formulas like =SUM(Sales) become easier to read than cell references, and "
+        "the name can be reused across the workbook and updated in one place.",
+        "Named ranges help with navigation, data validation lists and readable formulas. They can have workbook or "
+        "worksheet scope and can be dynamic with OFFSET or tables so they grow with the data.",
+    ],
+    "Explain how to use the INDEX and MATCH functions together.": [
+        "MATCH returns the relative position of a lookup value in a row or column, and INDEX returns the value at a "
+        "given position in a range. Nesting MATCH inside INDEX, as in =INDEX(C:C, MATCH(E2, A:A, 0)), looks up a "
+        "value in one column and returns the matching value from another column.",
+        "INDEX MATCH is more flexible than VLOOKUP because it can look to the left, does not break when columns "
+        "are inserted and can match on both rows and columns.",
+    ],
+    "How would you automate a report in Excel using VBA?": [
+        "I would open the VBA editor with Alt+F11, insert a module and write a Sub procedure that imports or "
+        "refreshes the data, applies filters and formatting, refreshes pivot tables and charts and saves or "
+        "emails the report. Recording a macro first helps get the basic code.",
+        "The macro can loop through sheets or files with For Each, use variables and range objects, and be run "
+        "from a button, on Workbook_Open or on a schedule with Task Scheduler so the report runs automatically.",
+    ],
+    "Describe a scenario where Power Query helped you clean complex data.": [
+        "I had monthly sales exports in CSV files in a folder with inconsistent columns. With Get Data from folder "
+        "in Power Query I combined them, removed duplicates, trimmed text, split columns, changed data types and "
+        "filtered out blank rows, then loaded a clean table.",
+        "Power Query records every transformation as applied steps, so next month I just click refresh. I also "
+        "used merge to join a customer lookup table and unpivot to reshape the data.",
+    ],
+    "How can you use dynamic arrays in Excel to analyze data?": [
+        "Dynamic array formulas return multiple results that spill into neighbouring cells. Functions like FILTER, "
+        "SORT, UNIQUE, SEQUENCE and SORTBY let me build a list of unique customers, filter rows by criteria or sort "
+        "the top sales with a single formula.",
+        "The spill range updates automatically when the source data changes, so there is no need to drag formulas "
+        "down, and I can refer to the whole result with the hash sign, like A2#.",
+    ],
+}
@@ -0,0 +1,217 @@
+# app/reference_vectors.py
+
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+import zlib
+import numpy as np
+from app.config import (
+    REFERENCE_VECTORS_DIR, REFERENCE_FULL_SIMILARITY, REFERENCE_SCORE_TOLERANCE, ANSWER_ARCHIVE_PATH
+)
+from app.reference_answers import REFERENCE_ANSWERS
+from app.utils import stem_word
+
+# Hashed feature space: large enough that collisions between the few hundred
+# distinct terms of an answer are rare, small enough to keep a row at 64 KB.
+DIM = 1 << 14
+
+STOPWORDS = {
+    "a", "an", "the", "and", "or", "of", "in", "on", "to", "for", "with", "by", "at", "from", "into",
+    "is", "are", "was", "be", "been", "it", "its", "this", "that", "these", "those", "as", "if", "so",
+    "i", "me", "my", "you", "your", "we", "our", "they", "them", "their", "can", "could", "would", "will",
+    "do", "does", "did", "just", "then", "than", "also", "like", "use", "using", "um", "uh",
+}
+
+
+def _features(text):
+    """Hashed, signed counts of stemmed words, word bigrams and character trigrams."""
+    tokens = [stem_word(w) for w in re.findall(r"[a-z0-9$#]+", text.lower()) if w not in STOPWORDS]
+    feats = [f"w:{t}" for t in tokens]
+    feats += [f"b:{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    # Character trigrams keep misrecognised words ("vlookp", "pivott") close to the right one
+    feats += [f"c:{t[i:i + 3]}" for t in tokens if len(t) > 3 for i in range(len(t) - 2)]
+    counts = {}
+    for feat in feats:
+        h = zlib.crc32(feat.encode("utf-8"))
+        index, sign = h & (DIM - 1), 1.0 if h >> 31 else -1.0
+        counts[index] = counts.get(index, 0.0) + sign
+    return counts
+
+
+def _term_matrix(texts) -> np.ndarray:
+    matrix = np.zeros((len(texts), DIM), dtype=np.float32)
+    for row, text in enumerate(texts):
+        counts = _features(text or "")
+        if counts:
+            matrix[row, list(counts)] = list(counts.values())
+    # Sublinear term frequency, sign preserved
+    return np.sign(matrix) * np.log1p(np.abs(matrix))
+
+
+def _weight(matrix, idf) -> np.ndarray:
+    matrix = matrix * idf
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32)
+
+
+def _fingerprint() -> str:
+    return hashlib.sha256(json.dumps([DIM, REFERENCE_ANSWERS], sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def build(directory=REFERENCE_VECTORS_DIR) -> str:
+    """Vectorize every reference answer and write vectors.npy, idf.npy and index.json to directory."""
+    questions = [q for q, answers in REFERENCE_ANSWERS.items() for _ in answers]
+    texts = [a for answers in REFERENCE_ANSWERS.values() for a in answers]
+    raw = _term_matrix(texts)
+    df = np.count_nonzero(raw, axis=0)
+    idf = (np.log((1 + len(texts)) / (1 + df)) + 1).astype(np.float32)
+    os.makedirs(directory, exist_ok=True)
+    np.save(os.path.join(directory, "vectors.npy"), _weight(raw, idf))
+    np.save(os.path.join(directory, "idf.npy"), idf)
+    with open(os.path.join(directory, "index.json"), "w", encoding="utf-8") as f:
+        json.dump({"fingerprint": _fingerprint(), "dim": DIM, "questions": questions}, f, ensure_ascii=False)
+    return directory
+
+
+def similarity_score(similarity) -> int:
+    """Map a reference similarity to the 0-10 scale used in evaluation feedback."""
+    return int(round(10 * min(1.0, max(0.0, similarity) / REFERENCE_FULL_SIMILARITY)))
+
+
+class ReferenceIndex:
+    """
+    Reference-answer vectors, memory-mapped from disk. Answers are compared against every
+    reference in one matrix product; a question's similarity is its best-matching reference.
+    """
+
+    def __init__(self, directory=REFERENCE_VECTORS_DIR):
+        index_path = os.path.join(directory, "index.json")
+        meta = None
+        if os.path.exists(index_path):
+            with open(index_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        if not meta or meta.get("fingerprint") != _fingerprint():
+            # Missing or built from an older set of reference answers
+            build(directory)
+            with open(index_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        self.vectors = np.load(os.path.join(directory, "vectors.npy"), mmap_mode="r")
+        self.idf = np.load(os.path.join(directory, "idf.npy"), mmap_mode="r")
+        self.questions = sorted(set(meta["questions"]), key=meta["questions"].index)
+        self._question_ids = {q: i for i, q in enumerate(self.questions)}
+        # Question id of every reference row
+        self._owners = np.array([self._question_ids[q] for q in meta["questions"]], dtype=np.int32)
+
+    def vectorize(self, texts) -> np.ndarray:
+        return _weight(_term_matrix(texts), self.idf)
+
+    def similarity(self, question, answer):
+        """Cosine similarity of the answer to the question's closest reference, or None if it has none."""
+        qid = self._question_ids.get(question)
+        if qid is None or not (answer or "").strip():
+            return None if qid is None else 0.0
+        sims = self.vectors @ self.vectorize([answer])[0]
+        return float(sims[self._owners == qid].max())
+
+    def score_batch(self, questions, answers, batch_size=512) -> np.ndarray:
+        """Similarities for many (question, answer) pairs; NaN where the question has no references."""
+        qids = np.array([self._question_ids.get(q, -1) for q in questions], dtype=np.int32)
+        result = np.full(len(answers), np.nan, dtype=np.float32)
+        for start in range(0, len(answers), batch_size):
+            chunk = slice(start, start + batch_size)
+            sims = self.vectorize(answers[chunk]) @ self.vectors.T
+            sims[self._owners[None, :] != qids[chunk, None]] = -np.inf
+            best = sims.max(axis=1)
+            result[chunk] = np.where(np.isfinite(best), best, np.nan)
+        return result
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_reference_index() -> ReferenceIndex:
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = ReferenceIndex()
+        return _index
+
+
+def reference_similarity(question, answer):
+    try:
+        return get_reference_index().similarity(question, answer)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Reference vectors unavailable: {e}")
+        return None
+
+
+def score_disagrees(llm_score, similarity) -> bool:
+    """True when an LLM score is far from what the reference similarity suggests."""
+    if llm_score is None or similarity is None:
+        return False
+    return abs(llm_score - similarity_score(similarity)) >= REFERENCE_SCORE_TOLERANCE
+
+
+_archive_lock = threading.Lock()
+
+
+def archive_answer(question, answer, score=None, similarity=None, path=ANSWER_ARCHIVE_PATH):
+    """Append an evaluated answer to the JSONL archive scored by `python -m app.reference_vectors score`."""
+    record = {"ts": time.time(), "question": question, "answer": answer, "score": score, "similarity": similarity}
+    directory = os.path.dirname(path)
+    with _archive_lock:
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def score_archive(path=ANSWER_ARCHIVE_PATH, out_path=None) -> dict:
+    """
+    Re-score every archived answer against the current references in batch.
+    Returns counts plus the records whose stored LLM score disagrees with the similarity.
+    """
+    with open(path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    sims = get_reference_index().score_batch(
+        [r.get("question", "") for r in records], [r.get("answer") or "" for r in records]
+    )
+    flagged = []
+    for record, sim in zip(records, sims):
+        record["similarity"] = None if np.isnan(sim) else round(float(sim), 4)
+        record["similarity_score"] = None if np.isnan(sim) else similarity_score(sim)
+        record["flagged"] = score_disagrees(record.get("score"), record["similarity"])
+        if record["flagged"]:
+            flagged.append(record)
+    if out_path:
+        with open(out_path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    scored = sims[~np.isnan(sims)]
+    return {
+        "records": len(records),
+        "scored": int(scored.size),
+        "mean_similarity": float(scored.mean()) if scored.size else None,
+        "flagged": flagged,
+    }
+
+
+if __name__ == "__main__":
+    usage = "Usage: python -m app.reference_vectors build | score [archive.jsonl] [output.jsonl]"
+    if len(sys.argv) < 2 or sys.argv[1] not in ("build", "score"):
+        print(usage)
+        sys.exit(1)
+    if sys.argv[1] == "build":
+        print(f"Built {build()}")
+    else:
+        report = score_archive(*sys.argv[2:4])
+        print(f"Scored {report['scored']} of {report['records']} answers, "
+              f"mean similarity {report['mean_similarity'] or 0:.3f}, {len(report['flagged'])} flagged")
+        for record in report["flagged"]:
+            print(f"- LLM {record['score']}/10 vs reference {record['similarity_score']}/10: {record['question']}")
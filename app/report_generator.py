@@ -54,9 +54,7 @@ def generate_pdf_report(candidate_name, questions, answers, feedbacks, summaries
 
     # LLM-generated strengths/weaknesses section
     if summaries:
-        from openai import OpenAI
-        from app.config import MODEL_NAME, OPENAI_API_KEY
-        client = OpenAI(api_key=OPENAI_API_KEY)
+        from app.llm_client import complete
         try:
             prompt = f"""
 You are an expert interviewer. Here are the candidate's answers and feedback summaries:
@@ -64,13 +62,12 @@ You are an expert interviewer. Here are the candidate's answers and feedback sum
             for i, (q, a, s, f) in enumerate(zip(questions, answers, summaries, feedbacks), 1):
                 prompt += f"\nQ{i}: {q}\nA: {a}\nSummary: {s}\nFeedback: {f}"
             prompt += "\n\nList the candidate's main strengths and areas for improvement in 2-3 bullet points each."
-            response = client.chat.completions.create(
-                model=MODEL_NAME,
+            sw_content = complete(
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.3,
-                max_tokens=200
+                max_tokens=200,
+                name="report_strengths"
             )
-            sw_content = response.choices[0].message.content.strip()
         except Exception as e:
             sw_content = "Strengths: - Good effort\nAreas for improvement: - None"
         c.setFont("Helvetica-Bold", 13)
@@ -0,0 +1,262 @@
+# app/rubrics.py
+
+import difflib
+import re
+from app.config import RUBRIC_CONFIDENCE_THRESHOLD
+from app.phrase_intents import analyze as analyze_phrases
+from app.utils import stem_word
+
+# Key concepts expected in a good answer to each bank question. "label" is how feedback and
+# follow-up questions refer to the concept; "terms" are the phrasings that count as mentioning it.
+# Terms are specific words or multi-word phrases: single generic words (GENERIC_WORDS) and terms
+# made only of the question's own words are ignored, so repeating the question earns nothing.
+RUBRICS = {
+    "How do you use the VLOOKUP function in Excel?": [
+        {"concept": "lookup value", "label": "the lookup value",
+         "terms": ["lookup value", "value to find", "value you search", "search value", "search for a value", "look up a value", "value to look", "value you want to find"]},
+        {"concept": "table array", "label": "the table array",
+         "terms": ["table array", "data range", "lookup range", "lookup table", "range of cells", "table range", "first column", "leftmost column"]},
+        {"concept": "column index number", "label": "the column index number",
+         "terms": ["column index", "col index", "column number", "index number", "which column", "return column", "column to return"]},
+        {"concept": "exact or approximate match", "label": "exact versus approximate match",
+         "terms": ["exact match", "approximate match", "range lookup", "false for exact", "true for approximate", "last argument", "fourth argument"]},
+    ],
+    "What is the difference between relative and absolute cell references?": [
+        {"concept": "relative references change when copied", "label": "how relative references change when copied",
+         "terms": ["changes when copied", "change when copied", "changes when you copy", "adjusts", "shifts", "moves with", "relative to the cell"]},
+        {"concept": "absolute references stay fixed", "label": "how absolute references stay fixed",
+         "terms": ["stays fixed", "stay fixed", "remains fixed", "locked", "does not change", "doesn't change", "stays the same", "stay the same"]},
+        {"concept": "dollar sign syntax", "label": "the dollar sign syntax",
+         "terms": ["dollar", "$", "f4", "dollar sign"]},
+        {"concept": "mixed references", "label": "mixed references",
+         "terms": ["mixed", "lock row", "lock column", "lock the row", "lock the column", "row only", "column only"]},
+    ],
+    "Explain how you would use conditional formatting.": [
+        {"concept": "rule or condition", "label": "the rule that triggers it",
+         "terms": ["rule", "criteria", "condition is met", "based on a condition", "greater than", "less than", "custom formula"]},
+        {"concept": "formatting applied automatically", "label": "the formatting it applies",
+         "terms": ["color", "colour", "highlight", "fill color", "font color", "format cells", "bold"]},
+        {"concept": "built-in visuals", "label": "the built-in visuals",
+         "terms": ["data bars", "color scales", "icon sets", "top bottom", "top 10", "duplicate values"]},
+        {"concept": "where to find it", "label": "where to find it",
+         "terms": ["home tab", "manage rules", "new rule", "styles group"]},
+    ],
+    "How can we use data formatting in Excel?": [
+        {"concept": "number formats", "label": "number formats",
+         "terms": ["number format", "currency", "percentage", "date format", "decimal places", "accounting format", "thousands separator"]},
+        {"concept": "format cells dialog", "label": "the Format Cells dialog",
+         "terms": ["format cells", "ctrl 1", "right click", "home tab", "number group"]},
+        {"concept": "text and alignment", "label": "text and alignment options",
+         "terms": ["font", "bold", "italic", "alignment", "wrap text", "merge and center", "border"]},
+        {"concept": "custom formats or styles", "label": "custom formats and styles",
+         "terms": ["custom format", "cell styles", "format painter", "table style", "conditional formatting"]},
+    ],
+    "What is the difference between a formula and a function in Excel?": [
+        {"concept": "formula is a user-written expression", "label": "what a formula is",
+         "terms": ["expression", "equal sign", "equals sign", "starts with equal", "written by the user", "user written", "you write yourself"]},
+        {"concept": "function is predefined", "label": "what a function is",
+         "terms": ["predefined", "built in", "inbuilt", "ready made", "preset"]},
+        {"concept": "example", "label": "an example",
+         "terms": ["a1", "b1", "sum function", "average", "countif", "vlookup"]},
+        {"concept": "functions used inside formulas", "label": "how functions are used inside formulas",
+         "terms": ["inside a formula", "part of a formula", "within a formula", "arguments", "nested", "combine functions"]},
+    ],
+    "How do you create and use pivot tables?": [
+        {"concept": "select source data", "label": "selecting the source data",
+         "terms": ["select data", "source data", "data range", "select the range", "select the table", "select your data"]},
+        {"concept": "insert pivot table", "label": "inserting the pivot table",
+         "terms": ["insert tab", "insert pivot", "insert a pivot table", "pivottable", "recommended pivot"]},
+        {"concept": "rows, columns and values areas", "label": "the rows, columns and values areas",
+         "terms": ["rows area", "columns area", "values area", "drag", "field list", "row labels", "column labels"]},
+        {"concept": "summarise or filter", "label": "summarising and filtering",
+         "terms": ["summarize", "summarise", "aggregate", "sum of", "count of", "slicer", "filter area", "group by", "grouping"]},
+    ],
+    "What are named ranges and how are they useful?": [
+        {"concept": "name assigned to a range", "label": "how a name is assigned to a range",
+         "terms": ["name to a range", "name a range", "name box", "define name", "name manager", "give a name"]},
+        {"concept": "readable formulas", "label": "why formulas become more readable",
+         "terms": ["readable", "easier to understand", "easier to read", "instead of cell references", "meaningful name"]},
+        {"concept": "reuse and maintenance", "label": "reuse and maintenance",
+         "terms": ["reuse", "reusable", "one place", "easier to maintain", "navigate", "jump to"]},
+        {"concept": "scope or dynamic ranges", "label": "scope and dynamic ranges",
+         "terms": ["scope", "workbook level", "worksheet level", "dynamic range", "offset", "expands automatically"]},
+    ],
+    "Explain how to use the INDEX and MATCH functions together.": [
+        {"concept": "MATCH finds the position", "label": "how MATCH finds the position",
+         "terms": ["match returns the position", "match finds", "finds the position", "relative position", "position of", "row number"]},
+        {"concept": "INDEX returns the value", "label": "how INDEX returns the value",
+         "terms": ["index returns", "returns the value", "return the value", "retrieve", "value at"]},
+        {"concept": "nesting MATCH inside INDEX", "label": "nesting MATCH inside INDEX",
+         "terms": ["nested", "nest", "inside index", "match inside", "row argument", "as the row number"]},
+        {"concept": "advantages over VLOOKUP", "label": "the advantages over VLOOKUP",
+         "terms": ["left lookup", "look left", "lookup to the left", "any column", "faster than vlookup", "better than vlookup", "instead of vlookup", "unlike vlookup"]},
+    ],
+    "How would you automate a report in Excel using VBA?": [
+        {"concept": "macros or VBA editor", "label": "the macro recorder or VBA editor",
+         "terms": ["macro", "vba editor", "developer tab", "alt f11", "module", "record macro", "visual basic"]},
+        {"concept": "code structure", "label": "the structure of the code",
+         "terms": ["sub", "end sub", "loop", "variable", "procedure", "for each", "range object"]},
+        {"concept": "report steps", "label": "the steps the report runs",
+         "terms": ["import data", "refresh", "pivot", "chart", "copy paste", "apply filter", "format the report"]},
+        {"concept": "triggering or scheduling", "label": "how it is triggered or scheduled",
+         "terms": ["button", "schedule", "workbook open", "on open", "task scheduler", "run automatically", "ontime"]},
+    ],
+    "Describe a scenario where Power Query helped you clean complex data.": [
+        {"concept": "data source", "label": "the data source",
+         "terms": ["csv", "database", "multiple files", "folder", "get data", "import from", "sql", "sharepoint"]},
+        {"concept": "cleaning transformations", "label": "the cleaning steps",
+         "terms": ["remove duplicates", "split column", "trim", "replace values", "change type", "data type", "filter rows", "unpivot", "fill down"]},
+        {"concept": "combining data", "label": "combining queries",
+         "terms": ["merge", "merge queries", "append", "append queries", "join"]},
+        {"concept": "refreshable result", "label": "refreshing the result",
+         "terms": ["refresh", "close and load", "applied steps", "repeatable", "m code", "advanced editor"]},
+    ],
+    "How can you use dynamic arrays in Excel to analyze data?": [
+        {"concept": "spill behaviour", "label": "spill behaviour",
+         "terms": ["spill", "spills", "spill range", "multiple cells", "hash sign"]},
+        {"concept": "dynamic array functions", "label": "the dynamic array functions",
+         "terms": ["filter function", "sort function", "unique", "sequence", "sortby", "xlookup", "randarray"]},
+        {"concept": "analysis use case", "label": "an analysis use case",
+         "terms": ["summary table", "top 10", "unique list", "per region", "by region", "criteria", "dashboard"]},
+        {"concept": "automatic updates", "label": "automatic updates",
+         "terms": ["automatically", "recalculate", "no need to drag", "single formula", "update automatically"]},
+    ],
+}
+
+# Words too common in Excel answers to show that a concept was understood on their own
+GENERIC_WORDS = {
+    "formula", "function", "range", "table", "true", "false", "sum", "combine", "exact", "value",
+    "data", "count", "format", "cell", "column", "row", "excel", "index", "match", "list", "top",
+    "update", "load", "source", "insert", "filter", "sort", "label", "position", "together",
+}
+
+# Answers that admit not knowing are never scored locally above this
+UNCERTAIN_MAX_SCORE = 3
+
+ENCOURAGEMENTS = [
+    (8, "Excellent answer, you clearly know this well!"),
+    (5, "Good answer, you're on the right track."),
+    (0, "Thanks for giving it a try, let's keep going."),
+]
+
+def _tokens(text):
+    return [stem_word(w) for w in re.findall(r"[a-z0-9$]+", text.lower())]
+
+
+_GENERIC = {stem_word(w) for w in GENERIC_WORDS}
+
+
+def _compile(question, concepts):
+    asked = set(_tokens(question))
+    compiled = []
+    for c in concepts:
+        phrases = [tuple(_tokens(t)) for t in c["terms"]]
+        phrases = [p for p in phrases if p and not set(p) <= asked and not (len(p) == 1 and p[0] in _GENERIC)]
+        compiled.append((c["label"], phrases))
+    return compiled
+
+
+_COMPILED = {question: _compile(question, concepts) for question, concepts in RUBRICS.items()}
+
+
+def _token_matches(expected, vocabulary):
+    if expected in vocabulary:
+        return True
+    # Tolerate speech-recognition and spelling slips on longer words ("vlookp", "pivott")
+    if len(expected) < 5:
+        return False
+    return any(
+        abs(len(word) - len(expected)) <= 2 and difflib.SequenceMatcher(None, expected, word).ratio() >= 0.85
+        for word in vocabulary
+    )
+
+
+def _phrase_in(phrase, tokens, vocabulary):
+    if not all(_token_matches(t, vocabulary) for t in phrase):
+        return False
+    if len(phrase) == 1:
+        return True
+    # Multi-word terms must appear close together, not just anywhere in the answer
+    positions = [i for i, tok in enumerate(tokens) if tok == phrase[0] or _token_matches(phrase[0], {tok})]
+    window = len(phrase) + 2
+    return any(
+        all(any(_token_matches(p, {tok}) for tok in tokens[i:i + window]) for p in phrase[1:])
+        for i in positions
+    )
+
+
+def has_rubric(question) -> bool:
+    return question in _COMPILED
+
+
+def score_answer(question, answer):
+    """
+    Score an answer to a bank question by the rubric concepts it mentions.
+    Returns {"score", "feedback", "confidence", "covered", "missing"} (concept labels) or None if the
+    question has no rubric. Answers that admit not knowing are capped at UNCERTAIN_MAX_SCORE and
+    left to the LLM, whatever their length.
+    """
+    concepts = _COMPILED.get(question)
+    if concepts is None:
+        return None
+    answer = (answer or "").strip()
+    tokens = _tokens(answer)
+    if not tokens:
+        return {
+            "score": 0,
+            "feedback": "No substantive answer was given. Reviewing the core concept would help.",
+            "confidence": 0.95,
+            "covered": [],
+            "missing": [name for name, _ in concepts],
+        }
+    vocabulary = set(tokens)
+    covered = [name for name, phrases in concepts if any(_phrase_in(p, tokens, vocabulary) for p in phrases)]
+    missing = [name for name, _ in concepts if name not in covered]
+    coverage = len(covered) / len(concepts)
+    score = round(2 + 8 * coverage)
+    if len(tokens) < 12:
+        score = min(score, 6)
+    # Only clear-cut answers are scored locally. Middling ones are ambiguous, and an answer
+    # matching no terms may be a paraphrase the rubric does not list, so both go to the LLM.
+    if coverage >= 0.75 and len(tokens) >= 12:
+        confidence = 0.8 + 0.2 * coverage
+    else:
+        confidence = 0.4 + 0.2 * abs(coverage - 0.5)
+    if "uncertain" in analyze_phrases(answer).intents:
+        # Keywords next to "I don't know" are guesses; the LLM judges what the answer is worth
+        score = min(score, UNCERTAIN_MAX_SCORE)
+        confidence = min(confidence, 0.5)
+    if covered and missing:
+        feedback = f"You covered {', '.join(covered)}. To make the answer complete, also mention {', '.join(missing)}."
+    elif covered:
+        feedback = f"Accurate and complete: you covered {', '.join(covered)}."
+    else:
+        feedback = f"The answer misses the key points: {', '.join(missing)}."
+    return {"score": score, "feedback": feedback, "confidence": confidence, "covered": covered, "missing": missing}
+
+
+def local_turn_analysis(question, answer, threshold=RUBRIC_CONFIDENCE_THRESHOLD):
+    """
+    Build a turn analysis (same shape as app.turn_analysis.analyze_turn) without any LLM call,
+    or return None when the question has no rubric or the local score is not confident enough.
+    """
+    result = score_answer(question, answer)
+    if result is None or result["confidence"] < threshold:
+        return None
+    words = (answer or "").split()
+    summary = " ".join(words[:25]) + ("..." if len(words) > 25 else "")
+    encouragement = next(text for minimum, text in ENCOURAGEMENTS if result["score"] >= minimum)
+    if result["missing"] and result["covered"]:
+        followup = f"Could you also explain {result['missing'][0]}?"
+    elif result["missing"]:
+        followup = f"Let's try a simpler angle: what do you know about {result['missing'][0]}?"
+    else:
+        followup = "Can you share a real example where you used this?"
+    return {
+        "score": result["score"],
+        "feedback": result["feedback"],
+        "summary": f"The candidate said: {summary}" if words else "The candidate did not answer.",
+        "encouragement": encouragement,
+        "followup_question": followup,
+        "source": "rubric",
+    }
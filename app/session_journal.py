@@ -0,0 +1,238 @@
+# app/session_journal.py
+
+import base64
+import copy
+import json
+import os
+import threading
+import time
+from app.config import SESSION_DIR, SESSION_FSYNC_INTERVAL, SESSION_COMPACT_EVERY
+from app.question_records import QuestionRecords
+from app.utils import log_event
+
+JOURNAL_FILE = "journal.jsonl"
+CHECKPOINT_FILE = "checkpoint.json"
+END = "__end__"
+
+
+def _encode(value):
+    if isinstance(value, QuestionRecords):
+        return {"__records__": base64.b64encode(value.to_bytes()).decode("ascii")}
+    return str(value)
+
+
+def _decode(obj):
+    if "__records__" in obj:
+        return QuestionRecords.from_bytes(base64.b64decode(obj["__records__"]))
+    return obj
+
+
+def _dumps(record) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=_encode)
+
+
+def _loads(text):
+    return json.loads(text, object_hook=_decode)
+
+
+class StateTracker:
+    """
+    Remembers a copy of the state to describe the next change as a delta. Lists and
+    QuestionRecords are recorded as the range of items that changed, so filling in the
+    current question writes that one record rather than the whole interview.
+    """
+
+    def __init__(self):
+        self._seen = {}
+
+    def delta(self, state) -> dict:
+        changes = {}
+        for key, value in state.items():
+            seen = self._seen.get(key)
+            if isinstance(value, (list, QuestionRecords)):
+                if seen is None or seen[0] != "list" or type(seen[1]) is not type(value):
+                    changes.setdefault("set", {})[key] = value
+                    self._seen[key] = ("list", copy.deepcopy(value))
+                    continue
+                items = seen[1]
+                common = min(len(items), len(value))
+                start = next((i for i in range(common) if value[i] != items[i]), common)
+                if start == common and len(items) == len(value):
+                    continue
+                # Items after the last change stay as they are: value[start:stop] replaces items[start:end]
+                tail = next((k for k in range(common - start) if value[-1 - k] != items[-1 - k]), common - start)
+                end, stop = len(items) - tail, len(value) - tail
+                changes.setdefault("splice", {})[key] = [start, end, value[start:stop]]
+                items[start:end] = copy.deepcopy(value[start:stop])
+            else:
+                if seen is None or seen[0] != "value" or seen[1] != value:
+                    changes.setdefault("set", {})[key] = value
+                self._seen[key] = ("value", copy.deepcopy(value))
+        removed = [key for key in self._seen if key not in state]
+        for key in removed:
+            del self._seen[key]
+        if removed:
+            changes["delete"] = removed
+        return changes
+
+
+def apply_delta(state, record):
+    for key, value in record.get("set", {}).items():
+        state[key] = value
+    for key, (start, end, items) in record.get("splice", {}).items():
+        state[key][start:end] = items
+    for key in record.get("delete", []):
+        state.pop(key, None)
+    return state
+
+
+class SessionJournal:
+    """
+    Write-ahead journal of one interview: one compact JSON line per graph node transition,
+    holding only what the node changed and which node runs next. Lines are flushed to the
+    OS as they are written and fsynced in batches (at most every SESSION_FSYNC_INTERVAL
+    seconds); every SESSION_COMPACT_EVERY records the state is checkpointed and the journal
+    truncated. replay() rebuilds the state and the node to resume at.
+    """
+
+    def __init__(self, directory=SESSION_DIR, fsync_interval=SESSION_FSYNC_INTERVAL,
+                 compact_every=SESSION_COMPACT_EVERY):
+        self.directory = directory
+        self.journal_path = os.path.join(directory, JOURNAL_FILE)
+        self.checkpoint_path = os.path.join(directory, CHECKPOINT_FILE)
+        self.fsync_interval = fsync_interval
+        self.compact_every = compact_every
+        self._lock = threading.Condition()
+        self._file = None
+        self._tracker = None
+        self._state = None
+        self._seq = 0
+        self._since_checkpoint = 0
+        self._dirty = False
+        self._closed = False
+        self._syncer = None
+
+    def exists(self) -> bool:
+        return os.path.exists(self.journal_path) or os.path.exists(self.checkpoint_path)
+
+    def replay(self):
+        """
+        Returns (state, next_node, seq) from the checkpoint plus every complete journal record
+        after it, or None if there is no unfinished session. A torn last line is ignored.
+        """
+        state, node, seq = None, None, 0
+        if os.path.exists(self.checkpoint_path):
+            try:
+                with open(self.checkpoint_path, encoding="utf-8") as f:
+                    checkpoint = _loads(f.read())
+                state, node, seq = checkpoint["state"], checkpoint["next"], checkpoint["seq"]
+            except (OSError, ValueError, KeyError) as e:
+                log_event(f"Ignoring unreadable session checkpoint: {e}")
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = _loads(line)
+                    except ValueError:
+                        break
+                    if record["seq"] <= seq:
+                        continue  # already in the checkpoint (crash between checkpoint and truncate)
+                    if state is None:
+                        state = {}
+                    apply_delta(state, record)
+                    node, seq = record["next"], record["seq"]
+        if state is None or node in (None, END):
+            return None
+        return state, node, seq
+
+    def start(self, state, next_node, seq=0):
+        """Begin journaling from state (fresh, or as returned by replay) before next_node runs."""
+        os.makedirs(self.directory, exist_ok=True)
+        with self._lock:
+            self._seq = seq
+            self._state = state
+            self._tracker = StateTracker()
+            self._closed = False
+            self._file = open(self.journal_path, "a", encoding="utf-8")
+            # Start from a checkpoint so records never follow a torn line left by a crash
+            self._checkpoint(next_node)
+        self._syncer = threading.Thread(target=self._sync_loop, name="session-journal", daemon=True)
+        self._syncer.start()
+
+    def record(self, node, state, next_node):
+        """Append what node changed in state; next_node is where a resumed interview continues."""
+        with self._lock:
+            if self._file is None:
+                return
+            self._state = state
+            self._seq += 1
+            entry = {"seq": self._seq, "node": node, "next": next_node, "t": round(time.time(), 3)}
+            entry.update(self._tracker.delta(state))
+            self._file.write(_dumps(entry) + "\n")
+            self._file.flush()
+            self._since_checkpoint += 1
+            if self.compact_every and self._since_checkpoint >= self.compact_every and next_node != END:
+                self._checkpoint(next_node)
+            else:
+                self._dirty = True
+                self._lock.notify_all()
+
+    def _checkpoint(self, next_node):
+        """Write the full state atomically, then start an empty journal. Caller holds the lock."""
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(_dumps({"seq": self._seq, "next": next_node, "state": self._state}))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+        self._file.truncate(0)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._tracker.delta(self._state)
+        self._since_checkpoint = 0
+        self._dirty = False
+
+    def _sync_loop(self):
+        while True:
+            with self._lock:
+                while not self._dirty and not self._closed:
+                    self._lock.wait()
+                if self._closed:
+                    return
+            # Let more records arrive so one fsync covers them all
+            time.sleep(self.fsync_interval)
+            self.sync()
+
+    def sync(self):
+        with self._lock:
+            if self._file is not None and self._dirty:
+                os.fsync(self._file.fileno())
+                self._dirty = False
+
+    def close(self):
+        self.sync()
+        with self._lock:
+            self._closed = True
+            self._lock.notify_all()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def clear(self):
+        """Finish the session: nothing is left to resume."""
+        self.close()
+        for path in (self.journal_path, self.checkpoint_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+_journal = None
+_journal_lock = threading.Lock()
+
+
+def get_session_journal() -> SessionJournal:
+    global _journal
+    with _journal_lock:
+        if _journal is None:
+            _journal = SessionJournal()
+        return _journal
@@ -0,0 +1,99 @@
+# app/speech_pipeline.py
+
+import queue
+import re
+import threading
+from app.utils import print_with_typing, translate_text
+
+# A sentence ends at . ! ? (optionally followed by closing quotes/brackets) and whitespace, or at a newline
+_BOUNDARY = re.compile(r"(?<=[.!?])[\"')\]]*\s+|\n+")
+MIN_SENTENCE_CHARS = 20
+
+
+def split_sentences(chunks, min_chars=MIN_SENTENCE_CHARS):
+    """
+    Re-chunk a stream of text deltas into sentences, yielding each one as soon as its boundary
+    arrives. Fragments shorter than min_chars are held back and merged with the next sentence.
+    """
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        start = 0
+        for match in _BOUNDARY.finditer(buffer):
+            sentence = buffer[start:match.end()].strip()
+            if len(sentence) >= min_chars:
+                yield sentence
+                start = match.end()
+        buffer = buffer[start:]
+    if buffer.strip():
+        yield buffer.strip()
+
+
+class SpeechPipeline:
+    """
+    Speaks sentences on a worker thread while the producer keeps generating.
+    Each sentence is translated (catalog first, then LLM) and optionally printed before it is spoken,
+    so translation and synthesis of one sentence overlap with generation of the next.
+    """
+
+    def __init__(self, language="english", tts_lang="en", speak_fn=None, color=None, echo=False):
+        if speak_fn is None:
+            from app.voice_utils import speak as speak_fn
+        self.language = language
+        self.tts_lang = tts_lang
+        self.speak_fn = speak_fn
+        self.color = color
+        self.echo = echo
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="speech-pipeline", daemon=True)
+        self._worker.start()
+
+    def _run(self):
+        while True:
+            sentence = self._queue.get()
+            if sentence is None:
+                return
+            try:
+                text = translate_text(sentence, self.language)
+                if self.echo:
+                    print_with_typing(text, color=self.color)
+                self.speak_fn(text, language=self.tts_lang)
+            except Exception as e:
+                print(f"[Speech pipeline error: {e}]")
+
+    def feed(self, sentence):
+        if sentence and sentence.strip():
+            self._queue.put(sentence)
+
+    def close(self):
+        """Wait until everything fed so far has been spoken (or queued for speech, with SPEECH_ASYNC)."""
+        self._queue.put(None)
+        self._worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def speak_stream(chunks, language="english", tts_lang="en", speak_fn=None, print_tokens=True):
+    """
+    Print a token stream as it arrives and speak it sentence by sentence while it is still
+    being generated. Returns the full text once the last sentence has been spoken.
+    """
+    parts = []
+
+    def tee():
+        for part in chunks:
+            if print_tokens:
+                print(part, end="", flush=True)
+            parts.append(part)
+            yield part
+
+    with SpeechPipeline(language, tts_lang, speak_fn=speak_fn) as pipeline:
+        for sentence in split_sentences(tee()):
+            pipeline.feed(sentence)
+        if print_tokens:
+            print()
+    return "".join(parts)
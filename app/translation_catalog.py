@@ -0,0 +1,202 @@
+# app/translation_catalog.py
+"""
+Precompiled translations of the interviewer's fixed phrases.
+
+The catalog is built once per language with
+    python -m app.translation_catalog build [language ...]
+and stored as data/translations/<language>.json. translate_text consults it before making a
+live LLM request. Phrases are collected from the string literals that app/nodes.py and
+app/main.py pass to translate_text, speak and print_with_typing, plus the f-string templates
+passed to translate_text.
+"""
+
+import ast
+import json
+import os
+import re
+import string
+import sys
+import threading
+
+CATALOG_DIR = os.path.join("data", "translations")
+SOURCE_FILES = [
+    os.path.join(os.path.dirname(__file__), "nodes.py"),
+    os.path.join(os.path.dirname(__file__), "main.py"),
+]
+PROMPT_CALLS = {"translate_text", "speak", "print_with_typing"}
+PHRASE_LISTS = {"friendly_transitions"}
+
+_catalogs = {}  # language -> {"phrases": {...}, "templates": [(regex, fields, translated), ...]}
+_catalog_lock = threading.Lock()
+
+
+def _template_from_fstring(node):
+    """Turn an f-string AST node into a "{field}" template, or None if it has no literal text."""
+    parts, fields = [], []
+    for value in node.values:
+        if isinstance(value, ast.Constant):
+            parts.append(str(value.value).replace("{", "{{").replace("}", "}}"))
+        elif isinstance(value, ast.FormattedValue):
+            field = re.sub(r"\W+", "_", ast.unparse(value.value)).strip("_") or f"field{len(fields)}"
+            fields.append(field)
+            parts.append("{" + field + "}")
+    template = "".join(parts)
+    if not fields or not re.sub(r"\{\w+\}", "", template).strip(" :.!?\n"):
+        return None
+    return template
+
+
+def collect_phrases(paths=None):
+    """Return (phrases, templates) found in the source files, each as a sorted list of strings."""
+    phrases, templates = set(), set()
+    for path in paths or SOURCE_FILES:
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call) and node.args:
+                func = node.func
+                name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)
+                if name not in PROMPT_CALLS:
+                    continue
+                arg = node.args[0]
+                if isinstance(arg, ast.Constant) and isinstance(arg.value, str) and arg.value.strip():
+                    phrases.add(arg.value)
+                elif isinstance(arg, ast.JoinedStr) and name == "translate_text":
+                    template = _template_from_fstring(arg)
+                    if template:
+                        templates.add(template)
+            elif isinstance(node, ast.Assign) and isinstance(node.value, ast.List):
+                targets = {t.id for t in node.targets if isinstance(t, ast.Name)}
+                if targets & PHRASE_LISTS:
+                    for item in node.value.elts:
+                        if isinstance(item, ast.Constant) and isinstance(item.value, str):
+                            phrases.add(item.value)
+    return sorted(phrases), sorted(templates)
+
+
+def _catalog_path(language):
+    return os.path.join(CATALOG_DIR, f"{language.lower()}.json")
+
+
+def _compile_template(template):
+    """Regex matching a rendered template, with one named group per field."""
+    pattern, fields = "", []
+    for literal, field, _, _ in string.Formatter().parse(template.strip()):
+        pattern += re.escape(literal)
+        if field is not None:
+            fields.append(field)
+            pattern += f"(?P<{field}>.+?)"
+    return re.compile(f"^{pattern}$", re.DOTALL), fields
+
+
+def load_catalog(language):
+    """Load (once) and return the compiled catalog for language; empty if it was never built."""
+    language = language.lower()
+    with _catalog_lock:
+        if language in _catalogs:
+            return _catalogs[language]
+        catalog = {"phrases": {}, "templates": []}
+        path = _catalog_path(language)
+        if os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+                catalog["phrases"] = {k.strip(): v for k, v in data.get("phrases", {}).items()}
+                for template, translated in data.get("templates", {}).items():
+                    regex, fields = _compile_template(template)
+                    catalog["templates"].append((regex, fields, translated))
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Could not load translation catalog {path}: {e}")
+        _catalogs[language] = catalog
+        return catalog
+
+
+def load_catalogs(languages=None):
+    """Load catalogs for every supported language at startup."""
+    from app.utils import LANGUAGE_CODES
+    for language in languages or LANGUAGE_CODES:
+        if language != "english":
+            load_catalog(language)
+
+
+def _translate_value(value, language):
+    if len(value.split()) < 3:
+        return value
+    from app.utils import translate_text
+    return translate_text(value, language)
+
+
+def lookup(text, language):
+    """Return the precompiled translation of text, or None if it is not a catalogued phrase."""
+    catalog = load_catalog(language)
+    key = text.strip()
+    if key in catalog["phrases"]:
+        return catalog["phrases"][key]
+    for regex, fields, translated in catalog["templates"]:
+        match = regex.match(key)
+        if match:
+            # Names and numbers are kept as-is; longer free text in a field is translated on its own
+            values = {
+                field: _translate_value(value, language)
+                for field, value in match.groupdict().items()
+            }
+            try:
+                return translated.format(**values)
+            except (KeyError, IndexError, ValueError):
+                return None
+    return None
+
+
+def _translate_template(template, language):
+    from app.llm_client import complete
+    prompt = (
+        f"Translate the following text to {language.title()}. "
+        f"Keep every placeholder in curly braces, such as {{name}}, exactly as written:\n\n{template}"
+    )
+    try:
+        return complete(messages=[{"role": "user", "content": prompt}], temperature=0.2, max_tokens=300,
+                        name="translate_template")
+    except Exception:
+        return ""
+
+
+def build_catalog(language):
+    """Translate every collected phrase and template for language with live LLM calls and save it."""
+    from app.utils import translate_text_live
+    phrases, templates = collect_phrases()
+    data = {"phrases": {}, "templates": {}}
+    failed = 0
+    for phrase in phrases:
+        translated = translate_text_live(phrase, language)
+        # translate_text_live returns the English text when the call fails; leave the phrase
+        # out so it is translated live for now and retried on the next build
+        if not translated or translated.strip() == phrase.strip():
+            failed += 1
+            continue
+        data["phrases"][phrase.strip()] = translated
+    for template in templates:
+        fields = [f for _, f, _, _ in string.Formatter().parse(template) if f]
+        translated = _translate_template(template, language)
+        if not translated or translated.strip() == template.strip():
+            failed += 1
+            continue
+        # A template is only usable if the translation kept all of its placeholders
+        if all("{" + field + "}" in translated for field in fields):
+            data["templates"][template] = translated
+    if failed:
+        print(f"⚠️ {failed} phrases could not be translated to {language.title()}; rebuild to retry them")
+    os.makedirs(CATALOG_DIR, exist_ok=True)
+    with open(_catalog_path(language), "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    with _catalog_lock:
+        _catalogs.pop(language.lower(), None)
+    return _catalog_path(language)
+
+
+if __name__ == "__main__":
+    from app.utils import LANGUAGE_CODES
+    if len(sys.argv) < 2 or sys.argv[1] != "build":
+        print("Usage: python -m app.translation_catalog build [language ...]")
+        sys.exit(1)
+    for lang in sys.argv[2:] or [l for l in LANGUAGE_CODES if l != "english"]:
+        print(f"Built {build_catalog(lang)}")
@@ -0,0 +1,123 @@
+# app/tts_worker.py
+
+import queue
+import threading
+from concurrent.futures import Future
+import pyttsx3
+from app.config import VOICE_RATE, VOICE_VOLUME, VOICE_PITCH
+from app.utils import log_event
+
+# Preferred voices in order: Zira (female), then David (male), else the first available
+PREFERRED_VOICES = ("zira", "david")
+
+
+def select_voice(voices):
+    for name in PREFERRED_VOICES:
+        for v in voices:
+            if name in v.name.lower():
+                return v.id
+    return voices[0].id if voices else None
+
+
+class TTSWorker:
+    """
+    One thread that owns the speech engine and speaks queued utterances in order.
+    The pyttsx3 engine is created and its voice resolved once, on the worker thread
+    (SAPI5 engines must be driven from the thread that created them). Non-English
+    utterances are played with gTTS on the same thread so all speech stays in order.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._engine = None
+        self._last = None
+        self._last_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="tts-worker", daemon=True)
+        self._thread.start()
+
+    def submit(self, text, language="en") -> Future:
+        """Queue an utterance; the returned future completes once it has been spoken."""
+        done = Future()
+        with self._last_lock:
+            self._queue.put((text, language, done))
+            self._last = done
+        return done
+
+    def say(self, text, language="en", timeout=None):
+        """Speak text and wait until it has finished."""
+        return self.submit(text, language).result(timeout)
+
+    def is_busy(self) -> bool:
+        with self._last_lock:
+            return self._last is not None and not self._last.done()
+
+    def wait_until_idle(self, timeout=None):
+        """Barrier: block until everything queued so far has been spoken (or has failed)."""
+        with self._last_lock:
+            last = self._last
+        if last is not None:
+            try:
+                last.result(timeout)
+            except Exception:
+                pass
+
+    def close(self, timeout=None):
+        """Finish the queued utterances and stop the worker."""
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _get_engine(self):
+        if self._engine is None:
+            engine = pyttsx3.init(driverName='sapi5')
+            voice = select_voice(engine.getProperty('voices'))
+            if voice:
+                engine.setProperty('voice', voice)
+            engine.setProperty('rate', VOICE_RATE)
+            engine.setProperty('volume', VOICE_VOLUME)
+            try:
+                engine.setProperty('pitch', VOICE_PITCH)
+            except Exception:
+                pass
+            self._engine = engine
+        return self._engine
+
+    def _speak(self, text, language):
+        if language.startswith('en'):
+            engine = self._get_engine()
+            try:
+                engine.say(text)
+                engine.runAndWait()
+            except Exception:
+                # Start from a fresh engine next time rather than reusing a broken one
+                self._engine = None
+                raise
+        else:
+            from app.voice_utils import speak_gtts
+            speak_gtts(text, language)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            text, language, done = item
+            if not done.set_running_or_notify_cancel():
+                continue
+            try:
+                self._speak(text, language)
+                done.set_result(None)
+            except Exception as e:
+                log_event(f"TTS failed for {text!r}: {e}")
+                done.set_exception(e)
+
+
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def get_tts_worker() -> TTSWorker:
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = TTSWorker()
+        return _worker
@@ -0,0 +1,84 @@
+# app/turn_analysis.py
+
+import json
+from app.llm_client import complete
+
+# Expected keys of the combined response and the type each value is coerced to.
+TURN_ANALYSIS_SCHEMA = {
+    "score": int,
+    "feedback": str,
+    "summary": str,
+    "encouragement": str,
+    "followup_question": str,
+}
+
+
+def validate_turn_analysis(data) -> dict:
+    """
+    Check a decoded turn-analysis response against TURN_ANALYSIS_SCHEMA.
+    Returns a cleaned dict (score clamped to 0-10, strings stripped) or raises ValueError.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Turn analysis must be a JSON object.")
+    result = {}
+    for key, expected in TURN_ANALYSIS_SCHEMA.items():
+        if key not in data:
+            raise ValueError(f"Turn analysis is missing '{key}'.")
+        value = data[key]
+        if expected is int:
+            try:
+                value = int(round(float(value)))
+            except (TypeError, ValueError):
+                raise ValueError(f"Turn analysis '{key}' is not a number: {value!r}")
+            value = max(0, min(10, value))
+        else:
+            if not isinstance(value, str) or not value.strip():
+                raise ValueError(f"Turn analysis '{key}' must be a non-empty string.")
+            value = value.strip()
+        result[key] = value
+    return result
+
+
+def analyze_turn(question: str, answer: str, is_experienced: bool = False):
+    """
+    Evaluate an answer, summarize it, encourage the candidate and propose a follow-up question
+    in a single LLM call. Returns the validated dict, or None if the call or validation fails
+    so the caller can fall back to the separate per-task calls.
+    """
+    if is_experienced:
+        followup_style = "about their work experience, a project, or a challenge they faced using Excel in a professional context"
+    else:
+        followup_style = "about Excel formulas, functions, or learning experiences for a fresher"
+    prompt = f"""
+You are a friendly technical Excel interviewer.
+
+Here is a question:
+"{question}"
+
+And the candidate's answer:
+"{answer}"
+
+Respond with a JSON object with exactly these keys:
+- "score": integer from 0 to 10 for accuracy, clarity and completeness
+- "feedback": short feedback (2-3 lines) on accuracy, clarity and completeness, without the score
+- "summary": the candidate's answer summarized in 1-2 sentences
+- "encouragement": a short, positive encouragement or comment
+- "followup_question": a single, natural-sounding follow-up question {followup_style}
+"""
+    try:
+        content = complete(
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.4,
+            max_tokens=350,
+            response_format={"type": "json_object"},
+            name="analyze_turn"
+        )
+        return validate_turn_analysis(json.loads(content))
+    except Exception as e:
+        print(f"⚠️ Combined turn analysis failed: {e}")
+        return None
+
+
+def feedback_from_analysis(analysis: dict) -> str:
+    """Render the analysis as the plain-text feedback format produced by evaluate_answer."""
+    return f"{analysis['feedback']}\nScore: {analysis['score']}/10"
@@ -44,29 +44,51 @@ def print_with_typing(text, delay=0.02, color=None):
             time.sleep(delay)
         print()
 
+LANGUAGE_CODES = {
+    'english': ('en', 'en-US'),
+    'hindi': ('hi', 'hi-IN'),
+    'spanish': ('es', 'es-ES'),
+    'french': ('fr', 'fr-FR'),
+}
+
 def translate_text(text, target_language):
     if target_language.lower() == "english":
         return text
-    from openai import OpenAI
-    from app.config import MODEL_NAME, OPENAI_API_KEY
-    client = OpenAI(api_key=OPENAI_API_KEY)
+    # Fixed interviewer phrases are translated ahead of time (see app/translation_catalog.py)
+    from app.translation_catalog import lookup
+    translated = lookup(text, target_language)
+    if translated:
+        return translated
+    return translate_text_live(text, target_language)
+
+def translate_text_live(text, target_language):
+    """Translate text with an LLM request, bypassing the precompiled catalog."""
+    from app.llm_client import complete
     prompt = f"Translate the following text to {target_language.title()}:\n\n{text}"
     try:
-        response = client.chat.completions.create(
-            model=MODEL_NAME,
+        return complete(
             messages=[{"role": "user", "content": prompt}],
             temperature=0.2,
-            max_tokens=300
+            max_tokens=300,
+            cache="translate_text",
+            name="translate_text"
         )
-        return response.choices[0].message.content.strip()
     except Exception:
         return text
 
+def stem_word(word):
+    """Light suffix stripping so "tables"/"table" and "formatting"/"format" compare equal."""
+    if len(word) > 5 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if (len(word) > 5 and word.endswith("ing")) or (len(word) > 4 and word.endswith("ed")):
+        word = word[:-3] if word.endswith("ing") else word[:-2]
+        # "formatting" -> "formatt" -> "format"
+        if len(word) > 3 and word[-1] == word[-2] and word[-1] not in "aeiouls":
+            word = word[:-1]
+        return word
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
 def get_lang_code(language):
-    lang_map = {
-        'english': ('en', 'en-US'),
-        'hindi': ('hi', 'hi-IN'),
-        'spanish': ('es', 'es-ES'),
-        'french': ('fr', 'fr-FR'),
-    }
-    return lang_map.get(language.lower(), ('en', 'en-US'))
+    return LANGUAGE_CODES.get(language.lower(), ('en', 'en-US'))
@@ -0,0 +1,244 @@
+# app/vad.py
+
+import glob
+import json
+import math
+import os
+import sys
+import time
+import wave
+import numpy as np
+from app.config import VAD_AGGRESSIVENESS
+
+# aggressiveness -> (speech margin over the noise floor in dB, base end-of-utterance silence ms, max silence ms).
+# Higher levels need louder speech and end utterances sooner. Answers include thinking pauses,
+# so even the most aggressive level waits longer than SpeechRecognition's 0.8 s pause_threshold.
+AGGRESSIVENESS = {
+    0: (5.0, 2000, 4000),
+    1: (8.0, 1500, 3000),
+    2: (11.0, 1100, 2200),
+    3: (14.0, 800, 1500),
+}
+FRAME_MS = 20
+ONSET_MS = 60        # consecutive speech needed to start an utterance (ignores clicks)
+RESUME_MS = 40       # consecutive speech needed to count a pause as over
+HANGOVER_MS = 200    # shorter dips between words are not pauses
+FRICATIVE_ZCR = 0.25  # unvoiced consonants are quiet but cross zero often
+
+
+def frame_features(samples: np.ndarray, frame_len: int):
+    """Short-time energy (dB) and zero-crossing rate for each complete frame of samples."""
+    n = len(samples) // frame_len
+    frames = samples[:n * frame_len].reshape(n, frame_len)
+    energy = 10 * np.log10(np.mean(frames * frames, axis=1) + 1e-10)
+    signs = np.signbit(frames)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (frame_len - 1)
+    return energy, zcr
+
+
+class VADEndpointer:
+    """
+    Frame-level voice activity detection over a stream of 16-bit PCM chunks.
+    A frame is speech if its energy clears the adaptive noise floor by the aggressiveness
+    margin, or clears half the margin with a fricative-like zero-crossing rate. Onset and
+    resume need a run of speech frames and short dips are bridged (hangover), so clicks and
+    gaps between words do not flip the state. The utterance ends once the silence after
+    speech exceeds a threshold that grows with the longest pauses the speaker has already
+    made (1.5x the 90th percentile), between the level's base and max.
+    """
+
+    def __init__(self, sample_rate, sample_width=2, aggressiveness=VAD_AGGRESSIVENESS, noise_rms=None):
+        if sample_width != 2:
+            raise ValueError("VADEndpointer expects 16-bit audio")
+        self.margin_db, self.base_silence_ms, self.max_silence_ms = AGGRESSIVENESS[int(aggressiveness)]
+        self.frame_len = int(sample_rate * FRAME_MS / 1000)
+        self.noise_db = 20 * math.log10(noise_rms) if noise_rms else None
+        self._pending = np.empty(0, dtype=np.float32)
+        self._run = 0
+        self.started = False
+        self.ended = False
+        self.silence_ms = 0
+        self.pauses = []
+        self.frames = 0
+        self.end_frame = None
+
+    def required_silence_ms(self) -> float:
+        if not self.pauses:
+            return self.base_silence_ms
+        return min(self.max_silence_ms, max(self.base_silence_ms, 1.5 * np.percentile(self.pauses, 90)))
+
+    def _is_speech(self, energy, zcr) -> bool:
+        if self.noise_db is None:
+            self.noise_db = energy
+        above = energy - self.noise_db
+        speech = above > self.margin_db or (above > self.margin_db / 2 and zcr > FRICATIVE_ZCR)
+        if not speech:
+            # Track the floor: quickly downwards, slowly upwards
+            rate = 0.3 if energy < self.noise_db else 0.02
+            self.noise_db += rate * (energy - self.noise_db)
+        return speech
+
+    def feed(self, data: bytes) -> bool:
+        """Process a chunk of audio; returns True once the utterance has ended."""
+        if self.ended:
+            return True
+        samples = np.frombuffer(data, dtype="<i2").astype(np.float32)
+        samples = np.concatenate((self._pending, samples))
+        energies, zcrs = frame_features(samples, self.frame_len)
+        self._pending = samples[len(energies) * self.frame_len:]
+        for energy, zcr in zip(energies, zcrs):
+            self.frames += 1
+            self._run = self._run + 1 if self._is_speech(energy, zcr) else 0
+            if not self.started:
+                self.started = self._run * FRAME_MS >= ONSET_MS
+                continue
+            if self._run * FRAME_MS >= RESUME_MS:
+                if self.silence_ms > HANGOVER_MS:
+                    self.pauses.append(self.silence_ms)
+                self.silence_ms = 0
+            elif self._run == 0:
+                self.silence_ms += FRAME_MS
+                if self.silence_ms >= self.required_silence_ms():
+                    self.ended = True
+                    self.end_frame = self.frames
+                    return True
+        return False
+
+
+def read_wav(path):
+    with wave.open(path, "rb") as w:
+        if w.getsampwidth() != 2:
+            raise ValueError(f"{path}: only 16-bit WAV files are supported")
+        data = w.readframes(w.getnframes())
+        if w.getnchannels() > 1:
+            data = np.frombuffer(data, dtype="<i2")[::w.getnchannels()].tobytes()
+        return data, w.getframerate()
+
+
+def endpoint_file(path, aggressiveness=VAD_AGGRESSIVENESS, chunk=1024):
+    """Run the endpointer over a WAV file as if it were streamed; returns the end time in seconds or None."""
+    data, rate = read_wav(path)
+    vad = VADEndpointer(rate, aggressiveness=aggressiveness)
+    for start in range(0, len(data), chunk * 2):
+        if vad.feed(data[start:start + chunk * 2]):
+            return vad.end_frame * FRAME_MS / 1000
+    return None
+
+
+def fixed_threshold_end(path, pause_threshold=0.8, chunk=1024):
+    """Baseline: Recognizer.listen-style endpoint (RMS over a calibrated threshold, fixed pause)."""
+    data, rate = read_wav(path)
+    samples = np.frombuffer(data, dtype="<i2").astype(np.float32)
+    n = len(samples) // chunk
+    rms = np.sqrt(np.mean(samples[:n * chunk].reshape(n, chunk) ** 2, axis=1))
+    spb = chunk / rate
+    threshold = max(300.0, 1.5 * rms[:max(1, int(0.5 / spb))].mean())
+    started, silent = False, 0.0
+    for i, level in enumerate(rms):
+        if level > threshold:
+            started, silent = True, 0.0
+        elif started:
+            silent += spb
+            if silent >= pause_threshold:
+                return (i + 1) * spb
+    return None
+
+
+def make_fixtures(directory, count=12, rate=16000, seed=7):
+    """Write synthetic answer recordings (voiced syllables, fricatives, thinking pauses, noise) plus ground truth."""
+    rng = np.random.default_rng(seed)
+    os.makedirs(directory, exist_ok=True)
+    for index in range(count):
+        snr_db = [20, 12, 6][index % 3]
+        parts, t, pauses = [], 0.0, []
+
+        def silence(seconds):
+            parts.append(np.zeros(int(seconds * rate), dtype=np.float32))
+
+        lead = rng.uniform(0.5, 1.0)
+        silence(lead)
+        speech_start = lead
+        t = lead
+        words = rng.integers(15, 40)
+        for w in range(words):
+            for _ in range(rng.integers(1, 4)):
+                length = rng.uniform(0.12, 0.25)
+                n = int(length * rate)
+                x = np.arange(n) / rate
+                if rng.random() < 0.2:
+                    noise = rng.standard_normal(n)
+                    tone = np.diff(noise, prepend=0) * 0.35
+                else:
+                    f0 = rng.uniform(100, 220)
+                    tone = sum(np.sin(2 * np.pi * f0 * h * x) / h for h in range(1, 6))
+                parts.append((tone * np.hanning(n) * rng.uniform(0.5, 1.0)).astype(np.float32))
+                t += length
+                gap = rng.uniform(0.02, 0.06)
+                silence(gap)
+                t += gap
+            if w < words - 1:
+                gap = rng.uniform(0.4, 1.4) if rng.random() < 0.12 else rng.uniform(0.08, 0.2)
+                if gap >= 0.4:
+                    pauses.append(gap)
+                silence(gap)
+                t += gap
+        speech_end = t
+        silence(4.0)
+        signal = np.concatenate(parts)
+        signal *= 8000 / (np.abs(signal).max() + 1e-9)
+        speech_power = np.mean(signal[int(speech_start * rate):int(speech_end * rate)] ** 2)
+        noise = rng.standard_normal(len(signal)) * math.sqrt(speech_power / 10 ** (snr_db / 10))
+        pcm = np.clip(signal + noise, -32768, 32767).astype("<i2")
+        name = os.path.join(directory, f"answer_{index:02d}_snr{snr_db}")
+        with wave.open(name + ".wav", "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(rate)
+            w.writeframes(pcm.tobytes())
+        with open(name + ".json", "w", encoding="utf-8") as f:
+            json.dump({"speech_start": speech_start, "speech_end": speech_end, "pauses": pauses}, f)
+    return directory
+
+
+def run_bench(paths):
+    """Endpoint each WAV (with a .json ground-truth sidecar) and report cut-offs and end latency."""
+    rows = []
+    for path in paths:
+        truth_path = os.path.splitext(path)[0] + ".json"
+        if not os.path.exists(truth_path):
+            print(f"Skipping {path}: no {os.path.basename(truth_path)}")
+            continue
+        with open(truth_path, encoding="utf-8") as f:
+            truth = json.load(f)
+        rows.append((path, truth["speech_end"]))
+    if not rows:
+        print("No fixtures with ground truth found")
+        return
+    audio_seconds = sum(len(read_wav(p)[0]) / 2 / read_wav(p)[1] for p, _ in rows)
+    methods = [("fixed 0.8s pause", fixed_threshold_end)]
+    methods += [(f"vad aggressiveness {a}", lambda p, a=a: endpoint_file(p, a)) for a in sorted(AGGRESSIVENESS)]
+    print(f"{len(rows)} recordings, {audio_seconds:.1f}s of audio")
+    print(f"{'method':<24}{'cut off':>9}{'missed':>8}{'median end delay':>18}{'x realtime':>12}")
+    for label, method in methods:
+        started = time.perf_counter()
+        ends = [(method(path), speech_end) for path, speech_end in rows]
+        elapsed = time.perf_counter() - started
+        cut = sum(1 for end, truth in ends if end is not None and end < truth)
+        missed = sum(1 for end, _ in ends if end is None)
+        delays = [end - truth for end, truth in ends if end is not None and end >= truth]
+        delay = f"{np.median(delays) * 1000:.0f} ms" if delays else "-"
+        print(f"{label:<24}{cut:>9}{missed:>8}{delay:>18}{audio_seconds / elapsed:>11.0f}x")
+
+
+if __name__ == "__main__":
+    usage = "Usage: python -m app.vad fixtures DIR | bench DIR_OR_WAV..."
+    if len(sys.argv) < 3 or sys.argv[1] not in ("fixtures", "bench"):
+        print(usage)
+        sys.exit(1)
+    if sys.argv[1] == "fixtures":
+        print(f"Wrote fixtures to {make_fixtures(sys.argv[2])}")
+    else:
+        wavs = []
+        for arg in sys.argv[2:]:
+            wavs += sorted(glob.glob(os.path.join(arg, "*.wav"))) if os.path.isdir(arg) else [arg]
+        run_bench(wavs)
@@ -1,83 +1,61 @@
 # app/voice_utils.py
 
-import pyttsx3
 import speech_recognition as sr
 import threading
-from app.config import VOICE_RATE, VOICE_VOLUME, VOICE_PITCH
-from gtts import gTTS
-import tempfile
+from app.tts_worker import get_tts_worker
+from app.capture_session import get_capture_session
+from app.recognition import recognize
+from app.config import SPEECH_ASYNC, LISTEN_ENDPOINTING
+from app.audio_cache import get_audio
+from app.audio_player import get_audio_player
+from app.phrase_intents import get_matcher
 from playsound import playsound
-from app.utils import print_with_typing
+from app.utils import print_with_typing, log_event
 try:
     from colorama import Fore, Style
 except ImportError:
     Fore = Style = None
 
 
-def speak(text: str, language='en'):
-    """Speak out the given text using pyttsx3 for English, gTTS for other languages."""
+def speak(text: str, language='en', wait=None):
+    """
+    Speak out the given text using pyttsx3 for English, gTTS for other languages (via the shared TTS worker).
+    With SPEECH_ASYNC the utterance is queued and this returns at once; pass wait=True to block until it is spoken.
+    """
     print(f"\U0001F4E3 AI says: {text}")
-    if language.startswith('en'):
-        engine = pyttsx3.init(driverName='sapi5')
-        voices = engine.getProperty('voices')
-        # Prefer Zira (female), then David (male), else first available
-        selected_voice = None
-        for v in voices:
-            if 'zira' in v.name.lower():
-                selected_voice = v.id
-                break
-        if not selected_voice:
-            for v in voices:
-                if 'david' in v.name.lower():
-                    selected_voice = v.id
-                    break
-        if not selected_voice and voices:
-            selected_voice = voices[0].id
-        if selected_voice:
-            engine.setProperty('voice', selected_voice)
-        engine.setProperty('rate', VOICE_RATE)
-        engine.setProperty('volume', VOICE_VOLUME)
-        try:
-            engine.setProperty('pitch', VOICE_PITCH)
-        except Exception:
-            pass
-        engine.say(text)
-        engine.runAndWait()
-    else:
-        speak_gtts(text, language)
+    done = get_tts_worker().submit(text, language)
+    if wait is None:
+        wait = not SPEECH_ASYNC
+    if wait:
+        done.result()
+    return done
+
+
+def wait_for_speech():
+    """Barrier: let the candidate hear everything queued before the microphone opens."""
+    get_tts_worker().wait_until_idle()
 
 def speak_gtts(text, language):
     """Speak text using gTTS for the given language code (e.g., 'hi' for Hindi). Uses pygame for playback on all platforms."""
-    import platform
     try:
         print(f"[TTS] Using gTTS with language code: {language}")
-        tts = gTTS(text=text, lang=language.split('-')[0])
-        import os
-        import pygame
-        fp = tempfile.NamedTemporaryFile(delete=False, suffix='.mp3')
-        tts.save(fp.name)
-        fp.close()
-        pygame.mixer.init()
-        pygame.mixer.music.load(fp.name)
-        pygame.mixer.music.play()
-        while pygame.mixer.music.get_busy():
-            continue
-        pygame.mixer.quit()
-        os.remove(fp.name)
+        # Cached audio plays at once; only new phrases are synthesized (see app/audio_cache.py)
+        get_audio_player().play(get_audio(text, language))
     except Exception as e:
         print(f"[TTS error: {e}] (text: {text}, lang: {language})")
         print("[TTS] Could not speak the phrase. Please check your internet connection and gTTS installation.")
 
-def listen(timeout=8, phrase_time_limit=15, language='en-US', max_retries=3, is_followup=False):
+def listen(timeout=8, phrase_time_limit=15, language='en-US', max_retries=3, is_followup=False, endpointing=None, on_partial=None):
     """
     Capture voice input with improved error handling and retries.
     
     For follow-up questions, uses a shorter timeout to move on more quickly if no response.
+    endpointing is "energy", "vad" or "chunked" (default: LISTEN_ENDPOINTING), see CaptureSession.listen.
+    With "chunked", on_partial(text) receives the transcript as it grows while the candidate speaks.
     """
-    recognizer = sr.Recognizer()
-    # Increase recognition sensitivity
-    recognizer.energy_threshold = 300  # Default is 300, lower is more sensitive
-    recognizer.dynamic_energy_threshold = True
+    # One open, calibrated microphone stream shared by every listen call (see app/capture_session.py)
+    session = get_capture_session()
+    recognizer = session.recognizer
     
     # Use shorter timeout for follow-up questions
     if is_followup:
@@ -87,62 +65,60 @@ def listen(timeout=8, phrase_time_limit=15, language='en-US', max_retries=3, is_
     retries = 0
     
     while retries <= max_retries:
-        with sr.Microphone() as source:
-            print_with_typing("\U0001F3A4 Listening..." + (" (Retry)" if retries > 0 else ""),
-                            color=Fore.GREEN if Fore else None)
-            # Increase ambient noise adjustment duration
-            recognizer.adjust_for_ambient_noise(source, duration=1.0)
-            try:
-                audio = recognizer.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
-                response = recognizer.recognize_google(audio, language=language)
-                print_with_typing(f"You said: {response}", color=Fore.GREEN if Fore else None)
-                return response
-            except sr.WaitTimeoutError:
-                if retries < max_retries:
-                    error_msg = "I didn't catch that. Could you speak a bit louder or move closer to the microphone?"
-                    print_with_typing(f"❌ {error_msg}",
-                                    color=Fore.YELLOW if Fore else None)
-                    speak(error_msg)
-                    retries += 1
-                    continue
-                else:
-                    error_msg = "I didn't hear anything. Let's try typing instead:"
-                    print_with_typing(error_msg,
-                                    color=Fore.YELLOW if Fore else None)
-                    speak(error_msg)
-                    return input("Your response: ")
-            except sr.UnknownValueError:
-                if retries < max_retries:
-                    error_msg = "I'm having trouble understanding. Could you speak a bit more clearly?"
-                    print_with_typing(f"❌ {error_msg}",
-                                    color=Fore.YELLOW if Fore else None)
-                    speak(error_msg)
-                    retries += 1
-                    continue
-                else:
-                    error_msg = "I'm  having trouble understanding. Let's try typing instead:"
-                    print_with_typing(error_msg,
-                                    color=Fore.YELLOW if Fore else None)
-                    speak(error_msg)
-                    return input("Your response: ")
-            except sr.RequestError as e:
-                # Try to use a different recognition service if Google fails
-                try:
-                    error_msg = "Let me try another way to understand you..."
-                    print_with_typing(error_msg,
-                                    color=Fore.YELLOW if Fore else None)
-                    speak(error_msg)
-                    response = recognizer.recognize_sphinx(audio)
-                    print_with_typing(f"You said: {response}", color=Fore.GREEN if Fore else None)
-                    return response
-                except Exception:
-                    error_msg = "I'm having trouble with the speech recognition. Let's try typing instead:"
-                    print_with_typing(error_msg,
-                                    color=Fore.RED if Fore else None)
-                    speak(error_msg)
-                    return input("Your response: ")
+        wait_for_speech()
+        print_with_typing("\U0001F3A4 Listening..." + (" (Retry)" if retries > 0 else ""),
+                        color=Fore.GREEN if Fore else None)
+        try:
+            if (endpointing or LISTEN_ENDPOINTING) == "chunked":
+                # Transcribed window by window during capture; only the last window is left now
+                audio, response = session.listen(timeout=timeout, phrase_time_limit=phrase_time_limit,
+                                                 endpointing="chunked", language=language, on_partial=on_partial)
+                if not response:
+                    raise sr.UnknownValueError()
+            else:
+                audio = session.listen(timeout=timeout, phrase_time_limit=phrase_time_limit, endpointing=endpointing)
+                # Google and the local Sphinx engine run side by side (see app/recognition.py)
+                response, engine = recognize(recognizer, audio, language=language)
+            print_with_typing(f"You said: {response}", color=Fore.GREEN if Fore else None)
+            return response
+        except sr.WaitTimeoutError:
+            if retries < max_retries:
+                error_msg = "I didn't catch that. Could you speak a bit louder or move closer to the microphone?"
+                print_with_typing(f"❌ {error_msg}",
+                                color=Fore.YELLOW if Fore else None)
+                speak(error_msg)
+                retries += 1
+                continue
+            else:
+                error_msg = "I didn't hear anything. Let's try typing instead:"
+                print_with_typing(error_msg,
+                                color=Fore.YELLOW if Fore else None)
+                speak(error_msg)
+                return input("Your response: ")
+        except sr.UnknownValueError:
+            if retries < max_retries:
+                error_msg = "I'm having trouble understanding. Could you speak a bit more clearly?"
+                print_with_typing(f"❌ {error_msg}",
+                                color=Fore.YELLOW if Fore else None)
+                speak(error_msg)
+                retries += 1
+                continue
+            else:
+                error_msg = "I'm  having trouble understanding. Let's try typing instead:"
+                print_with_typing(error_msg,
+                                color=Fore.YELLOW if Fore else None)
+                speak(error_msg)
+                return input("Your response: ")
+        except sr.RequestError as e:
+            # Every engine, including the local one, failed
+            log_event(f"Speech recognition failed: {e}")
+            error_msg = "I'm having trouble with the speech recognition. Let's try typing instead:"
+            print_with_typing(error_msg,
+                            color=Fore.RED if Fore else None)
+            speak(error_msg)
+            return input("Your response: ")
 
-def listen_multi(end_phrases=None, max_segments=10, short_timeout=2, phrase_time_limit=40, long_silence_limit=1, language='en-US', is_followup=False):
+def listen_multi(end_phrases=None, max_segments=10, short_timeout=2, phrase_time_limit=40, long_silence_limit=1, language='en-US', is_followup=False, endpointing=None):
     """
     Keep listening and appending segments until a long silence or an end phrase is detected.
     Also handles pause/resume, repeat, and skip commands.
@@ -150,50 +126,39 @@ def listen_multi(end_phrases=None, max_segments=10, short_timeout=2, phrase_time
     
     A single silence (no speech detected) is now treated as a signal to move on.
     """
-    if end_phrases is None:
-        end_phrases = []
-    
-    # Add implicit end phrases - expanded to catch more variations
-    implicit_end_phrases = [
-        "no", "nope", "no thanks", "no thank you",
-        "that's it", "that is it", "thats it",
-        "nothing else", "nothing more", "nothing to add",
-        "that's all", "that is all", "thats all",
-        "i don't want to", "i dont want to", "don't want to", "dont want to",
-        "i don't want to share", "i dont want to share",
-        "i don't want to answer", "i dont want to answer"
-    ]
-    for phrase in implicit_end_phrases:
-        if phrase not in end_phrases:
-            end_phrases.append(phrase)
-            
+    # Commands, end-of-answer and refusal phrases all come from the shared matcher;
+    # end_phrases only adds caller-specific ones to it.
+    matcher = get_matcher(tuple(end_phrases or ()))
     segments = []
     silence_count = 0
+    # With chunked capture, stop as soon as the growing transcript ends with an end phrase.
+    on_partial = lambda text: matcher.analyze(text).finished
     
     while len(segments) < max_segments:
         # Use a shorter timeout for follow-up questions
-        part = listen(timeout=short_timeout, phrase_time_limit=phrase_time_limit, language=language, max_retries=0, is_followup=is_followup).strip().lower()
+        part = listen(timeout=short_timeout, phrase_time_limit=phrase_time_limit, language=language, max_retries=0, is_followup=is_followup, endpointing=endpointing, on_partial=on_partial).strip().lower()
+        intents = matcher.analyze(part).intents
         
         # Handle special commands
-        if part in ["pause", "hold on", "p"]:
+        if "pause" in intents:
             print_with_typing("Interview paused. Say 'resume' or press Enter when ready to continue.", 
                             color=Fore.YELLOW if Fore else None)
             speak("Interview paused. Say resume or press Enter when ready to continue.")
             while True:
                 resume = input("Press Enter or say 'resume' to continue: ").strip().lower()
-                if resume == "" or resume == "resume" or resume == "r":
+                if resume == "" or "resume" in matcher.analyze(resume).intents:
                     print_with_typing("Resuming interview...", color=Fore.GREEN if Fore else None)
                     speak("Resuming interview.")
                     break
             continue
             
-        if part in ["repeat", "say again", "r"]:
+        if "repeat" in intents:
             return "", [], "repeat"
             
-        if part in ["skip", "next question", "s"]:
+        if "skip" in intents:
             return "", [], "skip"
             
-        if part in ["help", "h"]:
+        if "help" in intents:
             help_msg = """
             Voice Commands Available:
             • "pause" or "p" - Pause the interview
@@ -208,7 +173,7 @@ def listen_multi(end_phrases=None, max_segments=10, short_timeout=2, phrase_time
         
         if part:
             # Check if this is a negative response before adding to segments
-            if any(phrase in part.lower() for phrase in end_phrases):
+            if intents & {"end", "negative"}:
                 print_with_typing("Understood. Moving on...",
                                 color=Fore.YELLOW if Fore else None)
                 # Still add the response to segments before breaking
@@ -1,6 +1,6 @@
 import streamlit as st
 import streamlit.components.v1 as components
-from app.llm_questions import get_interview_questions
+from app.question_pool import start_question_pool, take_questions
 from app.evaluator import evaluate_answer
 from app.report_generator import generate_pdf_report
 from app.config import INTERVIEW_QUESTIONS_COUNT
@@ -51,12 +51,13 @@ window.addEventListener('message', (event) => {
 """, unsafe_allow_html=True)
 
 st.set_page_config(page_title="Excel Mock Interviewer", layout="centered")
+start_question_pool()
 st.title("Excel Mock Interviewer (with Voice)")
 
 if "step" not in st.session_state:
     st.session_state.step = 0
 if "questions" not in st.session_state:
-    st.session_state.questions = get_interview_questions(INTERVIEW_QUESTIONS_COUNT)
+    st.session_state.questions = take_questions(INTERVIEW_QUESTIONS_COUNT)
 if "answers" not in st.session_state:
     st.session_state.answers = [""] * INTERVIEW_QUESTIONS_COUNT
 if "feedback" not in st.session_state:
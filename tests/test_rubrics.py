@@ -0,0 +1,84 @@
+# tests/test_rubrics.py
+
+import os
+import unittest
+
+# app.config needs an API key unless it points at a local stand-in; these tests make no calls
+os.environ.setdefault("OPENAI_BASE_URL", "http://127.0.0.1:8808/v1")
+
+from app.config import RUBRIC_CONFIDENCE_THRESHOLD
+from app.rubrics import _COMPILED, score_answer, local_turn_analysis, UNCERTAIN_MAX_SCORE
+
+FORMULA_Q = "What is the difference between a formula and a function in Excel?"
+VLOOKUP_Q = "How do you use the VLOOKUP function in Excel?"
+
+
+class UncertainAnswerTests(unittest.TestCase):
+    def test_long_uncertain_answer_is_capped_and_left_to_llm(self):
+        answer = ("I do not know the difference between a formula and a function, "
+                  "maybe sum or combine something in a cell and then it shows the result")
+        result = score_answer(FORMULA_Q, answer)
+        self.assertLessEqual(result["score"], UNCERTAIN_MAX_SCORE)
+        self.assertLess(result["confidence"], RUBRIC_CONFIDENCE_THRESHOLD)
+        self.assertIsNone(local_turn_analysis(FORMULA_Q, answer))
+
+    def test_keywords_next_to_no_idea_do_not_score(self):
+        answer = "i have no idea how vlookup works, something with a table range, true or false and the column number"
+        result = score_answer(VLOOKUP_Q, answer)
+        self.assertLessEqual(result["score"], UNCERTAIN_MAX_SCORE)
+        self.assertIsNone(local_turn_analysis(VLOOKUP_Q, answer))
+
+    def test_short_i_dont_know_goes_to_llm(self):
+        self.assertIsNone(local_turn_analysis(VLOOKUP_Q, "I don't know"))
+
+    def test_empty_answer_scores_zero_locally(self):
+        result = score_answer(VLOOKUP_Q, "")
+        self.assertEqual(result["score"], 0)
+        self.assertGreaterEqual(result["confidence"], RUBRIC_CONFIDENCE_THRESHOLD)
+
+
+class MatchingTests(unittest.TestCase):
+    def test_repeating_the_question_covers_nothing(self):
+        answer = "A formula and a function in Excel are different: a formula is a formula and a function is a function"
+        self.assertEqual(score_answer(FORMULA_Q, answer)["covered"], [])
+
+    def test_generic_words_alone_cover_nothing(self):
+        answer = "You pick a range or a table, then true or false, and sum or combine the values to get the exact data"
+        self.assertEqual(score_answer(VLOOKUP_Q, answer)["covered"], [])
+
+    def test_complete_answer_scores_high_locally(self):
+        answer = ("VLOOKUP takes the lookup value, searches the first column of the table array, returns the "
+                  "value from the column index number you give, and the last argument picks exact match or "
+                  "approximate match")
+        result = score_answer(VLOOKUP_Q, answer)
+        self.assertEqual(result["missing"], [])
+        self.assertGreaterEqual(result["score"], 9)
+        self.assertGreaterEqual(result["confidence"], RUBRIC_CONFIDENCE_THRESHOLD)
+
+    def test_paraphrase_matching_no_terms_goes_to_llm(self):
+        answer = ("A function is a named operation Excel provides, and a formula is any calculation "
+                  "you type into a cell")
+        self.assertLess(score_answer(FORMULA_Q, answer)["confidence"], RUBRIC_CONFIDENCE_THRESHOLD)
+        self.assertIsNone(local_turn_analysis(FORMULA_Q, answer))
+
+    def test_every_concept_keeps_usable_terms(self):
+        for question, concepts in _COMPILED.items():
+            for label, phrases in concepts:
+                self.assertTrue(phrases, f"{question}: {label}")
+
+
+class WordingTests(unittest.TestCase):
+    def test_followup_uses_concept_label(self):
+        answer = ("VLOOKUP takes the lookup value and searches the first column of the data range "
+                  "and returns from the column index you give")
+        analysis = local_turn_analysis(VLOOKUP_Q, answer)
+        self.assertEqual(analysis["followup_question"], "Could you also explain exact versus approximate match?")
+
+    def test_feedback_names_concepts_by_label(self):
+        result = score_answer(FORMULA_Q, "It starts with an equal sign, like =A1+B1, and is written by the user in the cell")
+        self.assertIn("what a formula is", result["feedback"])
+        self.assertIn("what a function is", result["feedback"])
+
+
+if __name__ == "__main__":
+    unittest.main()